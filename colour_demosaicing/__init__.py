@@ -7,25 +7,29 @@ CFA (Colour Filter Array) Demosaicing algorithms for *Python*.
 Subpackages
 -----------
 -   bayer: *Bayer* CFA mosaicing and demosaicing computations.
+
+Notes
+-----
+-   The subpackages and the objects they define are imported lazily, i.e., on
+    first access, so that importing the package does not import
+    :mod:`colour` and :mod:`numpy`.
 """
 
 from __future__ import annotations
 
-import contextlib
+import importlib
 import os
-import subprocess
-
-import colour
-import numpy as np
-
-from .bayer import (
-    demosaicing_CFA_Bayer_bilinear,
-    demosaicing_CFA_Bayer_DDFAPD,
-    demosaicing_CFA_Bayer_Malvar2004,
-    demosaicing_CFA_Bayer_Menon2007,
-    masks_CFA_Bayer,
-    mosaicing_CFA_Bayer,
-)
+import typing
+
+if typing.TYPE_CHECKING:
+    from .bayer import (
+        demosaicing_CFA_Bayer_bilinear,
+        demosaicing_CFA_Bayer_DDFAPD,
+        demosaicing_CFA_Bayer_Malvar2004,
+        demosaicing_CFA_Bayer_Menon2007,
+        masks_CFA_Bayer,
+        mosaicing_CFA_Bayer,
+    )
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -60,23 +64,42 @@ __minor_version__ = "2"
 __change_version__ = "6"
 __version__ = ".".join((__major_version__, __minor_version__, __change_version__))
 
-try:
-    _version: str = (
-        subprocess.check_output(
-            ["git", "describe"],  # noqa: S603, S607
-            cwd=os.path.dirname(__file__),
-            stderr=subprocess.STDOUT,
-        )
-        .strip()
-        .decode("utf-8")
-    )
-except Exception:
-    _version: str = __version__
+_SUBPACKAGES: tuple = ("bayer",)
+"""Subpackages imported on first access."""
+
+_LAZY_ATTRIBUTES: dict = {
+    "demosaicing_CFA_Bayer_bilinear": ".bayer",
+    "demosaicing_CFA_Bayer_DDFAPD": ".bayer",
+    "demosaicing_CFA_Bayer_Malvar2004": ".bayer",
+    "demosaicing_CFA_Bayer_Menon2007": ".bayer",
+    "masks_CFA_Bayer": ".bayer",
+    "mosaicing_CFA_Bayer": ".bayer",
+}
+"""Attributes imported on first access and the modules defining them."""
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Import given attribute from the module defining it on first access, as
+    per *PEP 562*, and cache it in the package namespace.
+    """
+
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        error = f"module {__name__!r} has no attribute {name!r}"
+
+        raise AttributeError(error)
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
 
-colour.utilities.ANCILLARY_COLOUR_SCIENCE_PACKAGES["colour-demosaicing"] = _version  # pyright: ignore
 
-del _version
+def __dir__() -> list[str]:
+    """Return the attributes of the package, including the lazy ones."""
 
-# TODO: Remove legacy printing support when deemed appropriate.
-with contextlib.suppress(TypeError):
-    np.set_printoptions(legacy="1.13")
+    return sorted({*globals(), *_SUBPACKAGES, *__all__})
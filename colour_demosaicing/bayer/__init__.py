@@ -1,13 +1,98 @@
-from .masks import masks_CFA_Bayer
-from .mosaicing import mosaicing_CFA_Bayer
-from .demosaicing import *  # noqa: F403
+import importlib
+import typing
+
 from . import demosaicing
 
+if typing.TYPE_CHECKING:
+    from .masks import CacheLRU, CACHE_MASKS_CFA_BAYER, masks_CFA_Bayer
+    from .phases import (
+        offsets_CFA_Bayer,
+        shift_pattern_CFA_Bayer,
+        phases_CFA_Bayer,
+        interleave_phases_CFA_Bayer,
+    )
+    from .mosaicing import mosaicing_CFA_Bayer
+    from .demosaicing import *  # noqa: F403
+
 __all__ = []
 __all__ += [
+    "CacheLRU",
+    "CACHE_MASKS_CFA_BAYER",
     "masks_CFA_Bayer",
 ]
+__all__ += [
+    "offsets_CFA_Bayer",
+    "shift_pattern_CFA_Bayer",
+    "phases_CFA_Bayer",
+    "interleave_phases_CFA_Bayer",
+]
 __all__ += [
     "mosaicing_CFA_Bayer",
 ]
 __all__ += demosaicing.__all__
+
+_SUBMODULES: tuple = ("masks", "mosaicing", "phases")
+"""Submodules imported on first access."""
+
+_LAZY_ATTRIBUTES: dict = {
+    **dict.fromkeys(["CacheLRU", "CACHE_MASKS_CFA_BAYER", "masks_CFA_Bayer"], ".masks"),
+    **dict.fromkeys(
+        [
+            "offsets_CFA_Bayer",
+            "shift_pattern_CFA_Bayer",
+            "phases_CFA_Bayer",
+            "interleave_phases_CFA_Bayer",
+        ],
+        ".phases",
+    ),
+    **dict.fromkeys(["mosaicing_CFA_Bayer"], ".mosaicing"),
+    **dict.fromkeys(demosaicing.__all__, ".demosaicing"),
+}
+"""Attributes imported on first access and the modules defining them."""
+
+
+def _register_version() -> None:
+    """
+    Register the version of the package with the ancillary *Colour* packages
+    once :mod:`colour` is imported by the modules of the subpackage.
+    """
+
+    import colour.utilities  # noqa: PLC0415
+
+    from colour_demosaicing import __version__  # noqa: PLC0415
+
+    colour.utilities.ANCILLARY_COLOUR_SCIENCE_PACKAGES["colour-demosaicing"] = (  # pyright: ignore
+        __version__
+    )
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Import given attribute from the module defining it on first access, as
+    per *PEP 562*, and cache it in the subpackage namespace.
+    """
+
+    if name in _SUBMODULES:
+        submodule = importlib.import_module(f".{name}", __name__)
+        _register_version()
+
+        return submodule
+
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        error = f"module {__name__!r} has no attribute {name!r}"
+
+        raise AttributeError(error)
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    _register_version()
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the attributes of the subpackage, including the lazy ones."""
+
+    return sorted({*globals(), *_SUBMODULES, *__all__})
@@ -1,11 +1,46 @@
-from .bilinear import demosaicing_CFA_Bayer_bilinear
-from .malvar2004 import demosaicing_CFA_Bayer_Malvar2004
-from .menon2007 import (
-    demosaicing_CFA_Bayer_DDFAPD,
-    demosaicing_CFA_Bayer_Menon2007,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .workspace import Workspace
+    from .backends import (
+        BACKENDS_DEMOSAICING_CFA_BAYER,
+        get_backend_demosaicing_CFA_Bayer,
+        set_backend_demosaicing_CFA_Bayer,
+        backend_demosaicing_CFA_Bayer,
+        function_backend_demosaicing_CFA_Bayer,
+    )
+    from .bilinear import demosaicing_CFA_Bayer_bilinear
+    from .malvar2004 import demosaicing_CFA_Bayer_Malvar2004
+    from .menon2007 import (
+        demosaicing_CFA_Bayer_DDFAPD,
+        demosaicing_CFA_Bayer_Menon2007,
+    )
+    from .plan import DEMOSAICING_CFA_BAYER_METHODS, DemosaicingPlan
+    from .batch import DemosaicingBatchResult, demosaicing_CFA_Bayer_batch
+    from .memmap import demosaicing_CFA_Bayer_memmap
+    from .pyramid import demosaicing_CFA_Bayer_pyramid
+    from .scaling import demosaicing_CFA_Bayer_scaled
+    from .stream import DemosaicingStream, demosaicing_CFA_Bayer_stream
+    from .tiling import (
+        HALOS_DEMOSAICING_CFA_BAYER,
+        demosaicing_CFA_Bayer_roi,
+        demosaicing_CFA_Bayer_tiled,
+        halo_demosaicing_CFA_Bayer,
+        tiles_CFA_Bayer,
+    )
 
 __all__ = []
+__all__ += [
+    "Workspace",
+]
+__all__ += [
+    "BACKENDS_DEMOSAICING_CFA_BAYER",
+    "get_backend_demosaicing_CFA_Bayer",
+    "set_backend_demosaicing_CFA_Bayer",
+    "backend_demosaicing_CFA_Bayer",
+    "function_backend_demosaicing_CFA_Bayer",
+]
 __all__ += [
     "demosaicing_CFA_Bayer_bilinear",
 ]
@@ -16,3 +51,114 @@ __all__ += [
     "demosaicing_CFA_Bayer_DDFAPD",
     "demosaicing_CFA_Bayer_Menon2007",
 ]
+__all__ += [
+    "DEMOSAICING_CFA_BAYER_METHODS",
+    "DemosaicingPlan",
+]
+__all__ += [
+    "DemosaicingBatchResult",
+    "demosaicing_CFA_Bayer_batch",
+]
+__all__ += [
+    "demosaicing_CFA_Bayer_memmap",
+]
+__all__ += [
+    "demosaicing_CFA_Bayer_pyramid",
+]
+__all__ += [
+    "demosaicing_CFA_Bayer_scaled",
+]
+__all__ += [
+    "DemosaicingStream",
+    "demosaicing_CFA_Bayer_stream",
+]
+__all__ += [
+    "HALOS_DEMOSAICING_CFA_BAYER",
+    "demosaicing_CFA_Bayer_roi",
+    "demosaicing_CFA_Bayer_tiled",
+    "halo_demosaicing_CFA_Bayer",
+    "tiles_CFA_Bayer",
+]
+
+_LAZY_ATTRIBUTES: dict = {
+    **dict.fromkeys(["Workspace"], ".workspace"),
+    **dict.fromkeys(
+        [
+            "BACKENDS_DEMOSAICING_CFA_BAYER",
+            "get_backend_demosaicing_CFA_Bayer",
+            "set_backend_demosaicing_CFA_Bayer",
+            "backend_demosaicing_CFA_Bayer",
+            "function_backend_demosaicing_CFA_Bayer",
+        ],
+        ".backends",
+    ),
+    **dict.fromkeys(["demosaicing_CFA_Bayer_bilinear"], ".bilinear"),
+    **dict.fromkeys(["demosaicing_CFA_Bayer_Malvar2004"], ".malvar2004"),
+    **dict.fromkeys(
+        ["demosaicing_CFA_Bayer_DDFAPD", "demosaicing_CFA_Bayer_Menon2007"],
+        ".menon2007",
+    ),
+    **dict.fromkeys(["DEMOSAICING_CFA_BAYER_METHODS", "DemosaicingPlan"], ".plan"),
+    **dict.fromkeys(
+        ["DemosaicingBatchResult", "demosaicing_CFA_Bayer_batch"], ".batch"
+    ),
+    **dict.fromkeys(["demosaicing_CFA_Bayer_memmap"], ".memmap"),
+    **dict.fromkeys(["demosaicing_CFA_Bayer_pyramid"], ".pyramid"),
+    **dict.fromkeys(["demosaicing_CFA_Bayer_scaled"], ".scaling"),
+    **dict.fromkeys(["DemosaicingStream", "demosaicing_CFA_Bayer_stream"], ".stream"),
+    **dict.fromkeys(
+        [
+            "HALOS_DEMOSAICING_CFA_BAYER",
+            "demosaicing_CFA_Bayer_roi",
+            "demosaicing_CFA_Bayer_tiled",
+            "halo_demosaicing_CFA_Bayer",
+            "tiles_CFA_Bayer",
+        ],
+        ".tiling",
+    ),
+}
+"""Attributes imported on first access and the modules defining them."""
+
+_SUBMODULES: tuple = (
+    "backends",
+    "batch",
+    "bilinear",
+    "common",
+    "malvar2004",
+    "memmap",
+    "menon2007",
+    "plan",
+    "pyramid",
+    "scaling",
+    "stream",
+    "tiling",
+    "workspace",
+)
+"""Submodules imported on first access."""
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Import given attribute from the module defining it on first access, as
+    per *PEP 562*, and cache it in the subpackage namespace.
+    """
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        error = f"module {__name__!r} has no attribute {name!r}"
+
+        raise AttributeError(error)
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the attributes of the subpackage, including the lazy ones."""
+
+    return sorted({*globals(), *_SUBMODULES, *__all__})
@@ -0,0 +1,208 @@
+"""
+Bayer CFA Demosaicing Backends
+==============================
+
+Define the registry of the compute backends of the *Bayer* CFA (Colour Filter
+Array) demosaicing definitions and the objects selecting the backend in use.
+
+The *SciPy* backend, i.e., the :mod:`scipy.ndimage` based definitions of the
+:mod:`colour_demosaicing.bayer.demosaicing` sub-package, is the reference
+backend, the other backends are modules defining the same demosaicing
+definitions, imported on first use.
+
+-   :attr:`colour_demosaicing.bayer.BACKENDS_DEMOSAICING_CFA_BAYER`
+-   :func:`colour_demosaicing.bayer.get_backend_demosaicing_CFA_Bayer`
+-   :func:`colour_demosaicing.bayer.set_backend_demosaicing_CFA_Bayer`
+-   :class:`colour_demosaicing.bayer.backend_demosaicing_CFA_Bayer`
+-   :func:`colour_demosaicing.bayer.function_backend_demosaicing_CFA_Bayer`
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+
+from colour.hints import Any, Callable, Literal
+from colour.utilities import CanonicalMapping, validate_method
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "BACKENDS_DEMOSAICING_CFA_BAYER",
+    "get_backend_demosaicing_CFA_Bayer",
+    "set_backend_demosaicing_CFA_Bayer",
+    "backend_demosaicing_CFA_Bayer",
+    "function_backend_demosaicing_CFA_Bayer",
+]
+
+BACKENDS_DEMOSAICING_CFA_BAYER: CanonicalMapping = CanonicalMapping(
+    {
+        "SciPy": "colour_demosaicing.bayer.demosaicing",
+        "Numba": "colour_demosaicing.bayer.demosaicing.backends.numba",
+        "PyTorch": "colour_demosaicing.bayer.demosaicing.backends.torch",
+    }
+)
+BACKENDS_DEMOSAICING_CFA_BAYER.__doc__ = """
+Supported compute backends of the *Bayer* CFA demosaicing definitions and the
+modules defining them.
+
+The modules define the demosaicing definitions with the names of the
+reference ones, e.g., ``demosaicing_CFA_Bayer_bilinear``.
+
+-   *SciPy*: Reference backend, based on :mod:`scipy.ndimage` convolutions.
+-   *Numba*: *JIT* compiled fused loops over the pixels, requires
+    :mod:`numba`.
+-   *PyTorch*: Element-wise tensor operations over the *Bayer* CFA phases,
+    accepting and returning :class:`torch.Tensor` class instances, requires
+    :mod:`torch`.
+"""
+
+_BACKEND_DEMOSAICING_CFA_BAYER: str = "scipy"
+"""Compute backend in use."""
+
+
+def get_backend_demosaicing_CFA_Bayer() -> str:
+    """
+    Return the compute backend in use by the *Bayer* CFA demosaicing
+    definitions.
+
+    Returns
+    -------
+    :class:`str`
+        Compute backend in use.
+
+    Examples
+    --------
+    >>> get_backend_demosaicing_CFA_Bayer()
+    'scipy'
+    """
+
+    return _BACKEND_DEMOSAICING_CFA_BAYER
+
+
+def set_backend_demosaicing_CFA_Bayer(
+    backend: Literal["SciPy", "Numba", "PyTorch"] | str = "SciPy",
+) -> None:
+    """
+    Set the compute backend in use by the *Bayer* CFA demosaicing
+    definitions.
+
+    Parameters
+    ----------
+    backend
+        Compute backend.
+
+    Notes
+    -----
+    -   The compute backend is shared by the threads so that, e.g., the tiles
+        demosaiced by the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_tiled`
+        definition workers use it.
+
+    Examples
+    --------
+    >>> set_backend_demosaicing_CFA_Bayer("Numba")
+    >>> get_backend_demosaicing_CFA_Bayer()
+    'numba'
+    >>> set_backend_demosaicing_CFA_Bayer("SciPy")
+    """
+
+    global _BACKEND_DEMOSAICING_CFA_BAYER  # noqa: PLW0603
+
+    _BACKEND_DEMOSAICING_CFA_BAYER = validate_method(
+        backend, tuple(BACKENDS_DEMOSAICING_CFA_BAYER)
+    )
+
+
+class backend_demosaicing_CFA_Bayer:
+    """
+    Define a context manager and decorator temporarily setting the compute
+    backend in use by the *Bayer* CFA demosaicing definitions.
+
+    Parameters
+    ----------
+    backend
+        Compute backend to set.
+
+    Examples
+    --------
+    >>> with backend_demosaicing_CFA_Bayer("Numba"):
+    ...     get_backend_demosaicing_CFA_Bayer()
+    'numba'
+    >>> get_backend_demosaicing_CFA_Bayer()
+    'scipy'
+    """
+
+    def __init__(self, backend: Literal["SciPy", "Numba", "PyTorch"] | str) -> None:
+        self._backend = backend
+        self._previous_backend = get_backend_demosaicing_CFA_Bayer()
+
+    def __enter__(self) -> backend_demosaicing_CFA_Bayer:
+        """Set the compute backend upon entering the context manager."""
+
+        self._previous_backend = get_backend_demosaicing_CFA_Bayer()
+        set_backend_demosaicing_CFA_Bayer(self._backend)
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Restore the previous compute backend upon exiting the context manager."""
+
+        set_backend_demosaicing_CFA_Bayer(self._previous_backend)
+
+    def __call__(self, function: Callable) -> Callable:
+        """Call given function with the compute backend set."""
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Wrap given function."""
+
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
+
+
+def function_backend_demosaicing_CFA_Bayer(
+    name: str, backend: Literal["SciPy", "Numba", "PyTorch"] | str | None = None
+) -> Callable | None:
+    """
+    Return the demosaicing definition with given name of given compute
+    backend.
+
+    Parameters
+    ----------
+    name
+        Name of the demosaicing definition, e.g.,
+        ``demosaicing_CFA_Bayer_bilinear``.
+    backend
+        Compute backend, the compute backend in use if not given.
+
+    Returns
+    -------
+    :class:`callable` or :py:data:`None`
+        Demosaicing definition, *None* for the reference *SciPy* backend so
+        that the reference definitions proceed without indirection.
+
+    Examples
+    --------
+    >>> function_backend_demosaicing_CFA_Bayer("demosaicing_CFA_Bayer_bilinear")
+    """
+
+    backend = (
+        _BACKEND_DEMOSAICING_CFA_BAYER
+        if backend is None
+        else validate_method(backend, tuple(BACKENDS_DEMOSAICING_CFA_BAYER))
+    )
+
+    if backend == "scipy":
+        return None
+
+    return getattr(
+        importlib.import_module(BACKENDS_DEMOSAICING_CFA_BAYER[backend]), name
+    )
@@ -0,0 +1,26 @@
+"""
+Backends Tests Configuration
+============================
+
+Ignore the backends modules whose dependencies are not installed when
+collecting the doctests.
+"""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "collect_ignore",
+]
+
+collect_ignore: list = [
+    f"{module}.py" for module in ("numba", "torch") if find_spec(module) is None
+]
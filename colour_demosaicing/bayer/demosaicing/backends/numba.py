@@ -0,0 +1,894 @@
+"""
+Numba Bayer CFA Demosaicing Backend
+===================================
+
+Define the *Numba* compute backend of the *Bayer* CFA (Colour Filter Array)
+demosaicing definitions:
+
+-   :func:`colour_demosaicing.bayer.demosaicing.backends.numba.\
+demosaicing_CFA_Bayer_bilinear`
+-   :func:`colour_demosaicing.bayer.demosaicing.backends.numba.\
+demosaicing_CFA_Bayer_Malvar2004`
+-   :func:`colour_demosaicing.bayer.demosaicing.backends.numba.\
+demosaicing_CFA_Bayer_Menon2007`
+
+Each method is implemented with *JIT* compiled loops over the pixels,
+parallelised over the rows, fusing the convolutions and the selections of the
+reference *SciPy* backend: the samples are read directly from the *Bayer* CFA
+and the intermediate planes are the output planes themselves, no full size
+temporary array is allocated. The samples are accumulated in the same order
+than the reference backend and rounded wherever it writes an intermediate
+plane, the results are thus identical for both single and double precision
+*dtype*.
+
+References
+----------
+-   :cite:`Losson2010c` : Losson, O., Macaire, L., & Yang, Y. (2010).
+    Comparison of Color Demosaicing Methods. In Advances in Imaging and
+    Electron Physics (Vol. 162, pp. 173-265). doi:10.1016/S1076-5670(10)62005-8
+-   :cite:`Malvar2004a` : Malvar, H. S., He, L.-W., Cutler, R., & Way, O. M.
+    (2004). High-Quality Linear Interpolation for Demosaicing of
+    Bayer-Patterned Color Images. In International Conference of Acoustic,
+    Speech and Signal Processing (pp. 5-8). Institute of Electrical and
+    Electronics Engineers, Inc.
+    http://research.microsoft.com/apps/pubs/default.aspx?id=102068
+-   :cite:`Menon2007c` : Menon, D., Andriani, S., & Calvagno, G. (2007).
+    Demosaicing With Directional Filtering and a posteriori Decision. IEEE
+    Transactions on Image Processing, 16(1), 132-141.
+    doi:10.1109/TIP.2006.884928
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+from colour.hints import (
+    ArrayLike,
+    DTypeFloat,
+    Literal,
+    NDArrayBoolean,
+    NDArrayFloat,
+    NDArrayInt,
+    Tuple,
+    Type,
+)
+from colour.utilities import as_float_array
+from numba import njit, prange
+
+from colour_demosaicing.bayer import offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.bilinear import _H_G, _H_RB
+from colour_demosaicing.bayer.demosaicing.common import (
+    output_array,
+    shape_RGB,
+)
+from colour_demosaicing.bayer.demosaicing.malvar2004 import (
+    _GR_GB,
+    _RB_BB_BR_RR,
+    _RG_RB_BG_BR,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "demosaicing_CFA_Bayer_bilinear",
+    "demosaicing_CFA_Bayer_Malvar2004",
+    "demosaicing_CFA_Bayer_Menon2007",
+]
+
+_LOCK_KERNELS: threading.Lock = threading.Lock()
+"""
+Lock serialising the calls to the kernels: they are parallelised over the rows
+and some *Numba* threading layers, e.g., *workqueue*, cannot be used by
+concurrent threads.
+"""
+
+_K_MENON2007: NDArrayFloat = np.array(
+    [
+        [0.0, 0.0, 1.0, 0.0, 1.0],
+        [0.0, 0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 3.0, 0.0, 3.0],
+        [0.0, 0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0, 1.0],
+    ]
+)
+
+
+def _sites_CFA_Bayer(pattern: str) -> Tuple[NDArrayInt, NDArrayInt]:
+    """
+    Return the colours, i.e., 0 for red, 1 for green and 2 for blue, and the
+    phases, i.e., 0 for the red sites, 1 for the green sites on red rows, 2
+    for the green sites on blue rows and 3 for the blue sites, of the 2x2
+    sites of the *Bayer* CFA with given pattern.
+    """
+
+    colours = np.empty((2, 2), np.int64)
+    phases = np.empty((2, 2), np.int64)
+    for i, ((y, x), colour) in enumerate(zip(offsets_CFA_Bayer(pattern), (0, 1, 1, 2))):
+        colours[y, x], phases[y, x] = colour, i
+
+    return colours, phases
+
+
+def _planes(RGB: NDArrayFloat, layout: str) -> NDArrayFloat:
+    """
+    Return a view of given *RGB* colourspace array whose channels precede the
+    rows and columns.
+    """
+
+    return RGB if layout == "planar" else np.moveaxis(RGB, -1, -3)
+
+
+@njit(cache=True)
+def _reflect(i: int, n: int) -> int:
+    """
+    Return given index reflected about the edges of an axis of given length,
+    the edge samples being repeated, i.e., :func:`scipy.ndimage.convolve`
+    definition *reflect* mode.
+    """
+
+    if 0 <= i < n:
+        return i
+
+    i %= 2 * n
+
+    return i if i < n else 2 * n - 1 - i
+
+
+@njit(cache=True)
+def _mirror(i: int, n: int) -> int:
+    """
+    Return given index reflected about the edges of an axis of given length,
+    the edge samples not being repeated, i.e.,
+    :func:`scipy.ndimage.convolve1d` definition *mirror* mode.
+    """
+
+    if 0 <= i < n:
+        return i
+
+    if n == 1:
+        return 0
+
+    i %= 2 * n - 2
+
+    return i if i < n else 2 * n - 2 - i
+
+
+@njit(cache=True)
+def _indexes_reflect(n: int, size: int) -> NDArrayInt:
+    """
+    Return the reflected indexes of the taps of a kernel of given size along
+    an axis of given length.
+    """
+
+    indexes = np.empty((n, size), np.int64)
+    for i in range(n):
+        for j in range(size):
+            indexes[i, j] = _reflect(i + j - size // 2, n)
+
+    return indexes
+
+
+@njit(cache=True)
+def _round(a: NDArrayFloat, value: float) -> float:
+    """
+    Round given value to the *dtype* of given array, as the reference backend
+    does when writing its intermediate planes.
+    """
+
+    return float(a.dtype.type(value))
+
+
+def _taps(h: NDArrayFloat, dtype: Type[DTypeFloat]) -> Tuple[NDArrayInt, NDArrayFloat]:
+    """
+    Return the offsets and the weights, with given *dtype*, of the non-zero
+    taps of given flipped kernel in row-major order.
+    """
+
+    r = h.shape[0] // 2
+    i, j = np.nonzero(h)
+
+    return np.stack([i - r, j - r], -1), h[i, j].astype(dtype)
+
+
+def _taps_sites(
+    kernels: NDArrayFloat,
+    colours: NDArrayInt,
+    phases: NDArrayInt,
+    masked: bool,
+) -> Tuple[NDArrayInt, NDArrayFloat, NDArrayInt]:
+    """
+    Return the offsets, the weights and the count of the non-zero taps of
+    given flipped kernels of the phases and channels away from the borders,
+    where the colours of the samples only depend on the phase.
+    """
+
+    size = kernels.shape[-1]
+    r = size // 2
+
+    offsets = np.zeros((4, 3, size * size, 2), np.int64)
+    weights = np.zeros((4, 3, size * size))
+    counts = np.zeros((4, 3), np.int64)
+    for y, x in np.ndindex(2, 2):
+        p = phases[y, x]
+        for c, i, j in np.ndindex(3, size, size):
+            w = kernels[p, c, i, j]
+            if w == 0:
+                continue
+
+            d_y, d_x = i - r, j - r
+            if masked and colours[(y + d_y) % 2, (x + d_x) % 2] != c:
+                continue
+
+            offsets[p, c, counts[p, c]] = d_y, d_x
+            weights[p, c, counts[p, c]] = w
+            counts[p, c] += 1
+
+    return offsets, weights, counts
+
+
+@njit(parallel=True, cache=True)
+def _convolve_sites(
+    CFA: NDArrayFloat,
+    RGB: NDArrayFloat,
+    kernels: NDArrayFloat,
+    offsets: NDArrayInt,
+    weights: NDArrayFloat,
+    counts: NDArrayInt,
+    copies: NDArrayBoolean,
+    colours: NDArrayInt,
+    phases: NDArrayInt,
+    masked: bool,
+    accumulate_borders: bool,
+) -> None:
+    """
+    Convolve given *Bayer* CFA in *reflect* mode with the correlation kernels
+    of the phase of each pixel and channel, or copy its samples.
+
+    The kernels being flipped, the non-zero taps are accumulated in the same
+    order than :func:`scipy.ndimage.convolve` definition, each product and sum
+    being rounded to the *dtype* of the *Bayer* CFA, except on the outermost
+    rows and columns if ``accumulate_borders`` is set, where they are
+    accumulated in double precision. If masked, the samples of a channel are
+    only taken at its sites. Away from the borders, the precomputed non-zero
+    taps of the phases and channels are accumulated directly.
+    """
+
+    height, width = CFA.shape
+    size = kernels.shape[-1]
+    r = size // 2
+    rows, columns = _indexes_reflect(height, size), _indexes_reflect(width, size)
+    zero = CFA.dtype.type(0)
+
+    for y in prange(height):
+        for x in range(width):
+            p = phases[y % 2, x % 2]
+            interior = r <= y < height - r and r <= x < width - r
+            rounded = not accumulate_borders or (
+                0 < y < height - 1 and 0 < x < width - 1
+            )
+            for c in range(3):
+                if copies[p, c]:
+                    RGB[c, y, x] = CFA[y, x]
+                    continue
+
+                if interior:
+                    # The weights having the *dtype* of the *Bayer* CFA, the
+                    # products and sums are rounded to it.
+                    accumulator = zero
+                    for k in range(counts[p, c]):
+                        accumulator += (
+                            CFA[y + offsets[p, c, k, 0], x + offsets[p, c, k, 1]]
+                            * weights[p, c, k]
+                        )
+
+                    RGB[c, y, x] = accumulator
+                    continue
+
+                value = 0.0
+
+                for i in range(size):
+                    y_i = rows[y, i]
+                    for j in range(size):
+                        w = kernels[p, c, i, j]
+                        if w == 0:
+                            continue
+
+                        x_j = columns[x, j]
+                        if masked and colours[y_i % 2, x_j % 2] != c:
+                            continue
+
+                        if rounded:
+                            value = _round(CFA, value + _round(CFA, CFA[y_i, x_j] * w))
+                        else:
+                            value += CFA[y_i, x_j] * w
+
+                RGB[c, y, x] = value
+
+
+@njit(cache=True)
+def _green_directional(CFA: NDArrayFloat, y: int, x: int, u_y: int, u_x: int) -> float:
+    """
+    Return the green estimation at given red or blue site in given direction.
+    """
+
+    height, width = CFA.shape
+    y_0, x_0 = _mirror(y - u_y, height), _mirror(x - u_x, width)
+    y_1, x_1 = _mirror(y + u_y, height), _mirror(x + u_x, width)
+    y_2, x_2 = _mirror(y - 2 * u_y, height), _mirror(x - 2 * u_x, width)
+    y_3, x_3 = _mirror(y + 2 * u_y, height), _mirror(x + 2 * u_x, width)
+
+    return _round(
+        CFA,
+        _round(CFA, CFA[y_0, x_0] + CFA[y_1, x_1]) * 0.5
+        + _round(
+            CFA, CFA[y, x] * 0.5 + _round(CFA, CFA[y_2, x_2] + CFA[y_3, x_3]) * -0.25
+        ),
+    )
+
+
+@njit(cache=True)
+def _colour_directional(
+    C: NDArrayFloat,
+    D: NDArrayFloat,
+    K: NDArrayFloat,
+    y: int,
+    x: int,
+    u_y: int,
+    u_x: int,
+) -> float:
+    """
+    Return the estimation of given plane at given site from its neighbours in
+    given direction, i.e., their mean plus the difference between given
+    sample plane and the mean of the neighbours in given difference plane.
+    """
+
+    height, width = C.shape
+    y_0, x_0 = _mirror(y - u_y, height), _mirror(x - u_x, width)
+    y_1, x_1 = _mirror(y + u_y, height), _mirror(x + u_x, width)
+
+    return _round(
+        C,
+        _round(C, _round(C, C[y_0, x_0] + C[y_1, x_1]) * 0.5 + K[y, x])
+        - _round(C, D[y_0, x_0] + D[y_1, x_1]) * 0.5,
+    )
+
+
+@njit(cache=True)
+def _column_sites(colours: NDArrayInt, y: int) -> int:
+    """
+    Return the first column of the red or blue sites on given row, the green
+    sites being on the other columns.
+    """
+
+    return 1 if colours[y % 2, 0] == 1 else 0
+
+
+@njit(parallel=True, cache=True)
+def _demosaicing_Menon2007(
+    CFA: NDArrayFloat,
+    RGB: NDArrayFloat,
+    M: NDArrayBoolean,
+    offsets_H: NDArrayInt,
+    weights_H: NDArrayFloat,
+    offsets_V: NDArrayInt,
+    weights_V: NDArrayFloat,
+    colours: NDArrayInt,
+) -> None:
+    """
+    Demosaic given *Bayer* CFA into given planes with the DDFAPD algorithm and
+    write the best directional reconstruction into given decision map.
+
+    The planes hold the colour differences and the gradients until the green
+    plane is reconstructed: the horizontal, respectively vertical, colour
+    differences are written into the green, respectively red, plane, then the
+    vertical gradients into the blue plane and the horizontal gradients into
+    the red plane.
+    """
+
+    height, width = CFA.shape
+    R, G, B = RGB[0], RGB[1], RGB[2]
+    zero = CFA.dtype.type(0)
+
+    # Horizontal and vertical colour differences at the red and blue sites.
+    for y in prange(height):
+        for x in range(_column_sites(colours, y), width, 2):
+            G[y, x] = _round(CFA, CFA[y, x] - _green_directional(CFA, y, x, 0, 1))
+            R[y, x] = _round(CFA, CFA[y, x] - _green_directional(CFA, y, x, 1, 0))
+
+    # Vertical, then horizontal, gradients at the red and blue sites, they
+    # are null at the green sites.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        y_2 = _mirror(y + 2, height)
+        for x in range(1 - x_s, width, 2):
+            B[y, x] = 0
+        for x in range(x_s, width, 2):
+            B[y, x] = abs(_round(CFA, R[y, x] - R[y_2, x]))
+
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        for x in range(1 - x_s, width, 2):
+            R[y, x] = 0
+        for x in range(x_s, width, 2):
+            R[y, x] = abs(_round(CFA, G[y, x] - G[y, _mirror(x + 2, width)]))
+
+    # Green plane reconstructed in the best direction.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        for x in range(1 - x_s, width, 2):
+            G[y, x] = CFA[y, x]
+        for x in range(x_s, width, 2):
+            d_H, d_V = zero, zero
+            for k in range(weights_H.shape[0]):
+                y_k, x_k = y + offsets_H[k, 0], x + offsets_H[k, 1]
+                if 0 <= y_k < height and 0 <= x_k < width:
+                    d_H += R[y_k, x_k] * weights_H[k]
+            for k in range(weights_V.shape[0]):
+                y_k, x_k = y + offsets_V[k, 0], x + offsets_V[k, 1]
+                if 0 <= y_k < height and 0 <= x_k < width:
+                    d_V += B[y_k, x_k] * weights_V[k]
+
+            M[y, x] = d_V >= d_H
+            G[y, x] = (
+                _green_directional(CFA, y, x, 0, 1)
+                if M[y, x]
+                else _green_directional(CFA, y, x, 1, 0)
+            )
+
+    # Red and blue planes at the green sites: horizontally on their rows and
+    # vertically on their columns.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        h = 1 if colours[y % 2, x_s] == 0 else 0
+        C = R if h else B
+        for x in range(x_s, width, 2):
+            C[y, x] = CFA[y, x]
+        for x in range(1 - x_s, width, 2):
+            R[y, x] = _colour_directional(CFA, G, G, y, x, 1 - h, h)
+            B[y, x] = _colour_directional(CFA, G, G, y, x, h, 1 - h)
+
+    # Red (blue) plane at the blue (red) sites in the best direction.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        red = colours[y % 2, x_s] == 0
+        for x in range(x_s, width, 2):
+            h = 1 if M[y, x] else 0
+            if red:
+                B[y, x] = _colour_directional(B, R, CFA, y, x, 1 - h, h)
+            else:
+                R[y, x] = _colour_directional(R, B, CFA, y, x, 1 - h, h)
+
+
+@njit(cache=True)
+def _FIR_directional(
+    C: NDArrayFloat, D: NDArrayFloat, y: int, x: int, u_y: int, u_x: int
+) -> float:
+    """
+    Return the mean of the differences between given planes at given site and
+    its neighbours in given direction.
+    """
+
+    height, width = C.shape
+    y_0, x_0 = _mirror(y - u_y, height), _mirror(x - u_x, width)
+    y_1, x_1 = _mirror(y + u_y, height), _mirror(x + u_x, width)
+    # The weight is rounded to the *dtype* of the planes as the reference
+    # backend multiplies them by a *Python* scalar.
+    w = _round(C, 1 / 3)
+
+    return _round(
+        C,
+        _round(C, _round(C, C[y, x] - D[y, x]) * w)
+        + _round(
+            C,
+            _round(
+                C,
+                _round(C, C[y_0, x_0] - D[y_0, x_0])
+                + _round(C, C[y_1, x_1] - D[y_1, x_1]),
+            )
+            * w,
+        ),
+    )
+
+
+@njit(cache=True)
+def _difference_directional(
+    C: NDArrayFloat, G: NDArrayFloat, y: int, x: int, u_y: int, u_x: int
+) -> float:
+    """
+    Return the estimation of given plane at given site from the mean of its
+    differences with given green plane at the neighbours in given direction.
+    """
+
+    height, width = C.shape
+    y_0, x_0 = _mirror(y - u_y, height), _mirror(x - u_x, width)
+    y_1, x_1 = _mirror(y + u_y, height), _mirror(x + u_x, width)
+
+    return _round(
+        C,
+        _round(
+            C,
+            _round(C, C[y_0, x_0] - G[y_0, x_0]) + _round(C, C[y_1, x_1] - G[y_1, x_1]),
+        )
+        * 0.5
+        + G[y, x],
+    )
+
+
+@njit(parallel=True, cache=True)
+def _refining_step_Menon2007(
+    RGB: NDArrayFloat,
+    M: NDArrayBoolean,
+    colours: NDArrayInt,
+    update_R: Tuple[bool, bool],
+    update_B: Tuple[bool, bool],
+) -> None:
+    """
+    Perform in-place the refining step on given planes, the red (blue) plane
+    being updated at the green sites on the blue (red) rows, respectively
+    columns, if given updates flags are set.
+    """
+
+    height, width = RGB.shape[1:]
+    R, G, B = RGB[0], RGB[1], RGB[2]
+
+    # Updating of the green component.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        C = R if colours[y % 2, x_s] == 0 else B
+        for x in range(x_s, width, 2):
+            h = 1 if M[y, x] else 0
+            G[y, x] = _round(C, C[y, x] - _FIR_directional(C, G, y, x, 1 - h, h))
+
+    # Updating of the red and blue components in the green locations:
+    # vertically on the rows and horizontally on the columns of the other
+    # colour.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        h = 1 if colours[y % 2, x_s] == 0 else 0
+        for x in range(1 - x_s, width, 2):
+            if update_R[h]:
+                R[y, x] = _difference_directional(R, G, y, x, 1 - h, h)
+            if update_B[1 - h]:
+                B[y, x] = _difference_directional(B, G, y, x, h, 1 - h)
+
+    # Updating of the red (blue) component in the blue (red) locations.
+    for y in prange(height):
+        x_s = _column_sites(colours, y)
+        red = colours[y % 2, x_s] == 0
+        for x in range(x_s, width, 2):
+            h = 1 if M[y, x] else 0
+            F = _FIR_directional(R, B, y, x, 1 - h, h)
+            if red:
+                B[y, x] = _round(B, R[y, x] - F)
+            else:
+                R[y, x] = _round(R, B[y, x] + F)
+
+
+def _demosaicing_convolve_sites(
+    CFA: ArrayLike,
+    pattern: str,
+    kernels: NDArrayFloat,
+    copies: NDArrayBoolean,
+    masked: bool,
+    accumulate_borders: bool,
+    dtype: Type[DTypeFloat] | None,
+    out: NDArrayFloat | None,
+    layout: str,
+) -> NDArrayFloat:
+    """
+    Demosaic given *Bayer* CFA by convolving it with given kernels of the
+    phases and channels, their batch dimensions being iterated.
+    """
+
+    CFA = np.squeeze(as_float_array(CFA, dtype))
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), CFA.dtype)
+    RGB_p = _planes(RGB, layout)
+
+    colours, phases = _sites_CFA_Bayer(pattern)
+    # The kernels are flipped so that the convolutions are correlations.
+    kernels = np.ascontiguousarray(kernels[..., ::-1, ::-1])
+    offsets, weights, counts = _taps_sites(kernels, colours, phases, masked)
+    weights = weights.astype(CFA.dtype)
+
+    with _LOCK_KERNELS:
+        for index in np.ndindex(*CFA.shape[:-2]):
+            _convolve_sites(
+                CFA[index],
+                RGB_p[index],
+                kernels,
+                offsets,
+                weights,
+                counts,
+                copies,
+                colours,
+                phases,
+                masked,
+                accumulate_borders,
+            )
+
+    return RGB
+
+
+def demosaicing_CFA_Bayer_bilinear(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> NDArrayFloat:
+    """
+    Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
+    bilinear interpolation with the *Numba* backend.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the *RGB* colourspace array is returned
+        with, default to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array.
+
+    References
+    ----------
+    :cite:`Losson2010c`
+
+    Examples
+    --------
+    >>> CFA = np.array(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ]
+    ... )
+    >>> demosaicing_CFA_Bayer_bilinear(CFA)
+    array([[[ 0.69705884,  0.17941177,  0.09901961],
+            [ 0.46176472,  0.4509804 ,  0.19803922],
+            [ 0.45882354,  0.27450981,  0.19901961],
+            [ 0.22941177,  0.5647059 ,  0.30000001]],
+    <BLANKLINE>
+           [[ 0.23235295,  0.53529412,  0.29705883],
+            [ 0.15392157,  0.26960785,  0.59411766],
+            [ 0.15294118,  0.4509804 ,  0.59705884],
+            [ 0.07647059,  0.18431373,  0.90000002]]])
+    """
+
+    # The samples are not copied at their sites: on the borders, the
+    # reflected samples of the same colour contribute to them, and are
+    # accumulated in double precision as :func:`scipy.ndimage.convolve`
+    # definition does on its boundary.
+    return _demosaicing_convolve_sites(
+        CFA,
+        pattern,
+        np.array([[_H_RB, _H_G, _H_RB]] * 4) / 4,
+        np.zeros((4, 3), np.bool_),
+        True,
+        True,
+        dtype,
+        out,
+        layout,
+    )
+
+
+def demosaicing_CFA_Bayer_Malvar2004(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> NDArrayFloat:
+    """
+    Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
+    *Malvar (2004)* demosaicing algorithm with the *Numba* backend.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the *RGB* colourspace array is returned
+        with, default to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array.
+
+    References
+    ----------
+    :cite:`Malvar2004a`
+
+    Examples
+    --------
+    >>> CFA = np.array(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ]
+    ... )
+    >>> demosaicing_CFA_Bayer_Malvar2004(CFA)
+    array([[[ 0.30980393,  0.31666668,  0.32941177],
+            [ 0.33039216,  0.36078432,  0.38112746],
+            [ 0.30588236,  0.32794118,  0.34877452],
+            [ 0.36274511,  0.3764706 ,  0.38480393]],
+    <BLANKLINE>
+           [[ 0.34828432,  0.35686275,  0.36568628],
+            [ 0.35318628,  0.38186275,  0.39607844],
+            [ 0.3379902 ,  0.36078432,  0.3754902 ],
+            [ 0.37769609,  0.39558825,  0.40000001]]])
+    """
+
+    GR_GB = _GR_GB / 8
+    Rg_RB_Bg_BR = _RG_RB_BG_BR / 8
+    Rg_BR_Bg_RB = np.transpose(Rg_RB_Bg_BR)
+    Rb_BB_Br_RR = _RB_BB_BR_RR / 8
+    zeros = np.zeros([5, 5])
+
+    return _demosaicing_convolve_sites(
+        CFA,
+        pattern,
+        np.array(
+            [
+                # Red sites.
+                [zeros, GR_GB, Rb_BB_Br_RR],
+                # Green sites on red rows.
+                [Rg_RB_Bg_BR, zeros, Rg_BR_Bg_RB],
+                # Green sites on blue rows.
+                [Rg_BR_Bg_RB, zeros, Rg_RB_Bg_BR],
+                # Blue sites.
+                [Rb_BB_Br_RR, GR_GB, zeros],
+            ]
+        ),
+        np.array(
+            [
+                [True, False, False],
+                [False, True, False],
+                [False, True, False],
+                [False, False, True],
+            ]
+        ),
+        False,
+        False,
+        dtype,
+        out,
+        layout,
+    )
+
+
+def demosaicing_CFA_Bayer_Menon2007(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    refining_step: bool = True,
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> NDArrayFloat:
+    """
+    Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
+    DDFAPD - *Menon (2007)* demosaicing algorithm with the *Numba* backend.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    refining_step
+        Perform refining step.
+    dtype
+        Floating point data type the *RGB* colourspace array is returned
+        with, default to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array.
+
+    Notes
+    -----
+    -   The best directional reconstruction is stored in a boolean decision
+        map, the only array allocated besides the *RGB* colourspace array.
+
+    References
+    ----------
+    :cite:`Menon2007c`
+
+    Examples
+    --------
+    >>> CFA = np.array(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ]
+    ... )
+    >>> demosaicing_CFA_Bayer_Menon2007(CFA)
+    array([[[ 0.30980393,  0.35686275,  0.39215687],
+            [ 0.30980393,  0.36078432,  0.39607844],
+            [ 0.30588236,  0.36078432,  0.39019608],
+            [ 0.32156864,  0.3764706 ,  0.40000001]],
+    <BLANKLINE>
+           [[ 0.30980393,  0.35686275,  0.39215687],
+            [ 0.30980393,  0.36078432,  0.39607844],
+            [ 0.30588236,  0.36078432,  0.39019609],
+            [ 0.32156864,  0.3764706 ,  0.40000001]]])
+    """
+
+    CFA = np.squeeze(as_float_array(CFA, dtype))
+    *_shape_b, height, width = CFA.shape
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), CFA.dtype)
+    RGB_p = _planes(RGB, layout)
+
+    colours, _phases = _sites_CFA_Bayer(pattern)
+    (R_y, R_x), _G_r, _G_b, (B_y, B_x) = offsets_CFA_Bayer(pattern)
+    # The kernels are flipped so that the convolutions are correlations.
+    offsets_H, weights_H = _taps(_K_MENON2007[::-1, ::-1], CFA.dtype)
+    offsets_V, weights_V = _taps(np.transpose(_K_MENON2007)[::-1, ::-1], CFA.dtype)
+
+    M = np.empty((height, width), np.bool_)
+    with _LOCK_KERNELS:
+        for index in np.ndindex(*CFA.shape[:-2]):
+            _demosaicing_Menon2007(
+                CFA[index],
+                RGB_p[index],
+                M,
+                offsets_H,
+                weights_H,
+                offsets_V,
+                weights_V,
+                colours,
+            )
+
+            if refining_step:
+                # The green sites of rows, respectively columns, without
+                # samples of the other colour, e.g., single column arrays, are
+                # not updated.
+                _refining_step_Menon2007(
+                    RGB_p[index],
+                    M,
+                    colours,
+                    (width > B_x, height > B_y),
+                    (width > R_x, height > R_y),
+                )
+
+    return RGB
@@ -0,0 +1,136 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.backends` module.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from colour_demosaicing.bayer import (
+    backend_demosaicing_CFA_Bayer,
+    function_backend_demosaicing_CFA_Bayer,
+    get_backend_demosaicing_CFA_Bayer,
+    set_backend_demosaicing_CFA_Bayer,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestSet_backend_demosaicing_CFA_Bayer",
+    "TestBackend_demosaicing_CFA_Bayer",
+    "TestFunction_backend_demosaicing_CFA_Bayer",
+]
+
+
+class TestSet_backend_demosaicing_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.backends.\
+set_backend_demosaicing_CFA_Bayer` definition unit tests methods.
+    """
+
+    def test_set_backend_demosaicing_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.backends.\
+set_backend_demosaicing_CFA_Bayer` definition.
+        """
+
+        assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+        try:
+            set_backend_demosaicing_CFA_Bayer("Numba")
+
+            assert get_backend_demosaicing_CFA_Bayer() == "numba"
+        finally:
+            set_backend_demosaicing_CFA_Bayer()
+
+        assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+    def test_raise_exception_set_backend_demosaicing_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.backends.\
+set_backend_demosaicing_CFA_Bayer` definition raised exception.
+        """
+
+        with pytest.raises(ValueError):
+            set_backend_demosaicing_CFA_Bayer("Undefined")
+
+        assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+
+class TestBackend_demosaicing_CFA_Bayer:
+    """
+    Define :class:`colour_demosaicing.bayer.demosaicing.backends.\
+backend_demosaicing_CFA_Bayer` class unit tests methods.
+    """
+
+    def test_backend_demosaicing_CFA_Bayer(self):
+        """
+        Test :class:`colour_demosaicing.bayer.demosaicing.backends.\
+backend_demosaicing_CFA_Bayer` class.
+        """
+
+        with backend_demosaicing_CFA_Bayer("Numba"):
+            assert get_backend_demosaicing_CFA_Bayer() == "numba"
+
+            with backend_demosaicing_CFA_Bayer("SciPy"):
+                assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+            assert get_backend_demosaicing_CFA_Bayer() == "numba"
+
+        assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+        @backend_demosaicing_CFA_Bayer("Numba")
+        def backend():
+            """Return the compute backend in use."""
+
+            return get_backend_demosaicing_CFA_Bayer()
+
+        assert backend() == "numba"
+        assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+    def test_raise_exception_backend_demosaicing_CFA_Bayer(self):
+        """
+        Test :class:`colour_demosaicing.bayer.demosaicing.backends.\
+backend_demosaicing_CFA_Bayer` class raised exception and restoration of the
+        compute backend.
+        """
+
+        with pytest.raises(RuntimeError), backend_demosaicing_CFA_Bayer("Numba"):
+            raise RuntimeError
+
+        assert get_backend_demosaicing_CFA_Bayer() == "scipy"
+
+
+class TestFunction_backend_demosaicing_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.backends.\
+function_backend_demosaicing_CFA_Bayer` definition unit tests methods.
+    """
+
+    def test_function_backend_demosaicing_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.backends.\
+function_backend_demosaicing_CFA_Bayer` definition.
+        """
+
+        assert (
+            function_backend_demosaicing_CFA_Bayer("demosaicing_CFA_Bayer_bilinear")
+            is None
+        )
+        assert (
+            function_backend_demosaicing_CFA_Bayer(
+                "demosaicing_CFA_Bayer_bilinear", "SciPy"
+            )
+            is None
+        )
+
+        with pytest.raises(ValueError):
+            function_backend_demosaicing_CFA_Bayer(
+                "demosaicing_CFA_Bayer_bilinear", "Undefined"
+            )
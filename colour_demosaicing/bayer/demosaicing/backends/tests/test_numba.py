@@ -0,0 +1,169 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.backends.numba` module.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from colour import read_image
+from colour.constants import TOLERANCE_ABSOLUTE_TESTS
+
+from colour_demosaicing import ROOT_RESOURCES_TESTS
+from colour_demosaicing.bayer import (
+    backend_demosaicing_CFA_Bayer,
+    demosaicing_CFA_Bayer_bilinear,
+    demosaicing_CFA_Bayer_Malvar2004,
+    demosaicing_CFA_Bayer_Menon2007,
+    demosaicing_CFA_Bayer_tiled,
+)
+from colour_demosaicing.bayer.demosaicing.backends import numba
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "ROOT_RESOURCES_BAYER",
+    "TestDemosaicing_CFA_Bayer_Numba",
+]
+
+ROOT_RESOURCES_BAYER: str = os.path.join(
+    ROOT_RESOURCES_TESTS, "colour_demosaicing", "bayer"
+)
+
+
+class TestDemosaicing_CFA_Bayer_Numba:
+    """
+    Define :mod:`colour_demosaicing.bayer.demosaicing.backends.numba` module
+    definitions unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_Numba(self):
+        """
+        Test :mod:`colour_demosaicing.bayer.demosaicing.backends.numba` module
+        definitions on the reference images.
+        """
+
+        for function, name in (
+            (numba.demosaicing_CFA_Bayer_bilinear, "bilinear"),
+            (numba.demosaicing_CFA_Bayer_Malvar2004, "Malvar2004"),
+            (numba.demosaicing_CFA_Bayer_Menon2007, "Menon2007"),
+        ):
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                CFA = os.path.join(
+                    ROOT_RESOURCES_BAYER, f"Lighthouse_CFA_{pattern}.exr"
+                )
+                RGB = os.path.join(
+                    ROOT_RESOURCES_BAYER, f"Lighthouse_{name}_{pattern}.exr"
+                )
+
+                np.testing.assert_allclose(
+                    function(read_image(str(CFA))[..., 0], pattern),
+                    read_image(str(RGB)),
+                    atol=TOLERANCE_ABSOLUTE_TESTS,
+                )
+
+    def test_reference_demosaicing_CFA_Bayer_Numba(self):
+        """
+        Test :mod:`colour_demosaicing.bayer.demosaicing.backends.numba` module
+        definitions against the *SciPy* reference backend.
+        """
+
+        generator = np.random.default_rng(24)
+
+        for shape in ((2, 2), (3, 5), (7, 9), (2, 19, 26)):
+            CFA = generator.random(shape)
+            for dtype in (np.float32, np.float64):
+                for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                    for function, reference, kwargs in (
+                        (
+                            numba.demosaicing_CFA_Bayer_bilinear,
+                            demosaicing_CFA_Bayer_bilinear,
+                            {},
+                        ),
+                        (
+                            numba.demosaicing_CFA_Bayer_Malvar2004,
+                            demosaicing_CFA_Bayer_Malvar2004,
+                            {},
+                        ),
+                        (
+                            numba.demosaicing_CFA_Bayer_Menon2007,
+                            demosaicing_CFA_Bayer_Menon2007,
+                            {},
+                        ),
+                        (
+                            numba.demosaicing_CFA_Bayer_Menon2007,
+                            demosaicing_CFA_Bayer_Menon2007,
+                            {"refining_step": False},
+                        ),
+                    ):
+                        RGB = function(CFA, pattern, dtype=dtype, **kwargs)
+
+                        assert RGB.dtype == dtype
+
+                        np.testing.assert_array_equal(
+                            RGB, reference(CFA, pattern, dtype=dtype, **kwargs)
+                        )
+
+    def test_layout_demosaicing_CFA_Bayer_Numba(self):
+        """
+        Test :mod:`colour_demosaicing.bayer.demosaicing.backends.numba` module
+        definitions *out* and *layout* arguments.
+        """
+
+        CFA = np.random.default_rng(25).random((2, 19, 26))
+
+        for function in (
+            numba.demosaicing_CFA_Bayer_bilinear,
+            numba.demosaicing_CFA_Bayer_Malvar2004,
+            numba.demosaicing_CFA_Bayer_Menon2007,
+        ):
+            RGB = np.moveaxis(function(CFA), -1, -3)
+
+            np.testing.assert_array_equal(function(CFA, layout="planar"), RGB)
+
+            out = np.empty(RGB.shape, RGB.dtype)
+            assert function(CFA, out=out, layout="planar") is out
+            np.testing.assert_array_equal(out, RGB)
+
+    def test_backend_demosaicing_CFA_Bayer_Numba(self):
+        """
+        Test the dispatch of the reference definitions to the
+        :mod:`colour_demosaicing.bayer.demosaicing.backends.numba` module
+        definitions.
+        """
+
+        CFA = np.random.default_rng(26).random((37, 52))
+
+        for method, reference in (
+            ("Bilinear", demosaicing_CFA_Bayer_bilinear),
+            ("Malvar 2004", demosaicing_CFA_Bayer_Malvar2004),
+            ("Menon 2007", demosaicing_CFA_Bayer_Menon2007),
+        ):
+            RGB = getattr(numba, reference.__name__)(CFA, "GRBG")
+
+            np.testing.assert_array_equal(reference(CFA, "GRBG", backend="Numba"), RGB)
+            np.testing.assert_array_equal(
+                reference(CFA, "GRBG", workers=2, backend="Numba"), RGB
+            )
+            np.testing.assert_array_equal(
+                reference(CFA, "GRBG", roi=(3, 14, 5, 20), backend="Numba"),
+                RGB[3:14, 5:20],
+            )
+
+            with backend_demosaicing_CFA_Bayer("Numba"):
+                np.testing.assert_array_equal(reference(CFA, "GRBG"), RGB)
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_tiled(CFA, "GRBG", method, tile_size=16),
+                    RGB,
+                )
@@ -0,0 +1,213 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.backends.torch` module.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+
+import torch
+from colour import read_image
+from colour.constants import TOLERANCE_ABSOLUTE_TESTS
+
+from colour_demosaicing import ROOT_RESOURCES_TESTS
+from colour_demosaicing.bayer import (
+    backend_demosaicing_CFA_Bayer,
+    demosaicing_CFA_Bayer_bilinear,
+    demosaicing_CFA_Bayer_Malvar2004,
+    demosaicing_CFA_Bayer_Menon2007,
+    demosaicing_CFA_Bayer_tiled,
+)
+from colour_demosaicing.bayer.demosaicing.backends import torch as backend_torch
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "ROOT_RESOURCES_BAYER",
+    "TestDemosaicing_CFA_Bayer_PyTorch",
+]
+
+ROOT_RESOURCES_BAYER: str = os.path.join(
+    ROOT_RESOURCES_TESTS, "colour_demosaicing", "bayer"
+)
+
+
+class TestDemosaicing_CFA_Bayer_PyTorch:
+    """
+    Define :mod:`colour_demosaicing.bayer.demosaicing.backends.torch` module
+    definitions unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_PyTorch(self):
+        """
+        Test :mod:`colour_demosaicing.bayer.demosaicing.backends.torch` module
+        definitions on the reference images.
+        """
+
+        for function, name in (
+            (backend_torch.demosaicing_CFA_Bayer_bilinear, "bilinear"),
+            (backend_torch.demosaicing_CFA_Bayer_Malvar2004, "Malvar2004"),
+            (backend_torch.demosaicing_CFA_Bayer_Menon2007, "Menon2007"),
+        ):
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                CFA = os.path.join(
+                    ROOT_RESOURCES_BAYER, f"Lighthouse_CFA_{pattern}.exr"
+                )
+                RGB = os.path.join(
+                    ROOT_RESOURCES_BAYER, f"Lighthouse_{name}_{pattern}.exr"
+                )
+
+                np.testing.assert_allclose(
+                    function(read_image(str(CFA))[..., 0], pattern).numpy(),
+                    read_image(str(RGB)),
+                    atol=TOLERANCE_ABSOLUTE_TESTS,
+                )
+
+    def test_reference_demosaicing_CFA_Bayer_PyTorch(self):
+        """
+        Test :mod:`colour_demosaicing.bayer.demosaicing.backends.torch` module
+        definitions against the *SciPy* reference backend.
+        """
+
+        generator = np.random.default_rng(25)
+
+        for shape in ((2, 2), (3, 5), (7, 9), (2, 19, 26)):
+            CFA = generator.random(shape)
+            for dtype in (np.float32, np.float64):
+                for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                    for function, reference, kwargs in (
+                        (
+                            backend_torch.demosaicing_CFA_Bayer_bilinear,
+                            demosaicing_CFA_Bayer_bilinear,
+                            {},
+                        ),
+                        (
+                            backend_torch.demosaicing_CFA_Bayer_Malvar2004,
+                            demosaicing_CFA_Bayer_Malvar2004,
+                            {},
+                        ),
+                        (
+                            backend_torch.demosaicing_CFA_Bayer_Menon2007,
+                            demosaicing_CFA_Bayer_Menon2007,
+                            {},
+                        ),
+                        (
+                            backend_torch.demosaicing_CFA_Bayer_Menon2007,
+                            demosaicing_CFA_Bayer_Menon2007,
+                            {"refining_step": False},
+                        ),
+                    ):
+                        RGB = function(
+                            torch.from_numpy(CFA), pattern, dtype=dtype, **kwargs
+                        )
+
+                        assert isinstance(RGB, torch.Tensor)
+                        assert RGB.dtype == getattr(torch, np.dtype(dtype).name)
+
+                        np.testing.assert_array_equal(
+                            RGB.numpy(),
+                            reference(CFA, pattern, dtype=dtype, **kwargs),
+                        )
+
+    def test_directions_demosaicing_CFA_Bayer_Menon2007_PyTorch(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.backends.torch.\
+demosaicing_CFA_Bayer_Menon2007` definition best directions against the
+        *SciPy* reference backend on quantised and small *Bayer* CFAs, whose
+        directional gradients are often tied.
+        """
+
+        generator = np.random.default_rng(28)
+
+        CFAs = [np.round(generator.random((128, 96)) * 255) / 255]
+        for shape in ((2, 3), (3, 3), (3, 5), (5, 3)):
+            CFAs.extend(generator.random(shape) for _ in range(2))
+            CFAs.extend(np.round(generator.random(shape) * 255) / 255 for _ in range(2))
+
+        for CFA in CFAs:
+            for dtype in (np.float32, np.float64):
+                for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                    for refining_step in (True, False):
+                        for layout in ("interleaved", "planar"):
+                            np.testing.assert_array_equal(
+                                backend_torch.demosaicing_CFA_Bayer_Menon2007(
+                                    torch.from_numpy(CFA),
+                                    pattern,
+                                    refining_step,
+                                    dtype=dtype,
+                                    layout=layout,
+                                ).numpy(),
+                                demosaicing_CFA_Bayer_Menon2007(
+                                    CFA,
+                                    pattern,
+                                    refining_step,
+                                    dtype=dtype,
+                                    layout=layout,
+                                ),
+                            )
+
+    def test_layout_demosaicing_CFA_Bayer_PyTorch(self):
+        """
+        Test :mod:`colour_demosaicing.bayer.demosaicing.backends.torch` module
+        definitions *out* and *layout* arguments.
+        """
+
+        CFA = torch.from_numpy(np.random.default_rng(26).random((2, 19, 26)))
+
+        for function in (
+            backend_torch.demosaicing_CFA_Bayer_bilinear,
+            backend_torch.demosaicing_CFA_Bayer_Malvar2004,
+            backend_torch.demosaicing_CFA_Bayer_Menon2007,
+        ):
+            RGB = torch.movedim(function(CFA), -1, -3)
+
+            torch.testing.assert_close(function(CFA, layout="planar"), RGB)
+
+            out = torch.empty(RGB.shape, dtype=RGB.dtype)
+            assert function(CFA, out=out, layout="planar") is out
+            torch.testing.assert_close(out, RGB)
+
+            out = np.empty(RGB.shape, np.float64)
+            assert function(CFA, out=out, layout="planar") is out
+            np.testing.assert_array_equal(out, RGB.numpy())
+
+            with pytest.raises(ValueError):
+                function(CFA, out=torch.empty(RGB.shape, dtype=torch.float32))
+
+    def test_backend_demosaicing_CFA_Bayer_PyTorch(self):
+        """
+        Test the dispatch of the reference definitions to the
+        :mod:`colour_demosaicing.bayer.demosaicing.backends.torch` module
+        definitions.
+        """
+
+        CFA = np.random.default_rng(27).random((37, 52))
+
+        for method, reference in (
+            ("Bilinear", demosaicing_CFA_Bayer_bilinear),
+            ("Malvar 2004", demosaicing_CFA_Bayer_Malvar2004),
+            ("Menon 2007", demosaicing_CFA_Bayer_Menon2007),
+        ):
+            RGB = getattr(backend_torch, reference.__name__)(CFA, "GRBG")
+
+            torch.testing.assert_close(
+                reference(torch.from_numpy(CFA), "GRBG", backend="PyTorch"), RGB
+            )
+
+            with backend_demosaicing_CFA_Bayer("PyTorch"):
+                torch.testing.assert_close(reference(CFA, "GRBG"), RGB)
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_tiled(CFA, "GRBG", method, tile_size=16),
+                    RGB.numpy(),
+                )
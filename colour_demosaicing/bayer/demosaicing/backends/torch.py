@@ -0,0 +1,757 @@
+"""
+PyTorch Bayer CFA Demosaicing Backend
+=====================================
+
+Define the *PyTorch* compute backend of the *Bayer* CFA (Colour Filter Array)
+demosaicing definitions:
+
+-   :func:`colour_demosaicing.bayer.demosaicing.backends.torch.\
+demosaicing_CFA_Bayer_bilinear`
+-   :func:`colour_demosaicing.bayer.demosaicing.backends.torch.\
+demosaicing_CFA_Bayer_Malvar2004`
+-   :func:`colour_demosaicing.bayer.demosaicing.backends.torch.\
+demosaicing_CFA_Bayer_Menon2007`
+
+Each filter is only evaluated at the sites of the *Bayer* CFA phases it
+reconstructs, its non-zero taps being accumulated over strided views of the
+padded planes in the same order than the reference *SciPy* backend so that
+the results are identical to it, including the best directions of the
+*Menon (2007)* method whose nearly tied gradients, e.g., on quantised or small
+*Bayer* CFAs, would otherwise select different directions. The leading
+dimensions of the *Bayer* CFA are batch dimensions. The definitions accept
+and return :class:`torch.Tensor` class instances so that the demosaiced frames
+are fed to the models without conversion, the element-wise operations using
+the *PyTorch* intra-op thread pool and the device of the *Bayer* CFA.
+
+The operations are small and memory bound: on a single thread and a
+:math:`2000 \times 3000` *Bayer* CFA, the *bilinear* method is on par with the
+*SciPy* backend, the *Malvar (2004)* method is about 1.5 to 2 times faster and
+the *Menon (2007)* method, which allocates more intermediate planes, is about
+1.3 to 1.7 times slower. The *PyTorch* backend is thus only worth using when
+the frames are already tensors, or when the intra-op threads scale on the
+target machine, which the *utilities/benchmark_threads.py* utility measures.
+
+References
+----------
+-   :cite:`Losson2010c` : Losson, O., Macaire, L., & Yang, Y. (2010).
+    Comparison of Color Demosaicing Methods. In Advances in Imaging and
+    Electron Physics (Vol. 162, pp. 173-265). doi:10.1016/S1076-5670(10)62005-8
+-   :cite:`Malvar2004a` : Malvar, H. S., He, L.-W., Cutler, R., & Way, O. M.
+    (2004). High-Quality Linear Interpolation for Demosaicing of
+    Bayer-Patterned Color Images. In International Conference of Acoustic,
+    Speech and Signal Processing (pp. 5-8). Institute of Electrical and
+    Electronics Engineers, Inc.
+    http://research.microsoft.com/apps/pubs/default.aspx?id=102068
+-   :cite:`Menon2007c` : Menon, D., Andriani, S., & Calvagno, G. (2007).
+    Demosaicing With Directional Filtering and a posteriori Decision. IEEE
+    Transactions on Image Processing, 16(1), 132-141.
+    doi:10.1109/TIP.2006.884928
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.hints import (
+    Any,
+    ArrayLike,
+    DTypeFloat,
+    List,
+    Literal,
+    NDArrayFloat,
+    Sequence,
+    Tuple,
+    Type,
+)
+from colour.utilities import optional
+
+from colour_demosaicing.bayer import masks_CFA_Bayer, offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.bilinear import _H_G, _H_RB
+from colour_demosaicing.bayer.demosaicing.common import (
+    PADDING,
+    phase,
+    shape_phase,
+    shape_RGB,
+)
+from colour_demosaicing.bayer.demosaicing.malvar2004 import (
+    _GR_GB,
+    _RB_BB_BR_RR,
+    _RG_RB_BG_BR,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "demosaicing_CFA_Bayer_bilinear",
+    "demosaicing_CFA_Bayer_Malvar2004",
+    "demosaicing_CFA_Bayer_Menon2007",
+]
+
+_K_MENON2007: NDArrayFloat = np.array(
+    [
+        [0.0, 0.0, 1.0, 0.0, 1.0],
+        [0.0, 0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 3.0, 0.0, 3.0],
+        [0.0, 0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0, 1.0],
+    ]
+)
+
+_H_0_MENON2007: NDArrayFloat = np.array([0.0, 0.5, 0.0, 0.5, 0.0])
+
+_H_1_MENON2007: NDArrayFloat = np.array([-0.25, 0.0, 0.5, 0.0, -0.25])
+
+_K_B_MENON2007: NDArrayFloat = np.array([0.5, 0.0, 0.5])
+
+_FIR_MENON2007: NDArrayFloat = np.ones(3) / 3
+
+
+def _as_float_tensor(
+    a: ArrayLike | torch.Tensor, dtype: Type[DTypeFloat] | None
+) -> torch.Tensor:
+    """
+    Return given array as a squeezed :class:`torch.Tensor` class instance with
+    given floating point *dtype*, sharing its memory whenever possible.
+    """
+
+    return torch.as_tensor(
+        a, dtype=getattr(torch, np.dtype(optional(dtype, DTYPE_FLOAT_DEFAULT)).name)
+    ).squeeze()
+
+
+def _output_tensor(
+    out: torch.Tensor | NDArrayFloat | None,
+    shape: Tuple[int, ...],
+    dtype: torch.dtype,
+    device: torch.device,
+) -> torch.Tensor:
+    """
+    Return given output tensor, or array viewed as a tensor, after checking
+    its shape and *dtype*, or a new tensor if it is not given.
+    """
+
+    if out is None:
+        return torch.empty(shape, dtype=dtype, device=device)
+
+    RGB = torch.as_tensor(out)
+    if tuple(RGB.shape) != tuple(shape) or RGB.dtype != dtype:
+        raise ValueError(
+            f'"out" array shape {tuple(RGB.shape)} and "{RGB.dtype}" dtype do '
+            f'not match the expected {tuple(shape)} shape and "{dtype}" dtype!'
+        )
+
+    return RGB
+
+
+def _write_RGB(
+    R: torch.Tensor,
+    G: torch.Tensor,
+    B: torch.Tensor,
+    out: torch.Tensor | NDArrayFloat | None,
+    layout: str,
+) -> torch.Tensor | NDArrayFloat:
+    """
+    Write given red, green and blue planes into given output array in given
+    layout and return it, or a new tensor if it is not given.
+    """
+
+    RGB = _output_tensor(out, shape_RGB(R.shape, layout), R.dtype, R.device)
+    torch.stack([R, G, B], -1 if layout == "interleaved" else -3, out=RGB)
+
+    return RGB if out is None else out
+
+
+def _masks_CFA_Bayer(
+    shape: Tuple[int, ...], pattern: str, device: torch.device
+) -> torch.Tensor:
+    """
+    Return the *Bayer* CFA red, green and blue masks with given shape and
+    pattern stacked in a tensor on given device.
+    """
+
+    return torch.from_numpy(np.stack(masks_CFA_Bayer(shape[-2:], pattern))).to(device)
+
+
+def _indexes_pad(size: int, mode: str, device: torch.device) -> torch.Tensor:
+    """
+    Return the indexes of given size axis padded by :attr:`PADDING` samples in
+    given :mod:`scipy.ndimage` mode.
+    """
+
+    return torch.as_tensor(
+        np.pad(
+            np.arange(size),
+            PADDING,
+            {"mirror": "reflect", "reflect": "symmetric"}[mode],
+        ),
+        device=device,
+    )
+
+
+def _pad(
+    a: torch.Tensor, mode: Literal["mirror", "reflect"] = "mirror"
+) -> torch.Tensor:
+    """
+    Pad given planes by :attr:`PADDING` pixels along their last two axes in
+    given :mod:`scipy.ndimage` mode.
+    """
+
+    *shape_b, height, width = a.shape
+    index_y = _indexes_pad(height, mode, a.device)
+    index_x = _indexes_pad(width, mode, a.device) + PADDING
+
+    # The margins are filled by copying the reflected rows and then columns,
+    # concatenating the flipped margins along the last axis being slow.
+    a_p = a.new_empty((*shape_b, height + 2 * PADDING, width + 2 * PADDING))
+    a_p[..., PADDING:-PADDING, PADDING:-PADDING] = a
+    a_p[..., :PADDING, PADDING:-PADDING] = a[..., index_y[:PADDING], :]
+    a_p[..., -PADDING:, PADDING:-PADDING] = a[..., index_y[-PADDING:], :]
+    a_p[..., :PADDING] = a_p[..., index_x[:PADDING]]
+    a_p[..., -PADDING:] = a_p[..., index_x[-PADDING:]]
+
+    return a_p
+
+
+def _phase(a: torch.Tensor, y: int, x: int) -> torch.Tensor:
+    """Return the view of given planes at the *Bayer* CFA phase at given offset."""
+
+    return a[..., y::2, x::2]
+
+
+def _convolve_phase(a_p: torch.Tensor, h: NDArrayFloat, y: int, x: int) -> torch.Tensor:
+    """
+    Convolve given planes padded by :attr:`PADDING` pixels with given kernel
+    at the sites of the *Bayer* CFA phase at given offset only, accumulating
+    the non-zero taps in the same order than the
+    :func:`colour_demosaicing.bayer.demosaicing.common.convolve_phase`
+    definition.
+    """
+
+    shape = shape_phase(tuple(n - 2 * PADDING for n in a_p.shape[-2:]), y, x)
+    r_y, r_x = h.shape[0] // 2, h.shape[1] // 2
+
+    out = None
+    for i, row in enumerate(h[::-1, ::-1].tolist()):
+        for j, w in enumerate(row):
+            if w == 0:
+                continue
+
+            a_s = phase(a_p, y, x, shape, i - r_y, j - r_x) * w
+            out = a_s if out is None else out.add_(a_s)
+
+    return out
+
+
+def _convolve1d_phase(
+    a_p: torch.Tensor, h: NDArrayFloat, y: int, x: int, axis: Literal[0, 1]
+) -> torch.Tensor:
+    """
+    Convolve given planes padded by :attr:`PADDING` pixels with given
+    symmetric 1-D kernel along given axis at the sites of the *Bayer* CFA
+    phase at given offset only, accumulating the non-zero taps in the same
+    order than the
+    :func:`colour_demosaicing.bayer.demosaicing.common.convolve1d_phase`
+    definition.
+    """
+
+    shape = shape_phase(tuple(n - 2 * PADDING for n in a_p.shape[-2:]), y, x)
+    h = h.tolist()
+    r = len(h) // 2
+    u_y, u_x = (1, 0) if axis == 0 else (0, 1)
+
+    out = phase(a_p, y, x, shape) * h[r] if h[r] != 0 else None
+    for d in range(r, 0, -1):
+        if h[r - d] == 0:
+            continue
+
+        S = (
+            phase(a_p, y, x, shape, -d * u_y, -d * u_x)
+            + phase(a_p, y, x, shape, d * u_y, d * u_x)
+        ).mul_(h[r - d])
+        out = S if out is None else out.add_(S)
+
+    return out
+
+
+def demosaicing_CFA_Bayer_bilinear(
+    CFA: ArrayLike | torch.Tensor,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
+    out: torch.Tensor | NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> torch.Tensor | Any:
+    """
+    Return the demosaiced *RGB* colourspace tensor from given *Bayer* CFA
+    using bilinear interpolation with the *PyTorch* backend.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Tensor, or array, to write the *RGB* colourspace tensor into, a new
+        tensor is allocated on the device of the *Bayer* CFA if not given.
+    layout
+        Layout of the *RGB* colourspace tensor: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Returns
+    -------
+    :class:`torch.Tensor`
+        *RGB* colourspace tensor, or the given output array.
+
+    References
+    ----------
+    :cite:`Losson2010c`
+
+    Examples
+    --------
+    >>> CFA = torch.tensor(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ],
+    ...     dtype=torch.float64,
+    ... )
+    >>> demosaicing_CFA_Bayer_bilinear(CFA).numpy()
+    array([[[ 0.69705884,  0.17941177,  0.09901961],
+            [ 0.46176472,  0.4509804 ,  0.19803922],
+            [ 0.45882354,  0.27450981,  0.19901961],
+            [ 0.22941177,  0.5647059 ,  0.30000001]],
+    <BLANKLINE>
+           [[ 0.23235295,  0.53529412,  0.29705883],
+            [ 0.15392157,  0.26960785,  0.59411766],
+            [ 0.15294118,  0.4509804 ,  0.59705884],
+            [ 0.07647059,  0.18431373,  0.90000002]]])
+    """
+
+    CFA = _as_float_tensor(CFA, dtype)
+    CFA_p = _pad(CFA)
+    masks = _masks_CFA_Bayer(CFA.shape, pattern, CFA.device)
+
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
+
+    RGB = CFA.new_empty((*CFA.shape[:-2], 3, *CFA.shape[-2:]))
+    R, G, B = RGB.unbind(-3)
+
+    N_row, N_column = ((0, -1), (0, 1)), ((-1, 0), (1, 0))
+    N_cross = ((-1, 0), (0, -1), (0, 1), (1, 0))
+    N_diagonal = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+    # The interior samples are the means of their neighbours of the same
+    # colour, the samples of the padding being overwritten with the borders.
+    for C, sites, samples in (
+        (
+            R,
+            ((R_y, R_x),),
+            (
+                ((G_r_y, G_r_x), N_row),
+                ((G_b_y, G_b_x), N_column),
+                ((B_y, B_x), N_diagonal),
+            ),
+        ),
+        (
+            G,
+            ((G_r_y, G_r_x), (G_b_y, G_b_x)),
+            (((R_y, R_x), N_cross), ((B_y, B_x), N_cross)),
+        ),
+        (
+            B,
+            ((B_y, B_x),),
+            (
+                ((G_b_y, G_b_x), N_row),
+                ((G_r_y, G_r_x), N_column),
+                ((R_y, R_x), N_diagonal),
+            ),
+        ),
+    ):
+        for y, x in sites:
+            _phase(C, y, x)[...] = _phase(CFA, y, x)
+
+        for (y, x), displacements in samples:
+            shape = shape_phase(CFA.shape, y, x)
+            C_s = None
+            for d_y, d_x in displacements:
+                C_d = phase(CFA_p, y, x, shape, d_y, d_x)
+                C_s = C_d.clone() if C_s is None else C_s.add_(C_d)
+
+            _phase(C, y, x)[...] = C_s.mul_(1 / len(displacements))
+
+    # The border samples depend on the reflected masked planes and are
+    # computed by filtering the masked planes of the first and last 2 pixels
+    # wide strips stacked together, in double precision as the reference
+    # backend.
+    H_G, H_RB = _H_G / 4, _H_RB / 4
+    for axis in (-2, -1):
+        n = min(2, CFA.shape[axis])
+        strips = [(0, 0), (CFA.shape[axis] - n, n - 1)]
+        CFA_m = torch.cat(
+            [
+                CFA.narrow(axis, start, n)[..., None, :, :]
+                * masks.narrow(axis, start, n)
+                for start, _ in strips
+            ],
+            axis,
+        ).to(torch.float64)
+        CFA_m_p = _pad(CFA_m, "reflect")
+        RGB_m = torch.empty_like(CFA_m)
+        for y, x in np.ndindex(2, 2):
+            RGB_s = _phase(RGB_m, y, x)
+            RGB_s[..., ::2, :, :] = _convolve_phase(CFA_m_p[..., ::2, :, :], H_RB, y, x)
+            RGB_s[..., 1, :, :] = _convolve_phase(CFA_m_p[..., 1, :, :], H_G, y, x)
+
+        for k, (start, i) in enumerate(strips):
+            RGB.narrow(axis, start + i, 1).copy_(RGB_m.narrow(axis, k * n + i, 1))
+
+    return _write_RGB(R, G, B, out, layout)
+
+
+def demosaicing_CFA_Bayer_Malvar2004(
+    CFA: ArrayLike | torch.Tensor,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
+    out: torch.Tensor | NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> torch.Tensor | Any:
+    """
+    Return the demosaiced *RGB* colourspace tensor from given *Bayer* CFA
+    using *Malvar (2004)* demosaicing algorithm with the *PyTorch* backend.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Tensor, or array, to write the *RGB* colourspace tensor into, a new
+        tensor is allocated on the device of the *Bayer* CFA if not given.
+    layout
+        Layout of the *RGB* colourspace tensor: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Returns
+    -------
+    :class:`torch.Tensor`
+        *RGB* colourspace tensor, or the given output array.
+
+    Notes
+    -----
+    -   Each filter is only evaluated at the sites of the *Bayer* CFA phases
+        it reconstructs.
+
+    References
+    ----------
+    :cite:`Malvar2004a`
+
+    Examples
+    --------
+    >>> CFA = torch.tensor(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ],
+    ...     dtype=torch.float64,
+    ... )
+    >>> demosaicing_CFA_Bayer_Malvar2004(CFA).numpy()
+    array([[[ 0.30980393,  0.31666668,  0.32941177],
+            [ 0.33039216,  0.36078432,  0.38112746],
+            [ 0.30588236,  0.32794118,  0.34877452],
+            [ 0.36274511,  0.3764706 ,  0.38480393]],
+    <BLANKLINE>
+           [[ 0.34828432,  0.35686275,  0.36568628],
+            [ 0.35318628,  0.38186275,  0.39607844],
+            [ 0.3379902 ,  0.36078432,  0.3754902 ],
+            [ 0.37769609,  0.39558825,  0.40000001]]])
+    """
+
+    CFA = _as_float_tensor(CFA, dtype)
+    CFA_p = _pad(CFA, "reflect")
+
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
+
+    GR_GB = _GR_GB / 8
+    Rg_RB_Bg_BR = _RG_RB_BG_BR / 8
+    Rg_BR_Bg_RB = np.transpose(Rg_RB_Bg_BR)
+    Rb_BB_Br_RR = _RB_BB_BR_RR / 8
+
+    R, G, B = CFA.clone(), CFA.clone(), CFA.clone()
+    for (y, x), (C_0, C_1), h in (
+        ((R_y, R_x), (G, B), (GR_GB, Rb_BB_Br_RR)),
+        ((G_r_y, G_r_x), (R, B), (Rg_RB_Bg_BR, Rg_BR_Bg_RB)),
+        ((G_b_y, G_b_x), (R, B), (Rg_BR_Bg_RB, Rg_RB_Bg_BR)),
+        ((B_y, B_x), (G, R), (GR_GB, Rb_BB_Br_RR)),
+    ):
+        _phase(C_0, y, x)[...] = _convolve_phase(CFA_p, h[0], y, x)
+        _phase(C_1, y, x)[...] = _convolve_phase(CFA_p, h[1], y, x)
+
+    return _write_RGB(R, G, B, out, layout)
+
+
+def demosaicing_CFA_Bayer_Menon2007(
+    CFA: ArrayLike | torch.Tensor,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    refining_step: bool = True,
+    dtype: Type[DTypeFloat] | None = None,
+    out: torch.Tensor | NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> torch.Tensor | Any:
+    """
+    Return the demosaiced *RGB* colourspace tensor from given *Bayer* CFA
+    using DDFAPD - *Menon (2007)* demosaicing algorithm with the *PyTorch*
+    backend.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    refining_step
+        Perform refining step.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Tensor, or array, to write the *RGB* colourspace tensor into, a new
+        tensor is allocated on the device of the *Bayer* CFA if not given.
+    layout
+        Layout of the *RGB* colourspace tensor: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Returns
+    -------
+    :class:`torch.Tensor`
+        *RGB* colourspace tensor, or the given output array.
+
+    Notes
+    -----
+    -   The directional filters are only evaluated at the sites of the
+        *Bayer* CFA phases they reconstruct, and the gradients only at the
+        red and blue sites.
+
+    References
+    ----------
+    :cite:`Menon2007c`
+
+    Examples
+    --------
+    >>> CFA = torch.tensor(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ],
+    ...     dtype=torch.float64,
+    ... )
+    >>> demosaicing_CFA_Bayer_Menon2007(CFA).numpy()
+    array([[[ 0.30980393,  0.35686275,  0.39215687],
+            [ 0.30980393,  0.36078432,  0.39607844],
+            [ 0.30588236,  0.36078432,  0.39019608],
+            [ 0.32156864,  0.3764706 ,  0.40000001]],
+    <BLANKLINE>
+           [[ 0.30980393,  0.35686275,  0.39215687],
+            [ 0.30980393,  0.36078432,  0.39607844],
+            [ 0.30588236,  0.36078432,  0.39019609],
+            [ 0.32156864,  0.3764706 ,  0.40000001]]])
+    """
+
+    CFA = _as_float_tensor(CFA, dtype)
+    CFA_p = _pad(CFA)
+
+    offsets = offsets_CFA_Bayer(pattern)
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets
+    # Red and blue sites, i.e., the sites missing the green component.
+    sites = ((R_y, R_x), (B_y, B_x))
+
+    # Horizontal and vertical green estimations at the red and blue sites.
+    G_H, G_V = (
+        [
+            _convolve1d_phase(CFA_p, _H_0_MENON2007, y, x, axis).add_(
+                _convolve1d_phase(CFA_p, _H_1_MENON2007, y, x, axis)
+            )
+            for y, x in sites
+        ]
+        for axis in (1, 0)
+    )
+
+    def gradients_directional(
+        G_D: List[torch.Tensor], u_y: int, u_x: int, k: NDArrayFloat
+    ) -> List[torch.Tensor]:
+        """
+        Return the gradients at the red and blue sites in given direction
+        using given green estimations.
+        """
+
+        # Colour differences and gradients, null at the green sites and
+        # outside the *Bayer* CFA.
+        C = torch.zeros_like(CFA)
+        for (y, x), G_d in zip(sites, G_D):
+            _phase(C, y, x)[...] = _phase(CFA, y, x) - G_d
+
+        C_p = _pad(C)
+        D_p = C.new_zeros(C_p.shape)
+        for y, x in sites:
+            shape = shape_phase(C.shape, y, x)
+            phase(D_p, y, x, shape)[...] = torch.abs(
+                phase(C_p, y, x, shape) - phase(C_p, y, x, shape, 2 * u_y, 2 * u_x)
+            )
+
+        return [_convolve_phase(D_p, k, y, x) for y, x in sites]
+
+    d_H = gradients_directional(G_H, 0, 1, _K_MENON2007)
+    d_V = gradients_directional(G_V, 1, 0, np.transpose(_K_MENON2007))
+
+    # Best directional reconstruction at the red and blue sites, *True* where
+    # the horizontal reconstruction is the best.
+    M = [d_v >= d_h for d_h, d_v in zip(d_H, d_V)]
+
+    del d_H, d_V
+
+    R, G, B = CFA.clone(), CFA.clone(), CFA.clone()
+    for (y, x), G_h, G_v, M_s in zip(sites, G_H, G_V, M):
+        _phase(G, y, x)[...] = torch.where(M_s, G_h, G_v)
+
+    del G_H, G_V
+
+    # Red and blue components at the green sites: horizontally on their rows
+    # and vertically on their columns.
+    RGB = (R, G, B)
+    RGB_p = [_pad(C) for C in RGB]
+    for (y, x), i_h, i_v in (((G_r_y, G_r_x), 0, 2), ((G_b_y, G_b_x), 2, 0)):
+        G_s = _phase(G, y, x)
+        for i, axis in ((i_h, 1), (i_v, 0)):
+            _phase(RGB[i], y, x)[...] = (
+                _convolve1d_phase(RGB_p[i], _K_B_MENON2007, y, x, axis)
+                + G_s
+                - _convolve1d_phase(RGB_p[1], _K_B_MENON2007, y, x, axis)
+            )
+
+    # Red (blue) component at the blue (red) sites in the best direction.
+    RB_p = [_pad(R), _pad(B)]
+    for C, i, j, (y, x), M_s in (
+        (R, 0, 1, (B_y, B_x), M[1]),
+        (B, 1, 0, (R_y, R_x), M[0]),
+    ):
+        K_s = _phase(RGB[2 * j], y, x)
+        C_H, C_V = (
+            _convolve1d_phase(RB_p[i], _K_B_MENON2007, y, x, axis)
+            + K_s
+            - _convolve1d_phase(RB_p[j], _K_B_MENON2007, y, x, axis)
+            for axis in (1, 0)
+        )
+        _phase(C, y, x)[...] = torch.where(M_s, C_H, C_V)
+
+    del RGB_p, RB_p
+
+    if refining_step:
+        _refining_step_Menon2007(R, G, B, M, offsets)
+
+    return _write_RGB(R, G, B, out, layout)
+
+
+def _refining_step_Menon2007(
+    R: torch.Tensor,
+    G: torch.Tensor,
+    B: torch.Tensor,
+    M: Sequence[torch.Tensor],
+    offsets: Tuple[Tuple[int, int], ...],
+) -> None:
+    """
+    Perform in-place the refining step on given red, green and blue planes.
+
+    Parameters
+    ----------
+    R
+        Red plane.
+    G
+        Green plane.
+    B
+        Blue plane.
+    M
+        Estimation for the best directional reconstruction at the red and
+        blue sites, *True* where the horizontal reconstruction is the best.
+    offsets
+        *Bayer* CFA red, green on red rows, green on blue rows and blue sites
+        offsets.
+    """
+
+    height, width = R.shape[-2:]
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets
+
+    def convolve_best(
+        a_p: torch.Tensor, y: int, x: int, M_s: torch.Tensor
+    ) -> torch.Tensor:
+        """
+        Convolve given padded plane with the *FIR* filter at the sites of the
+        *Bayer* CFA phase at given offset in the best direction.
+        """
+
+        return torch.where(
+            M_s,
+            *(_convolve1d_phase(a_p, _FIR_MENON2007, y, x, axis) for axis in (1, 0)),
+        )
+
+    # Updating of the green component.
+    S_p = [_pad(R - G), _pad(B - G)]
+    for i, (C, (y, x), M_s) in enumerate(
+        ((R, (R_y, R_x), M[0]), (B, (B_y, B_x), M[1]))
+    ):
+        _phase(G, y, x)[...] = _phase(C, y, x) - convolve_best(S_p[i], y, x, M_s)
+
+    # Updating of the red and blue components in the green locations:
+    # vertically on the rows and horizontally on the columns of the other
+    # colour. The green sites of rows, respectively columns, without samples
+    # of the other colour, e.g., single column arrays, are not updated.
+    S_p = [_pad(R - G), _pad(B - G)]
+    for i, C, sites_C in (
+        (
+            0,
+            R,
+            (
+                ((G_b_y, G_b_x), 0, width > B_x),
+                ((G_r_y, G_r_x), 1, height > B_y),
+            ),
+        ),
+        (
+            1,
+            B,
+            (
+                ((G_r_y, G_r_x), 0, width > R_x),
+                ((G_b_y, G_b_x), 1, height > R_y),
+            ),
+        ),
+    ):
+        for (y, x), axis, update in sites_C:
+            if update:
+                _phase(C, y, x)[...] = _convolve1d_phase(
+                    S_p[i], _K_B_MENON2007, y, x, axis
+                ) + _phase(G, y, x)
+
+    # Updating of the red (blue) component in the blue (red) locations.
+    S_p = _pad(R - B)
+    R_s = _phase(B, B_y, B_x) + convolve_best(S_p, B_y, B_x, M[1])
+    _phase(B, R_y, R_x)[...] = _phase(R, R_y, R_x) - convolve_best(S_p, R_y, R_x, M[0])
+    _phase(R, B_y, B_x)[...] = R_s
@@ -0,0 +1,472 @@
+"""
+Batch Bayer CFA Demosaicing
+===========================
+
+Define the objects demosaicing batches of *Bayer* CFA (Colour Filter Array)
+arrays or files with a process pool.
+
+The arrays are exchanged with the worker processes through
+:mod:`multiprocessing.shared_memory` blocks rather than being pickled, and
+the worker processes keep a workspace reusing the scratch buffers across the
+items of the same shape.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.hints import (
+    Any,
+    ArrayLike,
+    Callable,
+    Dict,
+    DTypeFloat,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    NDArray,
+    NDArrayFloat,
+    Tuple,
+    Type,
+)
+from colour.utilities import filter_kwargs, optional, validate_method
+
+from colour_demosaicing.bayer.demosaicing.backends import (
+    get_backend_demosaicing_CFA_Bayer,
+)
+from colour_demosaicing.bayer.demosaicing.common import (
+    LAYOUTS_RGB,
+    shape_RGB,
+    workers_count,
+)
+from colour_demosaicing.bayer.demosaicing.plan import DEMOSAICING_CFA_BAYER_METHODS
+from colour_demosaicing.bayer.demosaicing.workspace import Workspace
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "DemosaicingBatchResult",
+    "demosaicing_CFA_Bayer_batch",
+]
+
+
+@dataclass
+class DemosaicingBatchResult:
+    """
+    Define the result of the demosaicing of an item of a batch.
+
+    Attributes
+    ----------
+    index
+        Index of the item in the batch.
+    RGB
+        Demosaiced *RGB* colourspace array, *None* if the demosaicing failed.
+    error
+        Exception raised by the demosaicing of the item, *None* if it
+        succeeded.
+    """
+
+    index: int
+    RGB: NDArrayFloat | None = None
+    error: BaseException | None = None
+
+
+_WORKSPACES_BATCH: Dict = {}
+"""Workspaces of the worker process, one per *Bayer* CFA shape."""
+
+
+def _read_CFA(path: str | os.PathLike) -> NDArray:
+    """
+    Read the *Bayer* CFA from given file, i.e., its first channel when it has
+    several channels.
+    """
+
+    from colour.io import read_image  # noqa: PLC0415
+
+    CFA = read_image(path)
+
+    return CFA[..., 0] if CFA.ndim == 3 else CFA
+
+
+def _shared_array(
+    shape: Tuple[int, ...], dtype: Type[DTypeFloat] | Any
+) -> Tuple[SharedMemory, NDArray]:
+    """
+    Create a shared memory block and return it with the array of given shape
+    and *dtype* it holds.
+    """
+
+    shared_memory = SharedMemory(
+        create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+    )
+
+    return shared_memory, np.ndarray(shape, dtype, buffer=shared_memory.buf)
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Return a process pool with given number of worker processes sharing the
+    resource tracker of the current process, so that the shared memory blocks
+    created by the workers and unlinked by the current process are tracked
+    once.
+
+    Forking the current process once the *Numba* backend threads are running
+    is unsafe, the worker processes are then forked from a server process.
+    """
+
+    resource_tracker.ensure_running()
+
+    context = None
+    if (
+        "colour_demosaicing.bayer.demosaicing.backends.numba" in sys.modules
+        and "forkserver" in multiprocessing.get_all_start_methods()
+    ):
+        context = multiprocessing.get_context("forkserver")
+
+    return ProcessPoolExecutor(workers, context)
+
+
+def _release(shared_memory: SharedMemory, unlink: bool = True) -> None:
+    """Close and optionally unlink given shared memory block."""
+
+    # The block can still be exported, e.g., by the frames of a traceback, it
+    # is then closed when garbage collected.
+    with suppress(BufferError):
+        shared_memory.close()
+
+    if unlink:
+        shared_memory.unlink()
+
+
+def _demosaicing_item(
+    item: Tuple[str, Any],
+    function: Callable,
+    pattern: str,
+    dtype: Type[DTypeFloat],
+    reader: Callable,
+    kwargs: Dict,
+) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Demosaic given item in a worker process and return the name of the shared
+    memory block holding the *RGB* colourspace array and its shape.
+    """
+
+    kind, value = item
+
+    shared_memory_CFA = None
+    if kind == "array":
+        name, shape_CFA, dtype_CFA = value
+        shared_memory_CFA = SharedMemory(name)
+        CFA = np.ndarray(shape_CFA, dtype_CFA, buffer=shared_memory_CFA.buf)
+    else:
+        CFA = reader(value)
+
+    try:
+        CFA = np.squeeze(CFA)
+        shape = shape_RGB(CFA.shape, kwargs.get("layout", "interleaved"))
+        workspace = _WORKSPACES_BATCH.setdefault(CFA.shape, Workspace())
+
+        shared_memory, RGB = _shared_array(shape, dtype)
+        try:
+            function(CFA, pattern, dtype=dtype, out=RGB, workspace=workspace, **kwargs)
+        except BaseException:
+            del RGB
+            _release(shared_memory)
+            raise
+
+        # The views must be released before closing the shared memory blocks.
+        del RGB
+        shared_memory.close()
+    finally:
+        del CFA
+        if shared_memory_CFA is not None:
+            _release(shared_memory_CFA, unlink=False)
+
+    return shared_memory.name, shape
+
+
+def _demosaicing_chunk(
+    chunk: List[Tuple[int, Tuple[str, Any]]],
+    method: str,
+    pattern: str,
+    dtype: Type[DTypeFloat],
+    reader: Callable,
+    kwargs: Dict,
+) -> List[Tuple[int, Tuple[str, Tuple[int, ...]] | None, BaseException | None]]:
+    """
+    Demosaic given chunk of items in a worker process, isolating the errors
+    of each item.
+    """
+
+    function = DEMOSAICING_CFA_BAYER_METHODS[method]
+
+    results = []
+    for index, item in chunk:
+        try:
+            results.append(
+                (
+                    index,
+                    _demosaicing_item(item, function, pattern, dtype, reader, kwargs),
+                    None,
+                )
+            )
+        except Exception as error:
+            results.append((index, None, error))
+
+    return results
+
+
+def demosaicing_CFA_Bayer_batch(
+    items: Iterable[ArrayLike | str | os.PathLike],
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    workers: int = -1,
+    chunk_size: int = 1,
+    ordered: bool = True,
+    dtype: Type[DTypeFloat] | None = None,
+    reader: Callable | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    **kwargs: Any,
+) -> Generator[DemosaicingBatchResult, None, None]:
+    """
+    Demosaic given batch of *Bayer* CFA arrays or files with a process pool and
+    generate the results as they are available.
+
+    Parameters
+    ----------
+    items
+        *Bayer* CFA arrays or paths of the files to read them from, the
+        iterable is consumed lazily.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    workers
+        Number of worker processes, the negative values wrap around the
+        number of CPUs, i.e., -1 uses all the CPUs.
+    chunk_size
+        Number of items sent to a worker process at once.
+    ordered
+        Whether to generate the results in the order of the items, otherwise
+        in their completion order.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    reader
+        Picklable callable reading a *Bayer* CFA from a file path in the
+        worker processes, default to reading the first channel of the file
+        with :func:`colour.read_image` definition.
+    layout
+        Layout of the *RGB* colourspace arrays: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+    backend
+        Compute backend, the one in use by the current process if not given.
+
+    Yields
+    ------
+    :class:`colour_demosaicing.bayer.DemosaicingBatchResult`
+        Result of the demosaicing of an item.
+
+    Raises
+    ------
+    ValueError
+        If the demosaicing method does not support given keyword arguments,
+        if a region of interest is given or if the chunk size is not
+        positive.
+
+    Notes
+    -----
+    -   The errors raised by an item are reported by its result and do not
+        interrupt the batch. A worker process crashing fails the items being
+        processed and the pool is restarted for the remaining items, the
+        shared memory blocks the crashed chunks may have left are reclaimed
+        by the resource tracker at exit.
+    -   At most two chunks per worker process are in flight so that the
+        memory used by the batch is bounded.
+
+    Examples
+    --------
+    >>> CFA = np.random.random([4, 6])
+    >>> for result in demosaicing_CFA_Bayer_batch([CFA, np.zeros(3)], workers=2):
+    ...     print(result.index, result.error is None)
+    0 True
+    1 False
+    """
+
+    method = validate_method(method, tuple(DEMOSAICING_CFA_BAYER_METHODS))
+    function = DEMOSAICING_CFA_BAYER_METHODS[method]
+
+    if unsupported := sorted(set(kwargs) - set(filter_kwargs(function, **kwargs))):
+        raise ValueError(
+            f'"{method}" method does not support the {unsupported} keyword arguments!'
+        )
+
+    if kwargs.get("roi") is not None:
+        raise ValueError('"roi" argument is not supported by the batch demosaicing!')
+
+    # The worker processes do not inherit the compute backend in use when
+    # forked from a server process.
+    kwargs = filter_kwargs(
+        function,
+        **{
+            "backend": get_backend_demosaicing_CFA_Bayer(),
+            **kwargs,
+            "layout": validate_method(layout, LAYOUTS_RGB),
+        },
+    )
+    dtype = np.dtype(optional(dtype, DTYPE_FLOAT_DEFAULT)).type
+    reader = optional(reader, _read_CFA)
+    workers = workers_count(workers)
+
+    if chunk_size < 1:
+        raise ValueError(f'"chunk_size" {chunk_size} must be positive!')
+
+    items = enumerate(items)
+    # Futures in submission order with the indexes of their chunks items, the
+    # shared memory blocks of their inputs and their executor.
+    pending: deque = deque()
+    executors = [_executor(workers)]
+
+    def restart(executor: ProcessPoolExecutor) -> None:
+        """Restart given broken executor unless it was already restarted."""
+
+        if executor is executors[-1]:
+            executor.shutdown(wait=True)
+            executors.append(_executor(workers))
+
+    def submit() -> bool:
+        """Submit the next chunk of items, return whether there was one."""
+
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return False
+
+        shared_memories, chunk_items = [], []
+        for index, item in chunk:
+            if isinstance(item, (str, os.PathLike)):
+                chunk_items.append((index, ("path", item)))
+            else:
+                CFA = np.asarray(item)
+                shared_memory, CFA_s = _shared_array(CFA.shape, CFA.dtype)
+                CFA_s[...] = CFA
+                del CFA_s
+                shared_memories.append(shared_memory)
+                chunk_items.append(
+                    (
+                        index,
+                        ("array", (shared_memory.name, CFA.shape, CFA.dtype.str)),
+                    )
+                )
+
+        arguments = (chunk_items, method, pattern, dtype, reader, kwargs)
+        executor = executors[-1]
+        try:
+            future = executor.submit(_demosaicing_chunk, *arguments)
+        except BrokenProcessPool:
+            restart(executor)
+            executor = executors[-1]
+            future = executor.submit(_demosaicing_chunk, *arguments)
+
+        pending.append(
+            (future, [index for index, _item in chunk], shared_memories, executor)
+        )
+
+        return True
+
+    def collect(
+        future: Future,
+        indexes: List[int],
+        shared_memories: List[SharedMemory],
+        executor: ProcessPoolExecutor,
+    ) -> List[DemosaicingBatchResult]:
+        """Collect the results of given completed chunk."""
+
+        for shared_memory in shared_memories:
+            _release(shared_memory)
+
+        try:
+            results = future.result()
+        except Exception as error:
+            if isinstance(error, BrokenProcessPool):
+                # The chunks in flight are lost with the crashed pool.
+                restart(executor)
+
+            return [DemosaicingBatchResult(index, error=error) for index in indexes]
+
+        batch_results = []
+        for index, output, error in results:
+            if error is not None:
+                batch_results.append(DemosaicingBatchResult(index, error=error))
+                continue
+
+            name, shape = output
+            shared_memory = SharedMemory(name)
+            RGB_s = np.ndarray(shape, dtype, buffer=shared_memory.buf)
+            RGB = np.copy(RGB_s)
+            del RGB_s
+            _release(shared_memory)
+            batch_results.append(DemosaicingBatchResult(index, RGB))
+
+        return batch_results
+
+    try:
+        while len(pending) < 2 * workers and submit():
+            pass
+
+        while pending:
+            if ordered:
+                entry = pending[0]
+            else:
+                done, _not_done = wait(
+                    [entry[0] for entry in pending], return_when=FIRST_COMPLETED
+                )
+                entry = next(entry for entry in pending if entry[0] in done)
+
+            wait([entry[0]])
+            pending.remove(entry)
+
+            yield from collect(*entry)
+
+            while len(pending) < 2 * workers and submit():
+                pass
+    finally:
+        # Releasing the shared memory blocks of the abandoned chunks, e.g.,
+        # when the generator is closed early.
+        for entry in pending:
+            entry[0].cancel()
+            wait([entry[0]])
+            collect(*entry)
+
+        executors[-1].shutdown(wait=True)
@@ -13,12 +13,41 @@ References
 
 from __future__ import annotations
 
+from functools import partial
+
 import numpy as np
-from colour.hints import ArrayLike, Literal, NDArrayFloat
-from colour.utilities import as_float_array, tstack
+from colour.hints import (
+    Any,
+    ArrayLike,
+    DTypeFloat,
+    Literal,
+    NDArray,
+    NDArrayFloat,
+    NDArrayInt,
+    Tuple,
+    Type,
+)
+from colour.utilities import as_float_array
 from scipy.ndimage.filters import convolve
 
-from colour_demosaicing.bayer import masks_CFA_Bayer
+from colour_demosaicing.bayer import masks_CFA_Bayer, offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.backends import (
+    function_backend_demosaicing_CFA_Bayer,
+)
+from colour_demosaicing.bayer.demosaicing.common import (
+    as_integer_CFA,
+    evaluate_branches,
+    is_integer_dtype,
+    output_array,
+    planes_RGB,
+    round_fixed_point,
+    shape_RGB,
+    workers_count,
+)
+from colour_demosaicing.bayer.demosaicing.workspace import (
+    Workspace,
+    buffer_workspace,
+)
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -32,9 +61,162 @@ __all__ = [
 ]
 
 
+# Kernels scaled by 4, the fixed-point path uses them as they are.
+_H_G: NDArrayFloat = np.array(
+    [
+        [0.0, 1.0, 0.0],
+        [1.0, 4.0, 1.0],
+        [0.0, 1.0, 0.0],
+    ]
+)
+
+_H_RB: NDArrayFloat = np.array(
+    [
+        [1.0, 2.0, 1.0],
+        [2.0, 4.0, 2.0],
+        [1.0, 2.0, 1.0],
+    ]
+)
+
+
+def _phase(a: NDArrayFloat, y: int, x: int, d_y: int = 0, d_x: int = 0) -> NDArrayFloat:
+    """
+    Return the samples of given array at the interior sites, i.e., excluding
+    the border, of the *Bayer* CFA phase at given offset, displaced by given
+    number of rows and columns.
+    """
+
+    height, width = a.shape[-2:]
+
+    return a[..., 2 - y + d_y : height - 1 + d_y : 2, 2 - x + d_x : width - 1 + d_x : 2]
+
+
+def _strips(a: NDArray, axis: Literal[-2, -1]) -> Tuple[NDArray, NDArray]:
+    """
+    Return the first and last 2 pixels wide strips of given array along given
+    axis.
+    """
+
+    if axis == -2:
+        return a[..., :2, :], a[..., -2:, :]
+
+    return a[..., :2], a[..., -2:]
+
+
+def _demosaicing_CFA_Bayer_bilinear_integer(
+    CFA: ArrayLike,
+    pattern: str,
+    dtype: Type[DTypeFloat] | Any,
+    out: NDArrayInt | None,
+    workspace: Workspace | None,
+    layout: str,
+) -> NDArrayInt:
+    """
+    Return the demosaiced integer *RGB* colourspace array from given integer
+    *Bayer* CFA using bilinear interpolation with fixed-point arithmetic.
+    """
+
+    CFA = as_integer_CFA(CFA, dtype)
+    masks = masks_CFA_Bayer(CFA.shape[-2:], pattern)
+    maximum = np.iinfo(dtype).max
+
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), dtype)
+
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
+
+    # The kernels are broadcast along the batch dimensions.
+    H_G = np.expand_dims(_H_G, tuple(range(CFA.ndim - 2)))
+    H_RB = np.expand_dims(_H_RB, tuple(range(CFA.ndim - 2)))
+
+    def interpolate(
+        C: NDArrayInt,
+        y: int,
+        x: int,
+        displacements: Tuple[Tuple[int, int], ...],
+    ) -> None:
+        """
+        Write the mean of the displaced samples at the interior sites of the
+        *Bayer* CFA phase at given offset into given colour component.
+        """
+
+        C_p = _phase(C, y, x)
+        A = buffer_workspace(workspace, "A_i", C_p.shape, np.int32)
+
+        (d_y, d_x), *displacements = displacements
+        A[...] = _phase(CFA, y, x, d_y, d_x)
+        for d_y, d_x in displacements:
+            A += _phase(CFA, y, x, d_y, d_x)
+
+        # Scaling the sums of 2 samples by 2 so that all the sums are scaled
+        # by 4.
+        if len(displacements) == 1:
+            A <<= 1
+
+        C_p[...] = round_fixed_point(A, 2, maximum)
+
+    planes = planes_RGB(RGB, layout)
+
+    N_row, N_column = ((0, -1), (0, 1)), ((-1, 0), (1, 0))
+    N_cross = ((-1, 0), (0, -1), (0, 1), (1, 0))
+    N_diagonal = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+    for i, (sites, samples) in enumerate(
+        (
+            (
+                ((R_y, R_x),),
+                (
+                    ((G_r_y, G_r_x), N_row),
+                    ((G_b_y, G_b_x), N_column),
+                    ((B_y, B_x), N_diagonal),
+                ),
+            ),
+            (
+                ((G_r_y, G_r_x), (G_b_y, G_b_x)),
+                (((R_y, R_x), N_cross), ((B_y, B_x), N_cross)),
+            ),
+            (
+                ((B_y, B_x),),
+                (
+                    ((G_b_y, G_b_x), N_row),
+                    ((G_r_y, G_r_x), N_column),
+                    ((R_y, R_x), N_diagonal),
+                ),
+            ),
+        )
+    ):
+        C = planes[i]
+
+        for y, x in sites:
+            C[..., y::2, x::2] = np.minimum(CFA[..., y::2, x::2], maximum)
+
+        for (y, x), displacements in samples:
+            interpolate(C, y, x, displacements)
+
+        # The border samples depend on the reflected masked planes and are
+        # computed by convolving the masked planes of the first and last 2
+        # pixels wide strips stacked together.
+        H = H_G if i == 1 else H_RB
+        for axis in (-2, -1):
+            CFA_m = np.concatenate(_strips(CFA, axis), axis) * np.concatenate(
+                _strips(masks[i], axis), axis
+            )
+            border = (..., [0, -1], slice(None)) if axis == -2 else (..., [0, -1])
+            C[border] = round_fixed_point(convolve(CFA_m, H)[border], 2, maximum)
+
+    return RGB
+
+
 def demosaicing_CFA_Bayer_bilinear(
     CFA: ArrayLike,
     pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    workspace: Workspace | None = None,
+    workers: int | None = None,
+    concurrent: bool = False,
+    roi: Tuple[int, int, int, int] | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    backend: Literal["SciPy", "Numba", "PyTorch"] | str | None = None,
 ) -> NDArrayFloat:
     """
     Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
@@ -43,9 +225,49 @@ def demosaicing_CFA_Bayer_bilinear(
     Parameters
     ----------
     CFA
-        *Bayer* CFA.
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
     pattern
         Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute. Given the
+        *uint8* or *uint16* data type, the *RGB* colourspace array is
+        computed from the integer *Bayer* CFA with fixed-point arithmetic,
+        rounded and saturated into that data type.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    workspace
+        Workspace owning the scratch buffers, they are allocated for this
+        call only if not given.
+    workers
+        Number of threads demosaicing the *Bayer* CFA by tiles with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_tiled`
+        definition, the negative values wrap around the number of CPUs, i.e.,
+        -1 uses all the CPUs. The tiles use their own workspaces.
+    concurrent
+        Whether to evaluate the independent filter branches concurrently with
+        a thread pool, lowering the latency on multi-core machines at the
+        expense of scratch buffers per branch.
+    roi
+        Region of interest :math:`(y_0, y_1, x_0, x_1)` to demosaic with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_roi` definition,
+        the result is that region of the full frame *RGB* colourspace array.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`, the planes being then written directly into
+        the output array, e.g., the input buffer of a neural network.
+    backend
+        Compute backend, the one set with the
+        :func:`colour_demosaicing.bayer.set_backend_demosaicing_CFA_Bayer`
+        definition if not given, i.e., *SciPy* by default. The *Numba* and
+        *PyTorch* backends parallelise the computations themselves: the
+        ``workspace``, ``workers`` and ``concurrent`` arguments only apply to
+        the *SciPy* backend, which the integer data types always use. The
+        *PyTorch* backend returns a :class:`torch.Tensor` class instance.
 
     Returns
     -------
@@ -60,6 +282,13 @@ def demosaicing_CFA_Bayer_bilinear(
         `Jupyter Notebook <https://github.com/colour-science/colour-hdri/\
 blob/develop/colour_hdri/examples/\
 examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
+    -   The missing samples are interpolated on each phase of the *Bayer* CFA
+        directly from the neighbouring samples instead of convolving the
+        masked red, green and blue planes, only the border samples, which
+        depend on the reflected masked planes, are computed by convolution.
+    -   The fixed-point path accumulates the filters coefficients scaled by 4
+        in *int32*, its result is identical to the floating point result
+        rounded half up and saturated.
 
     References
     ----------
@@ -102,35 +331,162 @@ examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
             [ 0.67058827,  0.18431373,  0.10196078]]])
     """
 
-    CFA = np.squeeze(as_float_array(CFA))
-    R_m, G_m, B_m = masks_CFA_Bayer(CFA.shape, pattern)
+    if roi is not None:
+        # Importing here as the tiling module depends on this definition.
+        from colour_demosaicing.bayer.demosaicing.tiling import (  # noqa: PLC0415
+            demosaicing_CFA_Bayer_roi,
+        )
 
-    H_G = (
-        as_float_array(
-            [
-                [0, 1, 0],
-                [1, 4, 1],
-                [0, 1, 0],
-            ]
+        return demosaicing_CFA_Bayer_roi(
+            CFA,
+            roi,
+            pattern,
+            "Bilinear",
+            dtype=dtype,
+            out=out,
+            workspace=workspace,
+            workers=workers,
+            concurrent=concurrent,
+            layout=layout,
+            backend=backend,
         )
-        / 4
+
+    function = function_backend_demosaicing_CFA_Bayer(
+        "demosaicing_CFA_Bayer_bilinear", backend
     )
+    if function is not None and not is_integer_dtype(dtype):
+        return function(
+            CFA,
+            pattern,
+            dtype=dtype,
+            out=out,
+            layout=layout,
+        )
 
-    H_RB = (
-        as_float_array(
-            [
-                [1, 2, 1],
-                [2, 4, 2],
-                [1, 2, 1],
-            ]
+    if workers_count(workers) > 1:
+        # Importing here as the tiling module depends on this definition.
+        from colour_demosaicing.bayer.demosaicing.tiling import (  # noqa: PLC0415
+            demosaicing_CFA_Bayer_tiled,
         )
-        / 4
-    )
 
-    R = convolve(CFA * R_m, H_RB)
-    G = convolve(CFA * G_m, H_G)
-    B = convolve(CFA * B_m, H_RB)
+        return demosaicing_CFA_Bayer_tiled(
+            CFA,
+            pattern,
+            "Bilinear",
+            dtype=dtype,
+            out=out,
+            workers=workers,
+            concurrent=concurrent,
+            layout=layout,
+            backend=backend,
+        )
+
+    if is_integer_dtype(dtype):
+        return _demosaicing_CFA_Bayer_bilinear_integer(
+            CFA, pattern, dtype, out, workspace, layout
+        )
+
+    CFA = np.squeeze(as_float_array(CFA, dtype))
+    R_m, G_m, B_m = masks_CFA_Bayer(CFA.shape[-2:], pattern)
+
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), CFA.dtype)
+    R, G, B = planes_RGB(RGB, layout)
+
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
 
-    del R_m, G_m, B_m, H_RB, H_G
+    # The kernels are broadcast along the batch dimensions, the convolutions
+    # being performed in double precision the *dtype* of the kernels does not
+    # matter.
+    H_G = np.expand_dims(_H_G / 4, tuple(range(CFA.ndim - 2)))
+    H_RB = np.expand_dims(_H_RB / 4, tuple(range(CFA.ndim - 2)))
+
+    def demosaicing_border(
+        i: int, C: NDArrayFloat, C_m: NDArrayFloat, H: NDArrayFloat
+    ) -> None:
+        """
+        Interpolate the border samples of given colour component, they depend
+        on the reflected masked planes and are computed by convolving the
+        masked planes of the first and last 2 pixels wide strips stacked
+        together: the reflection only involves their outer rows or columns,
+        halving the number of convolutions of small arrays.
+        """
+
+        for j, axis in enumerate((-2, -1)):
+            # The scratch buffers are shared by the colour components unless
+            # they are interpolated concurrently.
+            key = (j, i) if concurrent else j
+            CFA_s = np.concatenate(_strips(CFA, axis), axis)
+            CFA_m = buffer_workspace(workspace, ("CFA_m", key), CFA_s.shape, CFA.dtype)
+            CFA_c = buffer_workspace(workspace, ("CFA_c", key), CFA_s.shape, CFA.dtype)
+            np.multiply(CFA_s, np.concatenate(_strips(C_m, axis), axis), out=CFA_m)
+            border = (..., [0, -1], slice(None)) if axis == -2 else (..., [0, -1])
+            C[border] = convolve(CFA_m, H, output=CFA_c)[border]
+
+    def demosaicing_G() -> None:
+        """Interpolate the green component at the red and blue sites."""
+
+        G[..., G_r_y::2, G_r_x::2] = CFA[..., G_r_y::2, G_r_x::2]
+        G[..., G_b_y::2, G_b_x::2] = CFA[..., G_b_y::2, G_b_x::2]
+
+        for y, x in ((R_y, R_x), (B_y, B_x)):
+            G_p = _phase(G, y, x)
+            np.add(_phase(CFA, y, x, -1, 0), _phase(CFA, y, x, 0, -1), out=G_p)
+            G_p += _phase(CFA, y, x, 0, 1)
+            G_p += _phase(CFA, y, x, 1, 0)
+            G_p *= 0.25
+
+        demosaicing_border(1, G, G_m, H_G)
+
+    def demosaicing_RB(
+        i: int,
+        C: NDArrayFloat,
+        C_m: NDArrayFloat,
+        sites: Tuple[Tuple[int, int], ...],
+    ) -> None:
+        """
+        Interpolate given red or blue component at the green sites on its rows
+        and columns, and at the diagonally opposite sites.
+        """
+
+        (y_C, x_C), (y_r, x_r), (y_c, x_c), (y_d, x_d) = sites
+
+        C[..., y_C::2, x_C::2] = CFA[..., y_C::2, x_C::2]
+
+        C_p = _phase(C, y_r, x_r)
+        np.add(_phase(CFA, y_r, x_r, 0, -1), _phase(CFA, y_r, x_r, 0, 1), out=C_p)
+        C_p *= 0.5
+
+        C_p = _phase(C, y_c, x_c)
+        np.add(_phase(CFA, y_c, x_c, -1, 0), _phase(CFA, y_c, x_c, 1, 0), out=C_p)
+        C_p *= 0.5
+
+        C_p = _phase(C, y_d, x_d)
+        np.add(_phase(CFA, y_d, x_d, -1, -1), _phase(CFA, y_d, x_d, -1, 1), out=C_p)
+        C_p += _phase(CFA, y_d, x_d, 1, -1)
+        C_p += _phase(CFA, y_d, x_d, 1, 1)
+        C_p *= 0.25
+
+        demosaicing_border(i, C, C_m, H_RB)
+
+    evaluate_branches(
+        [
+            partial(
+                demosaicing_RB,
+                0,
+                R,
+                R_m,
+                ((R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x)),
+            ),
+            demosaicing_G,
+            partial(
+                demosaicing_RB,
+                2,
+                B,
+                B_m,
+                ((B_y, B_x), (G_b_y, G_b_x), (G_r_y, G_r_x), (R_y, R_x)),
+            ),
+        ],
+        concurrent,
+    )
 
-    return tstack([R, G, B])
+    return RGB
@@ -0,0 +1,807 @@
+"""
+Common Bayer CFA Demosaicing Utilities
+======================================
+
+Define the common objects used by the *Bayer* CFA (Colour Filter Array)
+demosaicing algorithms evaluating their filters only at the sites of given
+*Bayer* CFA phases.
+
+The arrays the filters are evaluated on are padded by 2 pixels so that the
+displaced samples of a phase are strided views and the taps are accumulated
+in the same order than the :mod:`scipy.ndimage` definitions, the results are
+thus identical to those of the full frame convolutions.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+import numpy as np
+from colour.hints import (
+    Any,
+    ArrayLike,
+    Callable,
+    DTypeFloat,
+    List,
+    Literal,
+    NDArray,
+    NDArrayFloat,
+    NDArrayInt,
+    Sequence,
+    Tuple,
+    Type,
+)
+from colour.utilities import as_float_array, validate_method
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "PADDING",
+    "shape_phase",
+    "phase",
+    "pad",
+    "fill_margins",
+    "convolve_phase",
+    "convolve1d_phase",
+    "output_array",
+    "LAYOUTS_RGB",
+    "shape_RGB",
+    "planes_RGB",
+    "is_integer_dtype",
+    "as_array_CFA",
+    "as_integer_CFA",
+    "round_fixed_point",
+    "workers_count",
+    "evaluate_branches",
+]
+
+PADDING: int = 2
+"""Padding of the arrays the filters are evaluated on."""
+
+
+def shape_phase(shape: Tuple[int, ...], y: int, x: int) -> Tuple[int, ...]:
+    """
+    Return the shape of the *Bayer* CFA phase at given offset.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA, the last two dimensions are the rows and
+        columns of the pixel array.
+    y
+        Row offset of the phase.
+    x
+        Column offset of the phase.
+
+    Returns
+    -------
+    :class:`tuple`
+        Shape of the phase.
+
+    Examples
+    --------
+    >>> shape_phase((5, 4), 1, 1)
+    (2, 2)
+    >>> shape_phase((3, 5, 4), 0, 0)
+    (3, 3, 2)
+    """
+
+    return (*shape[:-2], (shape[-2] - y + 1) // 2, (shape[-1] - x + 1) // 2)
+
+
+def phase(
+    a_p: NDArrayFloat,
+    y: int,
+    x: int,
+    shape: Tuple[int, ...],
+    d_y: int = 0,
+    d_x: int = 0,
+) -> NDArrayFloat:
+    """
+    Return the samples of given padded array at the sites of the *Bayer* CFA
+    phase at given offset, displaced by given number of rows and columns.
+
+    Parameters
+    ----------
+    a_p
+        Array padded by :attr:`PADDING` pixels along its last two axes.
+    y
+        Row offset of the phase.
+    x
+        Column offset of the phase.
+    shape
+        Shape of the phase, only its last two dimensions are used.
+    d_y
+        Row displacement in domain [-:attr:`PADDING`, :attr:`PADDING`].
+    d_x
+        Column displacement in domain [-:attr:`PADDING`, :attr:`PADDING`].
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Strided view of the samples.
+
+    Examples
+    --------
+    >>> a_p = pad(np.arange(16).reshape([4, 4]), "constant")
+    >>> phase(a_p, 0, 1, (2, 2))
+    array([[ 1,  3],
+           [ 9, 11]])
+    >>> phase(a_p, 0, 1, (2, 2), 0, 1)
+    array([[ 2,  0],
+           [10,  0]])
+    """
+
+    n_y, n_x = shape[-2:]
+    i, j = PADDING + y + d_y, PADDING + x + d_x
+
+    return a_p[..., i : i + 2 * n_y : 2, j : j + 2 * n_x : 2]
+
+
+def pad(
+    a: NDArrayFloat,
+    mode: Literal["constant", "mirror", "reflect"] = "mirror",
+    out: NDArrayFloat | None = None,
+) -> NDArrayFloat:
+    """
+    Pad given array by :attr:`PADDING` pixels along its last two axes.
+
+    Parameters
+    ----------
+    a
+        Array to pad.
+    mode
+        Padding mode, using the :mod:`scipy.ndimage` naming, i.e., *mirror*
+        mode is :func:`numpy.pad` definition *reflect* mode and *reflect*
+        mode is :func:`numpy.pad` definition *symmetric* mode.
+    out
+        Array to write the padded array into, a new array is allocated if
+        not given.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Padded array.
+
+    Examples
+    --------
+    >>> pad(np.array([[0, 1, 2]]))
+    array([[2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0]])
+    >>> pad(np.array([[0, 1, 2]]), "reflect", np.empty((5, 7), dtype=int))
+    array([[1, 0, 0, 1, 2, 2, 1],
+           [1, 0, 0, 1, 2, 2, 1],
+           [1, 0, 0, 1, 2, 2, 1],
+           [1, 0, 0, 1, 2, 2, 1],
+           [1, 0, 0, 1, 2, 2, 1]])
+    """
+
+    if out is None:
+        return np.pad(
+            a,
+            [(0, 0)] * (a.ndim - 2) + [(PADDING, PADDING)] * 2,
+            mode={"constant": "constant", "mirror": "reflect", "reflect": "symmetric"}[
+                mode
+            ],
+        )
+
+    out[..., PADDING:-PADDING, PADDING:-PADDING] = a
+    fill_margins(out, mode)
+
+    return out
+
+
+def _index_axis(axis: Literal[-2, -1], s: slice | NDArrayInt) -> Tuple[Any, ...]:
+    """Return the index selecting given slice along given trailing axis."""
+
+    return (..., s, slice(None)) if axis == -2 else (..., s)
+
+
+def fill_margins(
+    a_p: NDArrayFloat,
+    mode: Literal["constant", "mirror", "reflect"] = "mirror",
+) -> None:
+    """
+    Fill in-place the margins of given padded array from its interior.
+
+    Parameters
+    ----------
+    a_p
+        Array padded by :attr:`PADDING` pixels along its last two axes.
+    mode
+        Padding mode, using the :mod:`scipy.ndimage` naming, see
+        :func:`colour_demosaicing.bayer.demosaicing.common.pad` definition.
+
+    Examples
+    --------
+    >>> a_p = pad(np.array([[0, 1, 2]]), "constant")
+    >>> fill_margins(a_p)
+    >>> a_p
+    array([[2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0],
+           [2, 1, 0, 1, 2, 1, 0]])
+    """
+
+    # The rows margins are filled first so that the columns margins fill the
+    # corners, as :func:`numpy.pad` definition does. The axes are indexed
+    # directly rather than moved, the margins being small.
+    for axis in (-2, -1):
+        size = a_p.shape[axis] - 2 * PADDING
+        index = partial(_index_axis, axis)
+
+        if mode == "constant":
+            a_p[index(slice(None, PADDING))] = 0
+            a_p[index(slice(PADDING + size, None))] = 0
+        elif size > PADDING:
+            # The margins do not repeat the interior.
+            d = 0 if mode == "mirror" else 1
+            a_p[index(slice(None, PADDING))] = a_p[
+                index(slice(2 * PADDING - d, PADDING - d, -1))
+            ]
+            a_p[index(slice(PADDING + size, None))] = a_p[
+                index(slice(PADDING + size - 2 + d, size - 2 + d, -1))
+            ]
+        else:
+            source = np.pad(
+                np.arange(size),
+                PADDING,
+                mode="reflect" if mode == "mirror" else "symmetric",
+            )
+            margins = np.hstack(
+                [np.arange(PADDING), np.arange(PADDING + size, 2 * PADDING + size)]
+            )
+            a_p[index(margins)] = a_p[index(source[margins] + PADDING)]
+
+
+def convolve_phase(
+    a_p: NDArrayFloat,
+    h: ArrayLike,
+    y: int,
+    x: int,
+    out: NDArrayFloat,
+    buffer: NDArrayFloat | None = None,
+) -> NDArrayFloat:
+    """
+    Convolve given padded array with given kernel at the sites of the *Bayer*
+    CFA phase at given offset only.
+
+    The non-zero taps are accumulated in the same order than
+    :func:`scipy.ndimage.convolve` definition, their weights are applied as
+    *Python* scalars, i.e., in the *dtype* of given padded array.
+
+    Parameters
+    ----------
+    a_p
+        Array padded by :attr:`PADDING` pixels along its last two axes.
+    h
+        Kernel whose radius is not greater than :attr:`PADDING`.
+    y
+        Row offset of the phase.
+    x
+        Column offset of the phase.
+    out
+        Array to write the result into.
+    buffer
+        Scratch array with the same shape than ``out``, a new array is
+        allocated if not given.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Convolved samples, i.e., ``out``.
+
+    Examples
+    --------
+    >>> a_p = pad(np.arange(16.0).reshape([4, 4]))
+    >>> h = np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0]]) / 4
+    >>> convolve_phase(a_p, h, 0, 0, np.empty((2, 2)))
+    array([[  2.5,   4. ],
+           [  8.5,  10. ]])
+    """
+
+    shape = out.shape
+    h = np.asarray(h)
+    r_y, r_x = h.shape[0] // 2, h.shape[1] // 2
+
+    # The taps are iterated as *Python* scalars, iterating the kernel and
+    # indexing it with *Numpy* scalars dominating the cost on small arrays.
+    taps = [
+        (i - r_y, j - r_x, w)
+        for i, row in enumerate(h[::-1, ::-1].tolist())
+        for j, w in enumerate(row)
+        if w != 0
+    ]
+
+    S = buffer
+    for k, (d_y, d_x, w) in enumerate(taps):
+        a_s = phase(a_p, y, x, shape, d_y, d_x)
+        if k == 0:
+            np.multiply(a_s, w, out=out)
+        else:
+            S = np.multiply(a_s, w, out=S)
+            out += S
+
+    return out
+
+
+def convolve1d_phase(
+    a_p: NDArrayFloat,
+    h: ArrayLike,
+    y: int,
+    x: int,
+    axis: Literal[0, 1],
+    out: NDArrayFloat,
+    buffer: NDArrayFloat | None = None,
+) -> NDArrayFloat:
+    """
+    Convolve given padded array with given symmetric 1-D kernel along given
+    axis at the sites of the *Bayer* CFA phase at given offset only.
+
+    The non-zero taps are accumulated in the same order than
+    :func:`scipy.ndimage.convolve1d` definition for symmetric kernels, their
+    weights are applied as *Python* scalars, i.e., in the *dtype* of given
+    padded array.
+
+    Parameters
+    ----------
+    a_p
+        Array padded by :attr:`PADDING` pixels along its last two axes.
+    h
+        Symmetric 1-D kernel whose radius is not greater than
+        :attr:`PADDING`.
+    y
+        Row offset of the phase.
+    x
+        Column offset of the phase.
+    axis
+        Axis of the pixel array along which to convolve, i.e., 0 to convolve
+        vertically and 1 to convolve horizontally.
+    out
+        Array to write the result into.
+    buffer
+        Scratch array with the same shape than ``out``, a new array is
+        allocated if not given.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Convolved samples, i.e., ``out``.
+
+    Examples
+    --------
+    >>> a_p = pad(np.arange(16.0).reshape([4, 4]))
+    >>> convolve1d_phase(a_p, np.array([0.5, 0, 0.5]), 0, 0, 1, np.empty((2, 2)))
+    array([[  1.,   2.],
+           [  9.,  10.]])
+    """
+
+    shape = out.shape
+    h = np.asarray(h).tolist()
+    r = len(h) // 2
+    u_y, u_x = (1, 0) if axis == 0 else (0, 1)
+
+    initialised = False
+    if h[r] != 0:
+        np.multiply(phase(a_p, y, x, shape), h[r], out=out)
+        initialised = True
+
+    S = buffer
+    for d in range(r, 0, -1):
+        if h[r - d] == 0:
+            continue
+
+        S = np.add(
+            phase(a_p, y, x, shape, -d * u_y, -d * u_x),
+            phase(a_p, y, x, shape, d * u_y, d * u_x),
+            out=S,
+        )
+        S *= h[r - d]
+        if initialised:
+            out += S
+        else:
+            out[...] = S
+            initialised = True
+
+    return out
+
+
+def output_array(
+    out: NDArrayFloat | None,
+    shape: Tuple[int, ...],
+    dtype: Type[DTypeFloat] | Any,
+) -> NDArrayFloat:
+    """
+    Return given output array after checking its shape and *dtype*, or a new
+    array if it is not given.
+
+    Parameters
+    ----------
+    out
+        Output array.
+    shape
+        Expected shape.
+    dtype
+        Expected *dtype*.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Output array.
+
+    Raises
+    ------
+    ValueError
+        If the output array shape or *dtype* does not match the expected
+        ones.
+
+    Examples
+    --------
+    >>> output_array(None, (2, 2, 3), np.float64).shape
+    (2, 2, 3)
+    """
+
+    if out is None:
+        return np.empty(shape, dtype)
+
+    if out.shape != tuple(shape) or out.dtype != dtype:
+        raise ValueError(
+            f'"out" array shape {out.shape} and "{out.dtype}" dtype do not '
+            f'match the expected {tuple(shape)} shape and "{np.dtype(dtype)}" '
+            f"dtype!"
+        )
+
+    return out
+
+
+LAYOUTS_RGB: Tuple[str, ...] = ("interleaved", "planar")
+"""
+Supported layouts of the *RGB* colourspace arrays: *interleaved*, i.e., the
+channels are the last axis, and *planar*, i.e., the channels are the axis
+preceding the rows and columns.
+"""
+
+
+def shape_RGB(
+    shape: Tuple[int, ...],
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> Tuple[int, ...]:
+    """
+    Return the shape of the *RGB* colourspace array demosaiced from a *Bayer*
+    CFA with given shape, in given layout.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA, the last two dimensions are the rows and
+        columns of the pixel array.
+    layout
+        Layout of the *RGB* colourspace array, see
+        :attr:`colour_demosaicing.bayer.demosaicing.common.LAYOUTS_RGB`
+        attribute.
+
+    Returns
+    -------
+    :class:`tuple`
+        Shape of the *RGB* colourspace array.
+
+    Examples
+    --------
+    >>> shape_RGB((2, 4, 6))
+    (2, 4, 6, 3)
+    >>> shape_RGB((2, 4, 6), "planar")
+    (2, 3, 4, 6)
+    """
+
+    layout = validate_method(layout, LAYOUTS_RGB)
+
+    if layout == "planar":
+        return (*shape[:-2], 3, *shape[-2:])
+
+    return (*shape, 3)
+
+
+def planes_RGB(
+    RGB: NDArray,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+) -> Tuple[NDArray, NDArray, NDArray]:
+    """
+    Return the red, green and blue planes of given *RGB* colourspace array in
+    given layout, i.e., views writing into it.
+
+    Parameters
+    ----------
+    RGB
+        *RGB* colourspace array.
+    layout
+        Layout of the *RGB* colourspace array, see
+        :attr:`colour_demosaicing.bayer.demosaicing.common.LAYOUTS_RGB`
+        attribute.
+
+    Returns
+    -------
+    :class:`tuple`
+        Red, green and blue planes.
+
+    Examples
+    --------
+    >>> RGB = np.zeros((3, 2, 4))
+    >>> R, G, B = planes_RGB(RGB, "planar")
+    >>> G[...] = 1
+    >>> RGB[1]
+    array([[ 1.,  1.,  1.,  1.],
+           [ 1.,  1.,  1.,  1.]])
+    """
+
+    layout = validate_method(layout, LAYOUTS_RGB)
+
+    if layout == "planar":
+        return RGB[..., 0, :, :], RGB[..., 1, :, :], RGB[..., 2, :, :]
+
+    return RGB[..., 0], RGB[..., 1], RGB[..., 2]
+
+
+def is_integer_dtype(dtype: Type[DTypeFloat] | Any | None) -> bool:
+    """
+    Return whether given *dtype* is an integer *dtype*, i.e., whether the
+    fixed-point path of the demosaicing definitions supporting it is used.
+
+    Parameters
+    ----------
+    dtype
+        *dtype* to test.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the *dtype* is an integer *dtype*.
+
+    Examples
+    --------
+    >>> is_integer_dtype(np.uint16)
+    True
+    >>> is_integer_dtype(None)
+    False
+    """
+
+    return dtype is not None and np.issubdtype(np.dtype(dtype), np.integer)
+
+
+def as_array_CFA(
+    CFA: ArrayLike, dtype: Type[DTypeFloat] | Any | None = None
+) -> NDArray:
+    """
+    Return given *Bayer* CFA converted to given floating point *dtype*, or
+    unchanged if given an integer *dtype*, the fixed-point path validating and
+    converting its samples.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA.
+    dtype
+        *dtype* the computations are performed with.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *Bayer* CFA.
+
+    Examples
+    --------
+    >>> as_array_CFA([[0, 1]], np.uint8).dtype
+    dtype('int64')
+    >>> as_array_CFA([[0, 1]], np.float32).dtype
+    dtype('float32')
+    """
+
+    if is_integer_dtype(dtype):
+        return np.asarray(CFA)
+
+    return as_float_array(CFA, dtype)
+
+
+def as_integer_CFA(CFA: ArrayLike, dtype: Type[DTypeFloat] | Any) -> NDArrayInt:
+    """
+    Return given integer *Bayer* CFA as the squeezed *int32* array the
+    fixed-point path accumulates in, after validating it and the output
+    integer *dtype*.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA with unsigned or signed integer samples of at most 16
+        bits.
+    dtype
+        *uint8* or *uint16* *dtype* of the *RGB* colourspace array.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *int32* *Bayer* CFA.
+
+    Raises
+    ------
+    ValueError
+        If the *Bayer* CFA or the output *dtype* are not supported.
+
+    Examples
+    --------
+    >>> as_integer_CFA(np.array([[0, 1023]], np.uint16), np.uint16)
+    array([   0, 1023], dtype=int32)
+    """
+
+    CFA = np.squeeze(np.asarray(CFA))
+
+    if (
+        np.dtype(dtype) not in (np.uint8, np.uint16)
+        or CFA.dtype.kind not in "ui"
+        or CFA.dtype.itemsize > 2
+    ):
+        raise ValueError(
+            f'"{CFA.dtype}" CFA and "{np.dtype(dtype)}" dtype are not supported by '
+            f"the fixed-point path, it requires an integer CFA of at most 16 bits "
+            f'and a "uint8" or "uint16" dtype!'
+        )
+
+    return CFA.astype(np.int32)
+
+
+def round_fixed_point(a: NDArrayInt, shift: int, maximum: int) -> NDArrayInt:
+    """
+    Divide given fixed-point array by :math:`2^{shift}` rounding half up and
+    saturate it in domain [0, maximum], in place.
+
+    Parameters
+    ----------
+    a
+        Fixed-point array.
+    shift
+        Number of fractional bits.
+    maximum
+        Saturation value, i.e., the maximum of the output *dtype*.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Rounded and saturated array, i.e., ``a``.
+
+    Examples
+    --------
+    >>> round_fixed_point(np.array([-9, 7, 8, 300]), 4, 255)
+    array([ 0,  0,  1, 19])
+    """
+
+    if shift:
+        a += 1 << (shift - 1)
+        a >>= shift
+
+    return np.clip(a, 0, maximum, out=a)
+
+
+def workers_count(workers: int | None = None) -> int:
+    """
+    Return the number of workers to use for given ``workers`` argument.
+
+    Parameters
+    ----------
+    workers
+        Number of workers, the negative values wrap around the number of
+        CPUs as with :func:`scipy.fft.fft`, i.e., -1 uses all the CPUs.
+        *None* uses a single worker.
+
+    Returns
+    -------
+    :class:`int`
+        Number of workers.
+
+    Raises
+    ------
+    ValueError
+        If the number of workers is null or less than the opposite of the
+        number of CPUs.
+
+    Examples
+    --------
+    >>> workers_count(4)
+    4
+    >>> workers_count(-1) == os.cpu_count()
+    True
+    """
+
+    if workers is None:
+        return 1
+
+    workers = int(workers)
+    count = workers if workers > 0 else (os.cpu_count() or 1) + 1 + workers
+
+    if workers == 0 or count <= 0:
+        raise ValueError(f'"workers" {workers} is invalid!')
+
+    return count
+
+
+_EXECUTOR_BRANCHES: ThreadPoolExecutor | None = None
+"""Thread pool evaluating the independent branches, created on first use."""
+
+_LOCK_EXECUTOR_BRANCHES: threading.Lock = threading.Lock()
+"""Lock guarding the creation of the independent branches thread pool."""
+
+
+def _reset_executor_branches() -> None:
+    """
+    Reset the independent branches thread pool, its threads do not survive
+    in a forked child process.
+    """
+
+    global _EXECUTOR_BRANCHES, _LOCK_EXECUTOR_BRANCHES  # noqa: PLW0603
+
+    _EXECUTOR_BRANCHES = None
+    _LOCK_EXECUTOR_BRANCHES = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor_branches)
+
+
+def evaluate_branches(
+    branches: Sequence[Callable[[], Any]], concurrent: bool = False
+) -> List:
+    """
+    Evaluate given independent branches of a demosaicing algorithm, i.e.,
+    callables not writing into the buffers read by the other branches, and
+    return their results.
+
+    When evaluated concurrently, the first branch is evaluated by the calling
+    thread and the other ones by a shared thread pool.
+
+    Parameters
+    ----------
+    branches
+        Independent branches.
+    concurrent
+        Whether to evaluate the branches concurrently.
+
+    Returns
+    -------
+    :class:`list`
+        Results of the branches.
+
+    Examples
+    --------
+    >>> evaluate_branches([lambda: 1, lambda: 2], concurrent=True)
+    [1, 2]
+    """
+
+    global _EXECUTOR_BRANCHES  # noqa: PLW0603
+
+    if not concurrent or len(branches) < 2:
+        return [branch() for branch in branches]
+
+    with _LOCK_EXECUTOR_BRANCHES:
+        if _EXECUTOR_BRANCHES is None:
+            _EXECUTOR_BRANCHES = ThreadPoolExecutor(
+                thread_name_prefix="colour_demosaicing"
+            )
+
+    futures = [_EXECUTOR_BRANCHES.submit(branch) for branch in branches[1:]]
+    try:
+        results = [branches[0]()]
+    finally:
+        # The branches write into shared buffers, they must all be completed
+        # before returning, even on failure.
+        wait(futures)
+
+    return results + [future.result() for future in futures]
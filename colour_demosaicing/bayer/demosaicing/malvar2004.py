@@ -15,12 +15,43 @@ References
 
 from __future__ import annotations
 
+from functools import partial
+
 import numpy as np
-from colour.hints import ArrayLike, Literal, NDArrayFloat
-from colour.utilities import as_float_array, ones, tstack
-from scipy.ndimage.filters import convolve
+from colour.hints import (
+    Any,
+    ArrayLike,
+    DTypeFloat,
+    Literal,
+    NDArrayFloat,
+    NDArrayInt,
+    Tuple,
+    Type,
+)
+from colour.utilities import as_float_array
 
-from colour_demosaicing.bayer import masks_CFA_Bayer
+from colour_demosaicing.bayer import offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.backends import (
+    function_backend_demosaicing_CFA_Bayer,
+)
+from colour_demosaicing.bayer.demosaicing.common import (
+    PADDING,
+    as_integer_CFA,
+    convolve_phase,
+    evaluate_branches,
+    is_integer_dtype,
+    output_array,
+    pad,
+    planes_RGB,
+    round_fixed_point,
+    shape_phase,
+    shape_RGB,
+    workers_count,
+)
+from colour_demosaicing.bayer.demosaicing.workspace import (
+    Workspace,
+    buffer_workspace,
+)
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -33,10 +64,118 @@ __all__ = [
     "demosaicing_CFA_Bayer_Malvar2004",
 ]
 
+# Filters coefficients scaled by 8, the coefficients being multiples of 1/16,
+# the fixed-point path uses them scaled by 16.
+_GR_GB: NDArrayFloat = np.array(
+    [
+        [0.0, 0.0, -1.0, 0.0, 0.0],
+        [0.0, 0.0, 2.0, 0.0, 0.0],
+        [-1.0, 2.0, 4.0, 2.0, -1.0],
+        [0.0, 0.0, 2.0, 0.0, 0.0],
+        [0.0, 0.0, -1.0, 0.0, 0.0],
+    ]
+)
+
+_RG_RB_BG_BR: NDArrayFloat = np.array(
+    [
+        [0.0, 0.0, 0.5, 0.0, 0.0],
+        [0.0, -1.0, 0.0, -1.0, 0.0],
+        [-1.0, 4.0, 5.0, 4.0, -1.0],
+        [0.0, -1.0, 0.0, -1.0, 0.0],
+        [0.0, 0.0, 0.5, 0.0, 0.0],
+    ]
+)
+
+_RB_BB_BR_RR: NDArrayFloat = np.array(
+    [
+        [0.0, 0.0, -1.5, 0.0, 0.0],
+        [0.0, 2.0, 0.0, 2.0, 0.0],
+        [-1.5, 0.0, 6.0, 0.0, -1.5],
+        [0.0, 2.0, 0.0, 2.0, 0.0],
+        [0.0, 0.0, -1.5, 0.0, 0.0],
+    ]
+)
+
+_SHIFT_FIXED_POINT: int = 4
+"""Number of fractional bits of the fixed-point path."""
+
+
+def _demosaicing_CFA_Bayer_Malvar2004_integer(
+    CFA: ArrayLike,
+    pattern: str,
+    dtype: Type[DTypeFloat] | Any,
+    out: NDArrayInt | None,
+    workspace: Workspace | None,
+    layout: str,
+) -> NDArrayInt:
+    """
+    Return the demosaiced integer *RGB* colourspace array from given integer
+    *Bayer* CFA using *Malvar (2004)* demosaicing algorithm with fixed-point
+    arithmetic.
+    """
+
+    CFA = as_integer_CFA(CFA, dtype)
+    maximum = np.iinfo(dtype).max
+    scale = 2**_SHIFT_FIXED_POINT // 8
+
+    GR_GB = (_GR_GB * scale).astype(np.int32)
+    Rg_RB_Bg_BR = (_RG_RB_BG_BR * scale).astype(np.int32)
+    Rg_BR_Bg_RB = np.transpose(Rg_RB_Bg_BR)
+    Rb_BB_Br_RR = (_RB_BB_BR_RR * scale).astype(np.int32)
+
+    *shape_b, height, width = CFA.shape
+    CFA_p = pad(
+        CFA,
+        "reflect",
+        buffer_workspace(
+            workspace,
+            "CFA_p_i",
+            (*shape_b, height + 2 * PADDING, width + 2 * PADDING),
+            np.int32,
+        ),
+    )
+
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), dtype)
+    R, G, B = planes_RGB(RGB, layout)
+
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
+
+    # Accumulator and scratch buffer of the convolutions.
+    A = buffer_workspace(workspace, "A_i", shape_phase(CFA.shape, 0, 0), np.int32)
+    S = buffer_workspace(workspace, "S_i", shape_phase(CFA.shape, 0, 0), np.int32)
+
+    for (y, x), h_R, h_G, h_B in (
+        ((R_y, R_x), None, GR_GB, Rb_BB_Br_RR),
+        ((G_r_y, G_r_x), Rg_RB_Bg_BR, None, Rg_BR_Bg_RB),
+        ((G_b_y, G_b_x), Rg_BR_Bg_RB, None, Rg_RB_Bg_BR),
+        ((B_y, B_x), Rb_BB_Br_RR, GR_GB, None),
+    ):
+        n_y, n_x = shape_phase(CFA.shape, y, x)[-2:]
+        A_p, S_p = A[..., :n_y, :n_x], S[..., :n_y, :n_x]
+        for C, h in ((R, h_R), (G, h_G), (B, h_B)):
+            if h is None:
+                A_p[...] = CFA[..., y::2, x::2]
+                round_fixed_point(A_p, 0, maximum)
+            else:
+                convolve_phase(CFA_p, h, y, x, A_p, S_p)
+                round_fixed_point(A_p, _SHIFT_FIXED_POINT, maximum)
+
+            C[..., y::2, x::2] = A_p
+
+    return RGB
+
 
 def demosaicing_CFA_Bayer_Malvar2004(
     CFA: ArrayLike,
     pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    workspace: Workspace | None = None,
+    workers: int | None = None,
+    concurrent: bool = False,
+    roi: Tuple[int, int, int, int] | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    backend: Literal["SciPy", "Numba", "PyTorch"] | str | None = None,
 ) -> NDArrayFloat:
     """
     Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
@@ -45,9 +184,49 @@ def demosaicing_CFA_Bayer_Malvar2004(
     Parameters
     ----------
     CFA
-        *Bayer* CFA.
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
     pattern
         Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute. Given the
+        *uint8* or *uint16* data type, the *RGB* colourspace array is
+        computed from the integer *Bayer* CFA with fixed-point arithmetic,
+        rounded and saturated into that data type.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    workspace
+        Workspace owning the scratch buffers, they are allocated for this
+        call only if not given.
+    workers
+        Number of threads demosaicing the *Bayer* CFA by tiles with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_tiled`
+        definition, the negative values wrap around the number of CPUs, i.e.,
+        -1 uses all the CPUs. The tiles use their own workspaces.
+    concurrent
+        Whether to evaluate the independent filter branches concurrently with
+        a thread pool, lowering the latency on multi-core machines at the
+        expense of a scratch buffer per branch.
+    roi
+        Region of interest :math:`(y_0, y_1, x_0, x_1)` to demosaic with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_roi` definition,
+        the result is that region of the full frame *RGB* colourspace array.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`, the planes being then written directly into
+        the output array, e.g., the input buffer of a neural network.
+    backend
+        Compute backend, the one set with the
+        :func:`colour_demosaicing.bayer.set_backend_demosaicing_CFA_Bayer`
+        definition if not given, i.e., *SciPy* by default. The *Numba* and
+        *PyTorch* backends parallelise the computations themselves: the
+        ``workspace``, ``workers`` and ``concurrent`` arguments only apply to
+        the *SciPy* backend, which the integer data types always use. The
+        *PyTorch* backend returns a :class:`torch.Tensor` class instance.
 
     Returns
     -------
@@ -62,6 +241,12 @@ def demosaicing_CFA_Bayer_Malvar2004(
         `Jupyter Notebook <https://github.com/colour-science/colour-hdri/\
 blob/develop/colour_hdri/examples/\
 examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
+    -   Each filter is only evaluated at the sites of the *Bayer* CFA phases
+        it reconstructs and its result is written directly into the output
+        array.
+    -   The fixed-point path accumulates the filters coefficients scaled by
+        16 in *int32*, its result is identical to the floating point result
+        rounded half up and saturated.
 
     References
     ----------
@@ -103,84 +288,131 @@ examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
             [ 0.29803923,  0.30441178,  0.31740197]]])
     """
 
-    CFA = np.squeeze(as_float_array(CFA))
-    R_m, G_m, B_m = masks_CFA_Bayer(CFA.shape, pattern)
-
-    GR_GB = (
-        as_float_array(
-            [
-                [0.0, 0.0, -1.0, 0.0, 0.0],
-                [0.0, 0.0, 2.0, 0.0, 0.0],
-                [-1.0, 2.0, 4.0, 2.0, -1.0],
-                [0.0, 0.0, 2.0, 0.0, 0.0],
-                [0.0, 0.0, -1.0, 0.0, 0.0],
-            ]
+    if roi is not None:
+        # Importing here as the tiling module depends on this definition.
+        from colour_demosaicing.bayer.demosaicing.tiling import (  # noqa: PLC0415
+            demosaicing_CFA_Bayer_roi,
         )
-        / 8
-    )
 
-    Rg_RB_Bg_BR = (
-        as_float_array(
-            [
-                [0.0, 0.0, 0.5, 0.0, 0.0],
-                [0.0, -1.0, 0.0, -1.0, 0.0],
-                [-1.0, 4.0, 5.0, 4.0, -1.0],
-                [0.0, -1.0, 0.0, -1.0, 0.0],
-                [0.0, 0.0, 0.5, 0.0, 0.0],
-            ]
+        return demosaicing_CFA_Bayer_roi(
+            CFA,
+            roi,
+            pattern,
+            "Malvar 2004",
+            dtype=dtype,
+            out=out,
+            workspace=workspace,
+            workers=workers,
+            concurrent=concurrent,
+            layout=layout,
+            backend=backend,
         )
-        / 8
-    )
 
-    Rg_BR_Bg_RB = np.transpose(Rg_RB_Bg_BR)
+    function = function_backend_demosaicing_CFA_Bayer(
+        "demosaicing_CFA_Bayer_Malvar2004", backend
+    )
+    if function is not None and not is_integer_dtype(dtype):
+        return function(
+            CFA,
+            pattern,
+            dtype=dtype,
+            out=out,
+            layout=layout,
+        )
 
-    Rb_BB_Br_RR = (
-        as_float_array(
-            [
-                [0.0, 0.0, -1.5, 0.0, 0.0],
-                [0.0, 2.0, 0.0, 2.0, 0.0],
-                [-1.5, 0.0, 6.0, 0.0, -1.5],
-                [0.0, 2.0, 0.0, 2.0, 0.0],
-                [0.0, 0.0, -1.5, 0.0, 0.0],
-            ]
+    if workers_count(workers) > 1:
+        # Importing here as the tiling module depends on this definition.
+        from colour_demosaicing.bayer.demosaicing.tiling import (  # noqa: PLC0415
+            demosaicing_CFA_Bayer_tiled,
         )
-        / 8
-    )
 
-    R = CFA * R_m
-    G = CFA * G_m
-    B = CFA * B_m
+        return demosaicing_CFA_Bayer_tiled(
+            CFA,
+            pattern,
+            "Malvar 2004",
+            dtype=dtype,
+            out=out,
+            workers=workers,
+            concurrent=concurrent,
+            layout=layout,
+            backend=backend,
+        )
 
-    del G_m
+    if is_integer_dtype(dtype):
+        return _demosaicing_CFA_Bayer_Malvar2004_integer(
+            CFA, pattern, dtype, out, workspace, layout
+        )
 
-    G = np.where(np.logical_or(R_m == 1, B_m == 1), convolve(CFA, GR_GB), G)
+    CFA = np.squeeze(as_float_array(CFA, dtype))
 
-    RBg_RBBR = convolve(CFA, Rg_RB_Bg_BR)
-    RBg_BRRB = convolve(CFA, Rg_BR_Bg_RB)
-    RBgr_BBRR = convolve(CFA, Rb_BB_Br_RR)
+    # The coefficients are exactly represented in any floating point *dtype*,
+    # the convolutions applying them in the *dtype* of the *Bayer* CFA.
+    GR_GB = _GR_GB / 8
+    Rg_RB_Bg_BR = _RG_RB_BG_BR / 8
+    Rg_BR_Bg_RB = np.transpose(Rg_RB_Bg_BR)
+    Rb_BB_Br_RR = _RB_BB_BR_RR / 8
 
-    del GR_GB, Rg_RB_Bg_BR, Rg_BR_Bg_RB, Rb_BB_Br_RR
+    *shape_b, height, width = CFA.shape
+    CFA_p = pad(
+        CFA,
+        "reflect",
+        buffer_workspace(
+            workspace,
+            "CFA_p",
+            (*shape_b, height + 2 * PADDING, width + 2 * PADDING),
+            CFA.dtype,
+        ),
+    )
 
-    # Red rows.
-    R_r = np.transpose(np.any(R_m == 1, axis=1)[None]) * ones(R.shape)
-    # Red columns.
-    R_c = np.any(R_m == 1, axis=0)[None] * ones(R.shape)
-    # Blue rows.
-    B_r = np.transpose(np.any(B_m == 1, axis=1)[None]) * ones(B.shape)
-    # Blue columns
-    B_c = np.any(B_m == 1, axis=0)[None] * ones(B.shape)
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), CFA.dtype)
+    R, G, B = planes_RGB(RGB, layout)
 
-    del R_m, B_m
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
 
-    R = np.where(np.logical_and(R_r == 1, B_c == 1), RBg_RBBR, R)
-    R = np.where(np.logical_and(B_r == 1, R_c == 1), RBg_BRRB, R)
+    def demosaicing_phase(
+        i: int,
+        y: int,
+        x: int,
+        h_R: NDArrayFloat | None,
+        h_G: NDArrayFloat | None,
+        h_B: NDArrayFloat | None,
+    ) -> None:
+        """Demosaic the *Bayer* CFA phase at given offset."""
 
-    B = np.where(np.logical_and(B_r == 1, R_c == 1), RBg_RBBR, B)
-    B = np.where(np.logical_and(R_r == 1, B_c == 1), RBg_BRRB, B)
+        # Scratch buffer of the convolutions, the phases starting on the first
+        # row and column are the largest, it is shared by the phases unless
+        # they are demosaiced concurrently.
+        S = buffer_workspace(
+            workspace,
+            ("S", i) if concurrent else "S",
+            shape_phase(CFA.shape, 0, 0),
+            CFA.dtype,
+        )
 
-    R = np.where(np.logical_and(B_r == 1, B_c == 1), RBgr_BBRR, R)
-    B = np.where(np.logical_and(R_r == 1, R_c == 1), RBgr_BBRR, B)
+        n_y, n_x = shape_phase(CFA.shape, y, x)[-2:]
+        for C, h in ((R, h_R), (G, h_G), (B, h_B)):
+            if h is None:
+                C[..., y::2, x::2] = CFA[..., y::2, x::2]
+            else:
+                convolve_phase(CFA_p, h, y, x, C[..., y::2, x::2], S[..., :n_y, :n_x])
 
-    del RBg_RBBR, RBg_BRRB, RBgr_BBRR, R_r, R_c, B_r, B_c
+    evaluate_branches(
+        [
+            partial(demosaicing_phase, i, y, x, h_R, h_G, h_B)
+            for i, ((y, x), h_R, h_G, h_B) in enumerate(
+                (
+                    # Red sites.
+                    ((R_y, R_x), None, GR_GB, Rb_BB_Br_RR),
+                    # Green sites on red rows.
+                    ((G_r_y, G_r_x), Rg_RB_Bg_BR, None, Rg_BR_Bg_RB),
+                    # Green sites on blue rows.
+                    ((G_b_y, G_b_x), Rg_BR_Bg_RB, None, Rg_RB_Bg_BR),
+                    # Blue sites.
+                    ((B_y, B_x), Rb_BB_Br_RR, GR_GB, None),
+                )
+            )
+        ],
+        concurrent,
+    )
 
-    return tstack([R, G, B])
+    return RGB
@@ -0,0 +1,201 @@
+"""
+Out-of-Core Bayer CFA Demosaicing
+=================================
+
+Define the objects demosaicing memory-mapped *Bayer* CFA (Colour Filter Array)
+arrays or files band by band into memory-mapped *RGB* colourspace arrays or
+files, e.g., gigapixel scans or stitched panoramas that do not fit in memory.
+
+The bands are extended by the halo of the demosaicing method so that the
+result is identical to that of the full frame demosaicing while the memory
+used only depends on the width of the *Bayer* CFA and the size of the bands.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.hints import (
+    Any,
+    ArrayLike,
+    DTypeFloat,
+    Literal,
+    NDArrayFloat,
+    Tuple,
+    Type,
+)
+from colour.utilities import filter_kwargs, optional, validate_method
+
+from colour_demosaicing.bayer.demosaicing.common import (
+    LAYOUTS_RGB,
+    output_array,
+    shape_RGB,
+)
+from colour_demosaicing.bayer.demosaicing.plan import DEMOSAICING_CFA_BAYER_METHODS
+from colour_demosaicing.bayer.demosaicing.tiling import (
+    demosaicing_tiles,
+    halo_demosaicing_CFA_Bayer,
+    tiles_CFA_Bayer,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "demosaicing_CFA_Bayer_memmap",
+]
+
+
+def demosaicing_CFA_Bayer_memmap(
+    CFA: ArrayLike | str | os.PathLike,
+    out: NDArrayFloat | str | os.PathLike | None = None,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    band_size: int = 256,
+    dtype: Type[DTypeFloat] | None = None,
+    shape: Tuple[int, int] | None = None,
+    dtype_CFA: Any | None = None,
+    offset: int = 0,
+    workers: int | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    **kwargs: Any,
+) -> NDArrayFloat:
+    """
+    Demosaic given memory-mapped *Bayer* CFA array or file band by band using
+    given method and write the *RGB* colourspace array into given
+    memory-mapped array or file.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, e.g., a :class:`numpy.memmap` class instance, or path of
+        the file to memory-map it from: a *.npy* file if ``shape`` is not
+        given, a raw file otherwise.
+    out
+        Array, e.g., a :class:`numpy.memmap` class instance, or path of the
+        file to write the *RGB* colourspace array into: a *.npy* file if its
+        extension is *.npy*, a raw file otherwise. An in-memory array is
+        allocated if not given.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    band_size
+        Number of rows of the bands, must be even.
+    dtype
+        Floating point data type the computations are performed with and of
+        the *RGB* colourspace array file, default to the :class:`numpy.dtype`
+        defined by the :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    shape
+        Shape of the *Bayer* CFA raw file.
+    dtype_CFA
+        Data type of the *Bayer* CFA raw file, default to *uint16*.
+    offset
+        Offset in bytes of the *Bayer* CFA in the raw file.
+    workers
+        Number of threads demosaicing the bands, the negative values wrap
+        around the number of CPUs, i.e., -1 uses all the CPUs.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If a region of interest is given, it is demosaiced with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_roi` definition.
+
+    Notes
+    -----
+    -   Only the bands being demosaiced, extended by the halo of the
+        demosaicing method, and their scratch buffers are loaded in memory.
+    -   The memory-mapped *RGB* colourspace array is flushed to its file
+        before being returned.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Menon2007
+    >>> CFA = np.random.random([20, 24])
+    >>> np.array_equal(
+    ...     demosaicing_CFA_Bayer_memmap(CFA, band_size=8),
+    ...     demosaicing_CFA_Bayer_Menon2007(CFA),
+    ... )
+    True
+    """
+
+    if isinstance(CFA, (str, os.PathLike)):
+        if shape is None:
+            CFA = np.load(CFA, mmap_mode="r")
+        else:
+            CFA = np.memmap(
+                CFA,
+                optional(dtype_CFA, np.uint16),
+                mode="r",
+                shape=tuple(shape),
+                offset=offset,
+            )
+    else:
+        CFA = np.asarray(CFA)
+
+    CFA = np.squeeze(CFA)
+    dtype = np.dtype(optional(dtype, DTYPE_FLOAT_DEFAULT)).type
+
+    if kwargs.get("roi") is not None:
+        raise ValueError(
+            '"roi" argument is not supported by the bands demosaicing, use the '
+            '"demosaicing_CFA_Bayer_roi" definition!'
+        )
+
+    method = validate_method(method, tuple(DEMOSAICING_CFA_BAYER_METHODS))
+    function = DEMOSAICING_CFA_BAYER_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+    halo = halo_demosaicing_CFA_Bayer(method, **kwargs)
+    layout = validate_method(layout, LAYOUTS_RGB)
+
+    shape_o = shape_RGB(CFA.shape, layout)
+    if isinstance(out, (str, os.PathLike)):
+        if os.fspath(out).endswith(".npy"):
+            RGB = np.lib.format.open_memmap(out, "w+", dtype, shape_o)
+        else:
+            RGB = np.memmap(out, dtype, mode="w+", shape=shape_o)
+    else:
+        RGB = output_array(out, shape_o, dtype)
+
+    # The bands span the whole width, rounded to the even number of columns
+    # the tiles require.
+    width = CFA.shape[-1]
+    demosaicing_tiles(
+        CFA,
+        RGB,
+        function,
+        pattern,
+        dtype,
+        tiles_CFA_Bayer(CFA.shape, (band_size, width + width % 2), halo),
+        workers,
+        layout=layout,
+        **kwargs,
+    )
+
+    if isinstance(RGB, np.memmap):
+        RGB.flush()
+
+    return RGB
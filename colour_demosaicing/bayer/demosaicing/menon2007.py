@@ -14,12 +14,46 @@ References
 
 from __future__ import annotations
 
-import numpy as np
-from colour.hints import ArrayLike, Literal, NDArrayFloat
-from colour.utilities import as_float_array, ones, tsplit, tstack
-from scipy.ndimage.filters import convolve, convolve1d
+from functools import partial
 
-from colour_demosaicing.bayer import masks_CFA_Bayer
+import numpy as np
+from colour.hints import (
+    Any,
+    ArrayLike,
+    DTypeFloat,
+    List,
+    Literal,
+    NDArray,
+    NDArrayBoolean,
+    NDArrayFloat,
+    Sequence,
+    Tuple,
+    Type,
+)
+from colour.utilities import as_float_array
+
+from colour_demosaicing.bayer import offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.backends import (
+    function_backend_demosaicing_CFA_Bayer,
+)
+from colour_demosaicing.bayer.demosaicing.common import (
+    PADDING,
+    convolve1d_phase,
+    convolve_phase,
+    evaluate_branches,
+    fill_margins,
+    output_array,
+    pad,
+    phase,
+    planes_RGB,
+    shape_phase,
+    shape_RGB,
+    workers_count,
+)
+from colour_demosaicing.bayer.demosaicing.workspace import (
+    Workspace,
+    buffer_workspace,
+)
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -35,23 +69,63 @@ __all__ = [
 ]
 
 
-def _cnv_h(x: ArrayLike, y: ArrayLike) -> NDArrayFloat:
-    """Perform horizontal convolution."""
+def _buffer_phase(
+    workspace: Workspace | None,
+    key: str,
+    shape: Tuple[int, int],
+    y: int,
+    x: int,
+    dtype: Type[DTypeFloat] | Any,
+) -> NDArray:
+    """
+    Return the buffer with given key from given workspace with the shape of
+    the *Bayer* CFA phase at given offset, the buffer is shared by all the
+    phases.
+    """
+
+    n_y, n_x = shape_phase(shape, y, x)[-2:]
 
-    return convolve1d(x, y, mode="mirror")
+    return buffer_workspace(workspace, key, shape_phase(shape, 0, 0), dtype)[
+        ..., :n_y, :n_x
+    ]
 
 
-def _cnv_v(x: ArrayLike, y: ArrayLike) -> NDArrayFloat:
-    """Perform vertical convolution."""
+def _cnv_phase_best(
+    a_p: NDArrayFloat,
+    h: NDArrayFloat,
+    y: int,
+    x: int,
+    M: NDArrayBoolean,
+    out: NDArrayFloat,
+    buffer_h: NDArrayFloat,
+    buffer: NDArrayFloat,
+) -> NDArrayFloat:
+    """
+    Convolve given padded array with given 1-D kernel at the sites of the
+    *Bayer* CFA phase at given offset, horizontally where given decision map
+    is *True* and vertically elsewhere.
+    """
 
-    return convolve1d(x, y, mode="mirror", axis=0)
+    convolve1d_phase(a_p, h, y, x, 0, out, buffer)
+    convolve1d_phase(a_p, h, y, x, 1, buffer_h, buffer)
+    np.copyto(out, buffer_h, where=M)
+
+    return out
 
 
 def demosaicing_CFA_Bayer_Menon2007(
     CFA: ArrayLike,
     pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
     refining_step: bool = True,
-):
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    workspace: Workspace | None = None,
+    workers: int | None = None,
+    concurrent: bool = False,
+    roi: Tuple[int, int, int, int] | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    backend: Literal["SciPy", "Numba", "PyTorch"] | str | None = None,
+) -> NDArrayFloat:
     """
     Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
     DDFAPD - *Menon (2007)* demosaicing algorithm.
@@ -59,11 +133,48 @@ def demosaicing_CFA_Bayer_Menon2007(
     Parameters
     ----------
     CFA
-        *Bayer* CFA.
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
     pattern
         Arrangement of the colour filters on the pixel array.
     refining_step
         Perform refining step.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    workspace
+        Workspace owning the scratch buffers, they are allocated for this
+        call only if not given.
+    workers
+        Number of threads demosaicing the *Bayer* CFA by tiles with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_tiled`
+        definition, the negative values wrap around the number of CPUs, i.e.,
+        -1 uses all the CPUs. The tiles use their own workspaces.
+    concurrent
+        Whether to evaluate the independent filter branches concurrently with
+        a thread pool, lowering the latency on multi-core machines at the
+        expense of up to two extra planes of scratch buffers.
+    roi
+        Region of interest :math:`(y_0, y_1, x_0, x_1)` to demosaic with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_roi` definition,
+        the result is that region of the full frame *RGB* colourspace array.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`, the planes being then written directly into
+        the output array, e.g., the input buffer of a neural network.
+    backend
+        Compute backend, the one set with the
+        :func:`colour_demosaicing.bayer.set_backend_demosaicing_CFA_Bayer`
+        definition if not given, i.e., *SciPy* by default. The *Numba* and
+        *PyTorch* backends parallelise the computations themselves: the
+        ``workspace``, ``workers`` and ``concurrent`` arguments only apply to
+        the *SciPy* backend. The *PyTorch* backend returns a
+        :class:`torch.Tensor` class instance.
 
     Returns
     -------
@@ -78,6 +189,11 @@ def demosaicing_CFA_Bayer_Menon2007(
         `Jupyter Notebook <https://github.com/colour-science/colour-hdri/\
 blob/develop/colour_hdri/examples/\
 examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
+    -   The directional interpolations, colour differences, classifiers and
+        decision map are only evaluated at the sites of the *Bayer* CFA phases
+        they apply to, the decision map being stored as boolean phase planes,
+        and the intermediate buffers are reused: the peak memory usage is
+        about twice the output size.
 
     References
     ----------
@@ -119,31 +235,110 @@ examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
             [ 0.29803923,  0.3764706 ,  0.42352942]]])
     """
 
-    CFA = np.squeeze(as_float_array(CFA))
-    R_m, G_m, B_m = masks_CFA_Bayer(CFA.shape, pattern)
-
-    h_0 = as_float_array([0.0, 0.5, 0.0, 0.5, 0.0])
-    h_1 = as_float_array([-0.25, 0.0, 0.5, 0.0, -0.25])
-
-    R = CFA * R_m
-    G = CFA * G_m
-    B = CFA * B_m
-
-    G_H = np.where(G_m == 0, _cnv_h(CFA, h_0) + _cnv_h(CFA, h_1), G)
-    G_V = np.where(G_m == 0, _cnv_v(CFA, h_0) + _cnv_v(CFA, h_1), G)
-
-    C_H = np.where(R_m == 1, R - G_H, 0)
-    C_H = np.where(B_m == 1, B - G_H, C_H)
-
-    C_V = np.where(R_m == 1, R - G_V, 0)
-    C_V = np.where(B_m == 1, B - G_V, C_V)
-
-    D_H = np.abs(C_H - np.pad(C_H, ((0, 0), (0, 2)), mode="reflect")[:, 2:])
-    D_V = np.abs(C_V - np.pad(C_V, ((0, 2), (0, 0)), mode="reflect")[2:, :])
-
-    del h_0, h_1, CFA, C_V, C_H
+    if roi is not None:
+        # Importing here as the tiling module depends on this definition.
+        from colour_demosaicing.bayer.demosaicing.tiling import (  # noqa: PLC0415
+            demosaicing_CFA_Bayer_roi,
+        )
+
+        return demosaicing_CFA_Bayer_roi(
+            CFA,
+            roi,
+            pattern,
+            "Menon 2007",
+            dtype=dtype,
+            out=out,
+            workspace=workspace,
+            workers=workers,
+            concurrent=concurrent,
+            refining_step=refining_step,
+            layout=layout,
+            backend=backend,
+        )
+
+    function = function_backend_demosaicing_CFA_Bayer(
+        "demosaicing_CFA_Bayer_Menon2007", backend
+    )
+    if function is not None:
+        return function(
+            CFA,
+            pattern,
+            refining_step=refining_step,
+            dtype=dtype,
+            out=out,
+            layout=layout,
+        )
+
+    if workers_count(workers) > 1:
+        # Importing here as the tiling module depends on this definition.
+        from colour_demosaicing.bayer.demosaicing.tiling import (  # noqa: PLC0415
+            demosaicing_CFA_Bayer_tiled,
+        )
+
+        return demosaicing_CFA_Bayer_tiled(
+            CFA,
+            pattern,
+            "Menon 2007",
+            dtype=dtype,
+            out=out,
+            workers=workers,
+            concurrent=concurrent,
+            refining_step=refining_step,
+            layout=layout,
+            backend=backend,
+        )
+
+    CFA = np.squeeze(as_float_array(CFA, dtype))
+    shape, dtype = CFA.shape, CFA.dtype
+    shape_p = (*shape[:-2], shape[-2] + 2 * PADDING, shape[-1] + 2 * PADDING)
+
+    offsets = offsets_CFA_Bayer(pattern)
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets
+    # Red and blue sites, i.e., the sites missing the green component.
+    sites = ((R_y, R_x), (B_y, B_x))
+
+    # The convolutions apply the coefficients in the *dtype* of the arrays
+    # they convolve, the kernels are thus not converted to it.
+    h_0 = np.array([0.0, 0.5, 0.0, 0.5, 0.0])
+    h_1 = np.array([-0.25, 0.0, 0.5, 0.0, -0.25])
+
+    # The working planes are padded in "mirror" mode so that the filters are
+    # only evaluated at the sites they reconstruct. "B_p" holds the blue
+    # samples and is the only copy of the *Bayer* CFA kept.
+    B_p = pad(CFA, "mirror", buffer_workspace(workspace, "B_p", shape_p, dtype))
+
+    # The independent branches, i.e., the horizontal and vertical
+    # reconstructions, and the red and blue reconstructions, share their
+    # scratch buffers unless they are evaluated concurrently.
+    suffixes = ("", "_1") if concurrent else ("", "")
+
+    def green_directional(key: str, axis: int, suffix: str) -> List[NDArrayFloat]:
+        """
+        Return the green estimations at the red and blue sites in given
+        direction.
+        """
+
+        G_D = []
+        for i, (y, x) in enumerate(sites):
+            G_d = _buffer_phase(workspace, f"{key}_{i}", shape, y, x, dtype)
+            S = _buffer_phase(workspace, f"S{suffix}", shape, y, x, dtype)
+            T = _buffer_phase(workspace, f"T{suffix}", shape, y, x, dtype)
+            convolve1d_phase(B_p, h_0, y, x, axis, G_d, S)
+            G_d += convolve1d_phase(B_p, h_1, y, x, axis, T, S)
+            G_D.append(G_d)
+
+        return G_D
+
+    # Horizontal and vertical green estimations at the red and blue sites.
+    G_H, G_V = evaluate_branches(
+        [
+            partial(green_directional, "G_H", 1, suffixes[0]),
+            partial(green_directional, "G_V", 0, suffixes[1]),
+        ],
+        concurrent,
+    )
 
-    k = as_float_array(
+    k = np.array(
         [
             [0.0, 0.0, 1.0, 0.0, 1.0],
             [0.0, 0.0, 0.0, 1.0, 0.0],
@@ -153,76 +348,202 @@ examples_merge_from_raw_files_with_post_demosaicing.ipynb>`__.
         ]
     )
 
-    d_H = convolve(D_H, k, mode="constant")
-    d_V = convolve(D_V, np.transpose(k), mode="constant")
-
-    del D_H, D_V
-
-    mask = d_V >= d_H
-    G = np.where(mask, G_H, G_V)
-    M = np.where(mask, 1, 0)
-
-    del d_H, d_V, G_H, G_V
-
-    # Red rows.
-    R_r = np.transpose(np.any(R_m == 1, axis=1)[None]) * ones(R.shape)
-    # Blue rows.
-    B_r = np.transpose(np.any(B_m == 1, axis=1)[None]) * ones(B.shape)
-
-    k_b = as_float_array([0.5, 0, 0.5])
-
-    R = np.where(
-        np.logical_and(G_m == 1, R_r == 1),
-        G + _cnv_h(R, k_b) - _cnv_h(G, k_b),
-        R,
-    )
-
-    R = np.where(
-        np.logical_and(G_m == 1, B_r == 1) == 1,
-        G + _cnv_v(R, k_b) - _cnv_v(G, k_b),
-        R,
-    )
-
-    B = np.where(
-        np.logical_and(G_m == 1, B_r == 1),
-        G + _cnv_h(B, k_b) - _cnv_h(G, k_b),
-        B,
-    )
+    def gradients_directional(
+        G_D: List[NDArrayFloat],
+        key: str,
+        h: NDArrayFloat,
+        u_y: int,
+        u_x: int,
+        C_p: NDArrayFloat,
+        D_p: NDArrayFloat,
+        suffix: str,
+    ) -> List[NDArrayFloat]:
+        """
+        Return the gradients at the red and blue sites in given direction
+        using given colour differences and gradients planes.
+        """
+
+        for (y, x), G_d in zip(sites, G_D):
+            np.subtract(
+                phase(B_p, y, x, G_d.shape), G_d, out=phase(C_p, y, x, G_d.shape)
+            )
+
+        fill_margins(C_p)
+
+        for (y, x), G_d in zip(sites, G_D):
+            D_s = phase(D_p, y, x, G_d.shape)
+            np.subtract(
+                phase(C_p, y, x, G_d.shape),
+                phase(C_p, y, x, G_d.shape, 2 * u_y, 2 * u_x),
+                out=D_s,
+            )
+            np.abs(D_s, out=D_s)
+
+        return [
+            convolve_phase(
+                D_p,
+                h,
+                y,
+                x,
+                _buffer_phase(workspace, f"{key}_{i}", shape, y, x, dtype),
+                _buffer_phase(workspace, f"S{suffix}", shape, y, x, dtype),
+            )
+            for i, (y, x) in enumerate(sites)
+        ]
 
-    B = np.where(
-        np.logical_and(G_m == 1, R_r == 1) == 1,
-        G + _cnv_v(B, k_b) - _cnv_v(G, k_b),
-        B,
+    # Colour differences and gradients, the gradients are null at the green
+    # sites and outside the *Bayer* CFA.
+    C_p = buffer_workspace(workspace, "C_p", shape_p, dtype)
+    D_p = buffer_workspace(workspace, "D_p", shape_p, dtype)
+    D_p.fill(0)
+    if concurrent:
+        C_p_V = buffer_workspace(workspace, "C_p_1", shape_p, dtype)
+        D_p_V = buffer_workspace(workspace, "D_p_1", shape_p, dtype)
+        D_p_V.fill(0)
+    else:
+        C_p_V, D_p_V = C_p, D_p
+
+    d_H, d_V = evaluate_branches(
+        [
+            partial(gradients_directional, G_H, "d_H", k, 0, 1, C_p, D_p, suffixes[0]),
+            partial(
+                gradients_directional,
+                G_V,
+                "d_V",
+                np.transpose(k),
+                1,
+                0,
+                C_p_V,
+                D_p_V,
+                suffixes[1],
+            ),
+        ],
+        concurrent,
     )
 
-    R = np.where(
-        np.logical_and(B_r == 1, B_m == 1),
-        np.where(
-            M == 1,
-            B + _cnv_h(R, k_b) - _cnv_h(B, k_b),
-            B + _cnv_v(R, k_b) - _cnv_v(B, k_b),
-        ),
-        R,
+    # The planes are only released when no workspace owns them.
+    del C_p_V, D_p_V
+
+    # Best directional reconstruction at the red and blue sites.
+    M = [
+        np.greater_equal(
+            d_v,
+            d_h,
+            out=_buffer_phase(workspace, f"M_{i}", shape, y, x, np.bool_),
+        )
+        for i, ((y, x), d_h, d_v) in enumerate(zip(sites, d_H, d_V))
+    ]
+
+    del d_H, d_V, k
+
+    # The colour differences and gradients buffers are reused for the red and
+    # green planes.
+    R_p, G_p = C_p, D_p
+    np.copyto(R_p, B_p)
+    np.copyto(G_p, B_p)
+
+    for (y, x), G_h, G_v, M_s in zip(sites, G_H, G_V, M):
+        G_s = phase(G_p, y, x, G_h.shape)
+        np.copyto(G_s, G_v)
+        np.copyto(G_s, G_h, where=M_s)
+
+    fill_margins(G_p)
+
+    del G_H, G_V, G_h, G_v, G_s
+
+    k_b = np.array([0.5, 0.0, 0.5])
+
+    def colour_green_sites(
+        C_p: NDArrayFloat, sites_C: Tuple[Tuple[Tuple[int, int], int], ...], suffix: str
+    ) -> None:
+        """
+        Reconstruct given red or blue plane at the green sites: horizontally
+        on its rows and vertically on its columns.
+        """
+
+        for (y, x), axis in sites_C:
+            shape_s = shape_phase(shape, y, x)
+            S = _buffer_phase(workspace, f"S{suffix}", shape, y, x, dtype)
+            T = _buffer_phase(workspace, f"T{suffix}", shape, y, x, dtype)
+            C_s = convolve1d_phase(C_p, k_b, y, x, axis, phase(C_p, y, x, shape_s), S)
+            C_s += phase(G_p, y, x, shape_s)
+            C_s -= convolve1d_phase(G_p, k_b, y, x, axis, T, S)
+
+        fill_margins(C_p)
+
+    # Red and blue components at the green sites.
+    evaluate_branches(
+        [
+            partial(
+                colour_green_sites,
+                R_p,
+                (((G_r_y, G_r_x), 1), ((G_b_y, G_b_x), 0)),
+                suffixes[0],
+            ),
+            partial(
+                colour_green_sites,
+                B_p,
+                (((G_b_y, G_b_x), 1), ((G_r_y, G_r_x), 0)),
+                suffixes[1],
+            ),
+        ],
+        concurrent,
     )
 
-    B = np.where(
-        np.logical_and(R_r == 1, R_m == 1),
-        np.where(
-            M == 1,
-            R + _cnv_h(B, k_b) - _cnv_h(R, k_b),
-            R + _cnv_v(B, k_b) - _cnv_v(R, k_b),
-        ),
-        B,
+    def colour_best(
+        C_p: NDArrayFloat,
+        K_p: NDArrayFloat,
+        y: int,
+        x: int,
+        M_s: NDArrayBoolean,
+        suffix: str,
+    ) -> None:
+        """
+        Reconstruct given red (blue) plane at the blue (red) sites in the best
+        direction using given blue (red) plane.
+        """
+
+        S = _buffer_phase(workspace, f"S{suffix}", shape, y, x, dtype)
+        T = _buffer_phase(workspace, f"T{suffix}", shape, y, x, dtype)
+        C_d = []
+        for key, axis in (("C_H", 1), ("C_V", 0)):
+            C_a = convolve1d_phase(
+                C_p,
+                k_b,
+                y,
+                x,
+                axis,
+                _buffer_phase(workspace, f"{key}{suffix}", shape, y, x, dtype),
+                S,
+            )
+            C_a += phase(K_p, y, x, M_s.shape)
+            C_a -= convolve1d_phase(K_p, k_b, y, x, axis, T, S)
+            C_d.append(C_a)
+
+        C_s = phase(C_p, y, x, M_s.shape)
+        np.copyto(C_s, C_d[1])
+        np.copyto(C_s, C_d[0], where=M_s)
+
+    # Red (blue) component at the blue (red) sites in the best direction, the
+    # branches only read the samples of the other plane at its own sites and
+    # at the green sites, the margins are thus filled afterwards.
+    evaluate_branches(
+        [
+            partial(colour_best, R_p, B_p, B_y, B_x, M[1], suffixes[0]),
+            partial(colour_best, B_p, R_p, R_y, R_x, M[0], suffixes[1]),
+        ],
+        concurrent,
     )
 
-    RGB = tstack([R, G, B])
-
-    del R, G, B, k_b, R_r, B_r
+    fill_margins(R_p)
+    fill_margins(B_p)
 
     if refining_step:
-        RGB = refining_step_Menon2007(RGB, tstack([R_m, G_m, B_m]), M)
+        _refining_step_Menon2007(R_p, G_p, B_p, M, offsets, workspace)
 
-    del M, R_m, G_m, B_m
+    RGB = output_array(out, shape_RGB(shape, layout), dtype)
+    for C, C_p in zip(planes_RGB(RGB, layout), (R_p, G_p, B_p)):
+        C[...] = C_p[..., PADDING:-PADDING, PADDING:-PADDING]
 
     return RGB
 
@@ -231,7 +552,11 @@ demosaicing_CFA_Bayer_DDFAPD = demosaicing_CFA_Bayer_Menon2007
 
 
 def refining_step_Menon2007(
-    RGB: ArrayLike, RGB_m: ArrayLike, M: ArrayLike
+    RGB: ArrayLike,
+    RGB_m: ArrayLike,
+    M: ArrayLike,
+    dtype: Type[DTypeFloat] | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
 ) -> NDArrayFloat:
     """
     Perform the refining step on given *RGB* colourspace array.
@@ -244,12 +569,28 @@ def refining_step_Menon2007(
         *Bayer* CFA red, green and blue masks.
     M
         Estimation for the best directional reconstruction.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    layout
+        Layout of the *RGB* colourspace array, of the masks and of the refined
+        *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
 
     Returns
     -------
     :class:`numpy.ndarray`
         Refined *RGB* colourspace array.
 
+    Notes
+    -----
+    -   The directional filters are only evaluated at the sites they update
+        but in both directions, the decision map then selecting the direction
+        retained at each site. The offsets of the *Bayer* CFA phases are
+        inferred from the masks.
+
     Examples
     --------
     >>> RGB = np.array(
@@ -287,95 +628,168 @@ def refining_step_Menon2007(
             [ 0.29803923,  0.3764706 ,  0.42352942]]])
     """
 
-    R, G, B = tsplit(RGB)
-    R_m, G_m, B_m = tsplit(RGB_m)
-    M = as_float_array(M)
+    RGB = as_float_array(RGB, dtype)
+    RGB_m = np.asarray(RGB_m)
+    M = np.asarray(M)
 
-    del RGB, RGB_m
+    R_m, _G_m, B_m = (C_m[..., :2, :2] == 1 for C_m in planes_RGB(RGB_m, layout))
+    if np.any(R_m):
+        R_y, R_x = (int(i) for i in np.argwhere(R_m)[0][-2:])
+    else:
+        B_y, B_x = (int(i) for i in np.argwhere(B_m)[0][-2:]) if np.any(B_m) else (1, 0)
+        R_y, R_x = 1 - B_y, 1 - B_x
+    offsets = ((R_y, R_x), (R_y, 1 - R_x), (1 - R_y, R_x), (1 - R_y, 1 - R_x))
 
-    # Updating of the green component.
-    R_G = R - G
-    B_G = B - G
+    R_p, G_p, B_p = (pad(C) for C in planes_RGB(RGB, layout))
 
-    FIR = ones(3) / 3
+    del RGB, RGB_m
 
-    B_G_m = np.where(
-        B_m == 1,
-        np.where(M == 1, _cnv_h(B_G, FIR), _cnv_v(B_G, FIR)),
-        0,
-    )
-    R_G_m = np.where(
-        R_m == 1,
-        np.where(M == 1, _cnv_h(R_G, FIR), _cnv_v(R_G, FIR)),
-        0,
+    _refining_step_Menon2007(
+        R_p,
+        G_p,
+        B_p,
+        [M[..., y::2, x::2] == 1 for y, x in (offsets[0], offsets[3])],
+        offsets,
     )
 
-    del B_G, R_G
+    *shape_b, height, width = R_p.shape
+    RGB = np.empty(
+        shape_RGB((*shape_b, height - 2 * PADDING, width - 2 * PADDING), layout),
+        R_p.dtype,
+    )
+    for C, C_p in zip(planes_RGB(RGB, layout), (R_p, G_p, B_p)):
+        C[...] = C_p[..., PADDING:-PADDING, PADDING:-PADDING]
 
-    G = np.where(R_m == 1, R - R_G_m, G)
-    G = np.where(B_m == 1, B - B_G_m, G)
+    return RGB
 
-    # Updating of the red and blue components in the green locations.
-    # Red rows.
-    R_r = np.transpose(np.any(R_m == 1, axis=1)[None]) * ones(R.shape)
-    # Red columns.
-    R_c = np.any(R_m == 1, axis=0)[None] * ones(R.shape)
-    # Blue rows.
-    B_r = np.transpose(np.any(B_m == 1, axis=1)[None]) * ones(B.shape)
-    # Blue columns.
-    B_c = np.any(B_m == 1, axis=0)[None] * ones(B.shape)
 
-    R_G = R - G
-    B_G = B - G
+def _refining_step_Menon2007(
+    R_p: NDArrayFloat,
+    G_p: NDArrayFloat,
+    B_p: NDArrayFloat,
+    M: Sequence[NDArrayBoolean],
+    offsets: Tuple[Tuple[int, int], ...],
+    workspace: Workspace | None = None,
+) -> None:
+    """
+    Perform in-place the refining step on given padded red, green and blue
+    planes, the directional filters being only evaluated at the sites they
+    update, in both directions, the decision map then selecting the direction
+    retained at each site.
 
-    k_b = as_float_array([0.5, 0.0, 0.5])
+    Parameters
+    ----------
+    R_p
+        Red plane padded by :attr:`PADDING` pixels in *mirror* mode.
+    G_p
+        Green plane padded by :attr:`PADDING` pixels in *mirror* mode.
+    B_p
+        Blue plane padded by :attr:`PADDING` pixels in *mirror* mode.
+    M
+        Estimation for the best directional reconstruction at the red and
+        blue sites, *True* where the horizontal reconstruction is the best.
+    offsets
+        *Bayer* CFA red, green on red rows, green on blue rows and blue sites
+        offsets.
+    workspace
+        Workspace owning the scratch buffers, they are allocated for this
+        call only if not given.
+    """
 
-    R_G_m = np.where(
-        np.logical_and(G_m == 1, B_r == 1),
-        _cnv_v(R_G, k_b),
-        R_G_m,
-    )
-    R = np.where(np.logical_and(G_m == 1, B_r == 1), G + R_G_m, R)
-    R_G_m = np.where(
-        np.logical_and(G_m == 1, B_c == 1),
-        _cnv_h(R_G, k_b),
-        R_G_m,
-    )
-    R = np.where(np.logical_and(G_m == 1, B_c == 1), G + R_G_m, R)
+    *shape_b, height, width = R_p.shape
+    height, width = height - 2 * PADDING, width - 2 * PADDING
+    shape, dtype = (*shape_b, height, width), R_p.dtype
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets
 
-    del B_r, R_G_m, B_c, R_G
+    FIR = np.ones(3) / 3
+    k_b = np.array([0.5, 0.0, 0.5])
 
-    B_G_m = np.where(
-        np.logical_and(G_m == 1, R_r == 1),
-        _cnv_v(B_G, k_b),
-        B_G_m,
-    )
-    B = np.where(np.logical_and(G_m == 1, R_r == 1), G + B_G_m, B)
-    B_G_m = np.where(
-        np.logical_and(G_m == 1, R_c == 1),
-        _cnv_h(B_G, k_b),
-        B_G_m,
-    )
-    B = np.where(np.logical_and(G_m == 1, R_c == 1), G + B_G_m, B)
+    # Colour differences buffer.
+    S_p = buffer_workspace(workspace, "S_p", R_p.shape, dtype)
 
-    del B_G_m, R_r, R_c, G_m, B_G
+    # Updating of the green component.
+    G_s = []
+    for i, (C_p, (y, x), M_s) in enumerate(
+        ((R_p, (R_y, R_x), M[0]), (B_p, (B_y, B_x), M[1]))
+    ):
+        np.subtract(C_p, G_p, out=S_p)
+        G_d = _cnv_phase_best(
+            S_p,
+            FIR,
+            y,
+            x,
+            M_s,
+            _buffer_phase(workspace, f"G_s_{i}", shape, y, x, dtype),
+            _buffer_phase(workspace, "T", shape, y, x, dtype),
+            _buffer_phase(workspace, "S", shape, y, x, dtype),
+        )
+        G_s.append(np.subtract(phase(C_p, y, x, M_s.shape), G_d, out=G_d))
+
+    for (y, x), G_d in zip(((R_y, R_x), (B_y, B_x)), G_s):
+        phase(G_p, y, x, G_d.shape)[...] = G_d
+
+    fill_margins(G_p)
+
+    # Updating of the red and blue components in the green locations:
+    # vertically on the rows and horizontally on the columns of the other
+    # colour. The green sites of rows, respectively columns, without samples
+    # of the other colour, e.g., single column arrays, are not updated.
+    for C_p, sites_C in (
+        (
+            R_p,
+            (((G_b_y, G_b_x), 0, width > B_x), ((G_r_y, G_r_x), 1, height > B_y)),
+        ),
+        (
+            B_p,
+            (((G_r_y, G_r_x), 0, width > R_x), ((G_b_y, G_b_x), 1, height > R_y)),
+        ),
+    ):
+        np.subtract(C_p, G_p, out=S_p)
+        for (y, x), axis, update in sites_C:
+            if not update:
+                continue
+
+            shape_s = shape_phase(shape, y, x)
+            C_s = convolve1d_phase(
+                S_p,
+                k_b,
+                y,
+                x,
+                axis,
+                phase(C_p, y, x, shape_s),
+                _buffer_phase(workspace, "S", shape, y, x, dtype),
+            )
+            C_s += phase(G_p, y, x, shape_s)
+
+        fill_margins(C_p)
 
     # Updating of the red (blue) component in the blue (red) locations.
-    R_B = R - B
-    R_B_m = np.where(
-        B_m == 1,
-        np.where(M == 1, _cnv_h(R_B, FIR), _cnv_v(R_B, FIR)),
-        0,
+    np.subtract(R_p, B_p, out=S_p)
+    R_s = _cnv_phase_best(
+        S_p,
+        FIR,
+        B_y,
+        B_x,
+        M[1],
+        _buffer_phase(workspace, "G_s_1", shape, B_y, B_x, dtype),
+        _buffer_phase(workspace, "T", shape, B_y, B_x, dtype),
+        _buffer_phase(workspace, "S", shape, B_y, B_x, dtype),
     )
-    R = np.where(B_m == 1, B + R_B_m, R)
-
-    R_B_m = np.where(
-        R_m == 1,
-        np.where(M == 1, _cnv_h(R_B, FIR), _cnv_v(R_B, FIR)),
-        0,
+    np.add(phase(B_p, B_y, B_x, R_s.shape), R_s, out=R_s)
+    B_s = _cnv_phase_best(
+        S_p,
+        FIR,
+        R_y,
+        R_x,
+        M[0],
+        _buffer_phase(workspace, "G_s_0", shape, R_y, R_x, dtype),
+        _buffer_phase(workspace, "T", shape, R_y, R_x, dtype),
+        _buffer_phase(workspace, "S", shape, R_y, R_x, dtype),
     )
-    B = np.where(R_m == 1, R - R_B_m, B)
+    np.subtract(phase(R_p, R_y, R_x, B_s.shape), B_s, out=B_s)
 
-    del R_B, R_B_m, R_m
+    phase(R_p, B_y, B_x, R_s.shape)[...] = R_s
+    phase(B_p, R_y, R_x, B_s.shape)[...] = B_s
 
-    return tstack([R, G, B])
+    fill_margins(R_p)
+    fill_margins(B_p)
@@ -0,0 +1,372 @@
+"""
+Demosaicing Plan
+================
+
+Define a plan demosaicing *Bayer* CFA (Colour Filter Array) of fixed shape,
+pattern and *dtype* with given method, in the spirit of *FFTW* plans.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.hints import (
+    Any,
+    ArrayLike,
+    Callable,
+    Dict,
+    DTypeFloat,
+    Literal,
+    NDArrayFloat,
+    Tuple,
+    Type,
+)
+from colour.utilities import (
+    CanonicalMapping,
+    filter_kwargs,
+    optional,
+    validate_method,
+)
+
+from colour_demosaicing.bayer import offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.bilinear import (
+    demosaicing_CFA_Bayer_bilinear,
+)
+from colour_demosaicing.bayer.demosaicing.common import as_array_CFA
+from colour_demosaicing.bayer.demosaicing.malvar2004 import (
+    demosaicing_CFA_Bayer_Malvar2004,
+)
+from colour_demosaicing.bayer.demosaicing.menon2007 import (
+    demosaicing_CFA_Bayer_Menon2007,
+)
+from colour_demosaicing.bayer.demosaicing.workspace import Workspace
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "DEMOSAICING_CFA_BAYER_METHODS",
+    "DemosaicingPlan",
+]
+
+DEMOSAICING_CFA_BAYER_METHODS: CanonicalMapping = CanonicalMapping(
+    {
+        "Bilinear": demosaicing_CFA_Bayer_bilinear,
+        "Malvar 2004": demosaicing_CFA_Bayer_Malvar2004,
+        "Menon 2007": demosaicing_CFA_Bayer_Menon2007,
+    }
+)
+DEMOSAICING_CFA_BAYER_METHODS.__doc__ = """
+Supported *Bayer* CFA demosaicing methods.
+
+References
+----------
+:cite:`Losson2010c`, :cite:`Malvar2004a`, :cite:`Menon2007c`
+
+Aliases:
+
+-   'DDFAPD': 'Menon 2007'
+"""
+DEMOSAICING_CFA_BAYER_METHODS["DDFAPD"] = DEMOSAICING_CFA_BAYER_METHODS["Menon 2007"]
+
+
+class DemosaicingPlan:
+    """
+    Define a plan demosaicing *Bayer* CFA of fixed shape, pattern and *dtype*
+    with given method.
+
+    The plan validates its parameters and allocates the scratch buffers of
+    the method once, by demosaicing a null *Bayer* CFA at instantiation, the
+    subsequent calls then reuse them.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA, its singleton dimensions are removed as
+        the *Bayer* CFA is squeezed.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute. Given the
+        *uint8* or *uint16* data type, the fixed-point path of the method is
+        used with integer *Bayer* CFA.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+
+    Raises
+    ------
+    ValueError
+        If the demosaicing method does not support given keyword arguments.
+
+    Attributes
+    ----------
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingPlan.shape`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingPlan.pattern`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingPlan.method`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingPlan.dtype`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingPlan.kwargs`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingPlan.nbytes`
+
+    Methods
+    -------
+    -   :meth:`~colour_demosaicing.bayer.DemosaicingPlan.__init__`
+    -   :meth:`~colour_demosaicing.bayer.DemosaicingPlan.__call__`
+    -   :meth:`~colour_demosaicing.bayer.DemosaicingPlan.__repr__`
+
+    Notes
+    -----
+    -   A plan is picklable, its scratch buffers are not pickled but
+        allocated again when unpickling.
+    -   A plan must not be shared by concurrent calls.
+
+    Examples
+    --------
+    >>> CFA = np.array(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ]
+    ... )
+    >>> plan = DemosaicingPlan(CFA.shape, method="Malvar 2004")
+    >>> plan(CFA)
+    array([[[ 0.30980393,  0.31666668,  0.32941177],
+            [ 0.33039216,  0.36078432,  0.38112746],
+            [ 0.30588236,  0.32794118,  0.34877452],
+            [ 0.36274511,  0.3764706 ,  0.38480393]],
+    <BLANKLINE>
+           [[ 0.34828432,  0.35686275,  0.36568628],
+            [ 0.35318628,  0.38186275,  0.39607844],
+            [ 0.3379902 ,  0.36078432,  0.3754902 ],
+            [ 0.37769609,  0.39558825,  0.40000001]]])
+    >>> plan.nbytes
+    400
+    >>> plan
+    DemosaicingPlan((2, 4), 'RGGB', 'Malvar 2004', dtype=np.float64)
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, ...],
+        pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+        method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+        | str = "Menon 2007",
+        dtype: Type[DTypeFloat] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        # The *Bayer* CFA being squeezed when called, so is the shape.
+        self._shape: Tuple[int, ...] = tuple(
+            int(dimension) for dimension in shape if int(dimension) != 1
+        )
+        # Validating the pattern once.
+        offsets_CFA_Bayer(pattern)
+        self._pattern: str = str(pattern).upper()
+        # Validating the method once, its name is kept as given.
+        validate_method(method, tuple(DEMOSAICING_CFA_BAYER_METHODS))
+        self._method: str = str(method)
+        self._dtype: Type[DTypeFloat] = np.dtype(
+            optional(dtype, DTYPE_FLOAT_DEFAULT)
+        ).type
+        self._function: Callable = DEMOSAICING_CFA_BAYER_METHODS[self._method]
+        self._kwargs: Dict = filter_kwargs(self._function, **kwargs)
+
+        if unsupported := sorted(set(kwargs) - set(self._kwargs)):
+            raise ValueError(
+                f'"{self._method}" method does not support the {unsupported} '
+                f"keyword arguments!"
+            )
+
+        self._workspace: Workspace = Workspace()
+        self._plan()
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Getter property for the shape of the *Bayer* CFA.
+
+        Returns
+        -------
+        :class:`tuple`
+            Shape of the *Bayer* CFA.
+        """
+
+        return self._shape
+
+    @property
+    def pattern(self) -> str:
+        """
+        Getter property for the arrangement of the colour filters on the
+        pixel array.
+
+        Returns
+        -------
+        :class:`str`
+            Arrangement of the colour filters on the pixel array.
+        """
+
+        return self._pattern
+
+    @property
+    def method(self) -> str:
+        """
+        Getter property for the demosaicing method.
+
+        Returns
+        -------
+        :class:`str`
+            Demosaicing method.
+        """
+
+        return self._method
+
+    @property
+    def dtype(self) -> Type[DTypeFloat]:
+        """
+        Getter property for the floating point data type the computations
+        are performed with.
+
+        Returns
+        -------
+        :class:`type`
+            Floating point data type.
+        """
+
+        return self._dtype
+
+    @property
+    def kwargs(self) -> Dict:
+        """
+        Getter property for the keyword arguments of the demosaicing method.
+
+        Returns
+        -------
+        :class:`dict`
+            Keyword arguments.
+        """
+
+        return dict(self._kwargs)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Getter property for the memory footprint of the plan in bytes, i.e.,
+        the size of its scratch buffers, the output arrays not being owned by
+        the plan.
+
+        Returns
+        -------
+        :class:`int`
+            Memory footprint in bytes.
+        """
+
+        return self._workspace.nbytes
+
+    def _plan(self) -> None:
+        """Allocate the scratch buffers by demosaicing a null *Bayer* CFA."""
+
+        self._function(
+            np.zeros(self._shape, self._dtype),
+            self._pattern,
+            dtype=self._dtype,
+            workspace=self._workspace,
+            **self._kwargs,
+        )
+
+    def __call__(self, CFA: ArrayLike, out: NDArrayFloat | None = None) -> NDArrayFloat:
+        """
+        Return the demosaiced *RGB* colourspace array from given *Bayer* CFA.
+
+        Parameters
+        ----------
+        CFA
+            *Bayer* CFA.
+        out
+            Array to write the *RGB* colourspace array into, a new array is
+            allocated if not given.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            *RGB* colourspace array.
+
+        Raises
+        ------
+        ValueError
+            If the *Bayer* CFA shape does not match the plan shape.
+        """
+
+        CFA = np.squeeze(as_array_CFA(CFA, self._dtype))
+
+        if CFA.shape != self._shape:
+            raise ValueError(
+                f'"CFA" shape {CFA.shape} does not match the plan {self._shape} shape!'
+            )
+
+        return self._function(
+            CFA,
+            self._pattern,
+            dtype=self._dtype,
+            out=out,
+            workspace=self._workspace,
+            **self._kwargs,
+        )
+
+    def __getstate__(self) -> Dict:
+        """
+        Return the state of the plan for pickling, excluding its scratch
+        buffers.
+
+        Returns
+        -------
+        :class:`dict`
+            State of the plan.
+        """
+
+        state = self.__dict__.copy()
+        del state["_function"], state["_workspace"]
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Set the state of the plan when unpickling and allocate its scratch
+        buffers.
+
+        Parameters
+        ----------
+        state
+            State of the plan.
+        """
+
+        self.__dict__.update(state)
+        self._function = DEMOSAICING_CFA_BAYER_METHODS[self._method]
+        self._workspace = Workspace()
+        self._plan()
+
+    def __repr__(self) -> str:
+        """
+        Return an evaluable string representation of the plan.
+
+        Returns
+        -------
+        :class:`str`
+            Evaluable string representation.
+        """
+
+        kwargs = "".join(f", {key}={value!r}" for key, value in self._kwargs.items())
+
+        return (
+            f"{self.__class__.__name__}({self._shape!r}, {self._pattern!r}, "
+            f"{self._method!r}, dtype=np.{self._dtype.__name__}{kwargs})"
+        )
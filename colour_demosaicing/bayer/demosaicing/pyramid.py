@@ -0,0 +1,178 @@
+"""
+Bayer CFA Demosaicing Pyramid
+=============================
+
+Define the objects demosaicing *Bayer* CFA (Colour Filter Array) into a
+multi-resolution box pyramid in a single pass: the tiles are demosaiced with
+the :func:`colour_demosaicing.bayer.demosaicing.tiling.demosaicing_tiles`
+definition and the coarser levels are reduced from the core of each tile while
+it is still in cache, rather than re-reading the full resolution *RGB*
+colourspace array once per level.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from colour.hints import (
+    Any,
+    ArrayLike,
+    DTypeFloat,
+    List,
+    Literal,
+    NDArrayFloat,
+    Tuple,
+    Type,
+)
+from colour.utilities import as_float_array, filter_kwargs, validate_method
+
+from colour_demosaicing.bayer.demosaicing.plan import DEMOSAICING_CFA_BAYER_METHODS
+from colour_demosaicing.bayer.demosaicing.tiling import (
+    demosaicing_tiles,
+    halo_demosaicing_CFA_Bayer,
+    tiles_CFA_Bayer,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "demosaicing_CFA_Bayer_pyramid",
+]
+
+
+def demosaicing_CFA_Bayer_pyramid(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    levels: int = 4,
+    tile_size: int | Tuple[int, int] = 256,
+    dtype: Type[DTypeFloat] | None = None,
+    workers: int | None = None,
+    **kwargs: Any,
+) -> List[NDArrayFloat]:
+    """
+    Return the box pyramid of the demosaiced *RGB* colourspace array from
+    given *Bayer* CFA using given method, computed in a single tiled pass.
+
+    Each level is the 2x2 box mean of the previous level, the first level
+    being the full resolution *RGB* colourspace array.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    levels
+        Number of levels of the pyramid, including the full resolution level.
+    tile_size
+        Size of the tiles cores, must be a multiple of :math:`2^{levels - 1}`
+        so that the tiles are aligned on the pixels of every level.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    workers
+        Number of threads demosaicing the tiles and reducing their cores, the
+        negative values wrap around the number of CPUs, i.e., -1 uses all the
+        CPUs.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+
+    Returns
+    -------
+    :class:`list`
+        Levels of the pyramid, from the full resolution to the coarsest one.
+
+    Raises
+    ------
+    ValueError
+        If the number of levels is not positive or if the tile size is not a
+        multiple of :math:`2^{levels - 1}`.
+
+    Notes
+    -----
+    -   The last row and column of a level with an odd number of rows and
+        columns are discarded by the next level.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Menon2007
+    >>> CFA = np.random.random([20, 24])
+    >>> pyramid = demosaicing_CFA_Bayer_pyramid(CFA, levels=3, tile_size=8)
+    >>> [level.shape for level in pyramid]
+    [(20, 24, 3), (10, 12, 3), (5, 6, 3)]
+    >>> np.array_equal(pyramid[0], demosaicing_CFA_Bayer_Menon2007(CFA))
+    True
+    """
+
+    CFA = np.squeeze(as_float_array(CFA, dtype))
+    dtype = CFA.dtype
+
+    levels = int(levels)
+    t_y, t_x = (tile_size, tile_size) if np.isscalar(tile_size) else tile_size
+    if levels < 1 or t_y % 2 ** (levels - 1) or t_x % 2 ** (levels - 1):
+        raise ValueError(
+            f'"levels" {levels} must be positive and "tile_size" {tile_size!r} '
+            f"a multiple of {2 ** max(levels - 1, 0)}!"
+        )
+
+    method = validate_method(method, tuple(DEMOSAICING_CFA_BAYER_METHODS))
+    function = DEMOSAICING_CFA_BAYER_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+    halo = halo_demosaicing_CFA_Bayer(method, **kwargs)
+
+    pyramid = [np.empty((*CFA.shape, 3), dtype)]
+    for _level in range(1, levels):
+        *shape_b, height, width, channels = pyramid[-1].shape
+        pyramid.append(np.empty((*shape_b, height // 2, width // 2, channels), dtype))
+
+    def reduce_core(core: Tuple[Any, ...]) -> None:
+        """
+        Reduce the core of a tile, written in the first level, into the
+        coarser levels.
+        """
+
+        _ellipsis, s_y, s_x = core
+        y_0, y_1, x_0, x_1 = s_y.start, s_y.stop, s_x.start, s_x.stop
+
+        for source, target in zip(pyramid[:-1], pyramid[1:]):
+            # The core starts on an even row and column of every level but the
+            # last, its last row and column are discarded if they are odd.
+            y_0, y_1 = y_0 // 2, y_0 // 2 + (y_1 - y_0) // 2
+            x_0, x_1 = x_0 // 2, x_0 // 2 + (x_1 - x_0) // 2
+
+            S = source[..., 2 * y_0 : 2 * y_1, 2 * x_0 : 2 * x_1, :]
+            T = target[..., y_0:y_1, x_0:x_1, :]
+
+            # Adding the pairs of rows first, their columns and channels being
+            # contiguous, is faster than adding the four strided samples.
+            S = np.add(S[..., 0::2, :, :], S[..., 1::2, :, :])
+            np.add(S[..., :, 0::2, :], S[..., :, 1::2, :], out=T)
+            T *= 0.25
+
+    demosaicing_tiles(
+        CFA,
+        pyramid[0],
+        function,
+        pattern,
+        dtype,
+        tiles_CFA_Bayer(CFA.shape, tile_size, halo),
+        workers,
+        reduce_core,
+        **kwargs,
+    )
+
+    return pyramid
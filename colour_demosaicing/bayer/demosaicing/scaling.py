@@ -0,0 +1,152 @@
+"""
+Scaled Bayer CFA Demosaicing
+============================
+
+Define the objects demosaicing *Bayer* CFA (Colour Filter Array) directly at a
+lower resolution, i.e., without reconstructing the full resolution *RGB*
+colourspace array.
+
+Each output pixel aggregates a block of *Bayer* quads: its red and blue
+components are the means of the red and blue sites of the block and its green
+component is the mean of the green sites, half scale being the classical 2x2
+superpixel reconstruction.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from colour.hints import (
+    ArrayLike,
+    DTypeFloat,
+    Literal,
+    NDArrayFloat,
+    Type,
+)
+from colour.utilities import as_float_array
+
+from colour_demosaicing.bayer import offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.common import output_array
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "demosaicing_CFA_Bayer_scaled",
+]
+
+
+def demosaicing_CFA_Bayer_scaled(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    factor: int = 2,
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+) -> NDArrayFloat:
+    """
+    Return the *RGB* colourspace array demosaiced from given *Bayer* CFA
+    directly at given integer downscaling factor by area aggregation of the
+    *Bayer* quads.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    factor
+        Downscaling factor, must be even, e.g., 2 for half scale, i.e., the
+        2x2 superpixel reconstruction, 4 for quarter scale.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If the factor is not even and positive or is larger than the *Bayer*
+        CFA.
+
+    Notes
+    -----
+    -   The trailing rows and columns of the *Bayer* CFA that do not fill a
+        block of given factor are discarded.
+    -   The block means are computed on the strided views of the *Bayer* CFA
+        phases, at most a temporary of the output size is allocated.
+
+    Examples
+    --------
+    >>> CFA = np.array(
+    ...     [
+    ...         [0.30980393, 0.36078432, 0.30588236, 0.3764706],
+    ...         [0.35686275, 0.39607844, 0.36078432, 0.40000001],
+    ...     ]
+    ... )
+    >>> demosaicing_CFA_Bayer_scaled(CFA)
+    array([[[ 0.30980393,  0.35882353,  0.39607844],
+            [ 0.30588236,  0.36862746,  0.40000001]]])
+    """
+
+    factor = int(factor)
+    if factor % 2 or factor <= 0:
+        raise ValueError(f'"factor" {factor} must be positive and even!')
+
+    CFA = np.squeeze(as_float_array(CFA, dtype))
+    *shape_b, height, width = CFA.shape
+    height, width = height // factor, width // factor
+
+    if height == 0 or width == 0:
+        raise ValueError(
+            f'"factor" {factor} is larger than the "CFA" {CFA.shape[-2:]} shape!'
+        )
+
+    RGB = output_array(out, (*shape_b, height, width, 3), CFA.dtype)
+    R, G, B = RGB[..., 0], RGB[..., 1], RGB[..., 2]
+
+    (R_y, R_x), (G_r_y, G_r_x), (G_b_y, G_b_x), (B_y, B_x) = offsets_CFA_Bayer(pattern)
+
+    # Number of *Bayer* quads along the sides of a block.
+    k = factor // 2
+
+    def phase(y: int, x: int) -> NDArrayFloat:
+        """
+        Return the *Bayer* CFA phase at given offset, split in blocks when
+        they have several quads, splitting the axes of the phase view does not
+        copy it.
+        """
+
+        C = CFA[..., y : height * factor : 2, x : width * factor : 2]
+
+        return C if k == 1 else np.reshape(C, (*shape_b, height, k, width, k))
+
+    # The reduction machinery being slow on single quad blocks, the phases
+    # are then used directly.
+    if k == 1:
+        R[...] = phase(R_y, R_x)
+        B[...] = phase(B_y, B_x)
+        np.add(phase(G_r_y, G_r_x), phase(G_b_y, G_b_x), out=G)
+        G *= 0.5
+    else:
+        np.sum(phase(R_y, R_x), axis=(-3, -1), out=R)
+        np.sum(phase(B_y, B_x), axis=(-3, -1), out=B)
+        np.sum(phase(G_r_y, G_r_x), axis=(-3, -1), out=G)
+        G += np.sum(phase(G_b_y, G_b_x), axis=(-3, -1))
+
+        R *= 1 / k**2
+        B *= 1 / k**2
+        G *= 0.5 / k**2
+
+    return RGB
@@ -0,0 +1,499 @@
+"""
+Streaming Bayer CFA Demosaicing
+===============================
+
+Define the objects demosaicing *Bayer* CFA (Colour Filter Array) rows as they
+are delivered, e.g., by scanline or line-scan sensors.
+
+The rows are accumulated in a fixed-size row buffer and the demosaiced *RGB*
+colourspace rows are emitted as soon as the rows covering the vertical halo of
+the demosaicing method have been received, the result being identical to that
+of the full frame demosaicing.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from colour.constants import DTYPE_FLOAT_DEFAULT
+from colour.hints import (
+    Any,
+    ArrayLike,
+    Callable,
+    Dict,
+    DTypeFloat,
+    Generator,
+    Iterable,
+    Literal,
+    NDArray,
+    NDArrayFloat,
+    Type,
+)
+from colour.utilities import (
+    filter_kwargs,
+    optional,
+    validate_method,
+)
+
+from colour_demosaicing.bayer import offsets_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.common import (
+    LAYOUTS_RGB,
+    as_array_CFA,
+    is_integer_dtype,
+    shape_RGB,
+)
+from colour_demosaicing.bayer.demosaicing.plan import DEMOSAICING_CFA_BAYER_METHODS
+from colour_demosaicing.bayer.demosaicing.tiling import (
+    _index_RGB,
+    halo_demosaicing_CFA_Bayer,
+)
+from colour_demosaicing.bayer.demosaicing.workspace import (
+    Workspace,
+    buffer_workspace,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "DemosaicingStream",
+    "demosaicing_CFA_Bayer_stream",
+]
+
+
+class DemosaicingStream:
+    """
+    Define a stream demosaicing the rows of a *Bayer* CFA of fixed width as
+    they are pushed.
+
+    The rows are accumulated in a row buffer holding at most the band size
+    plus twice the halo of the demosaicing method. The rows whose vertical
+    halo has been received are demosaiced and returned by the
+    :meth:`~colour_demosaicing.bayer.DemosaicingStream.push` method, the last
+    rows, demosaiced with the bottom border of the *Bayer* CFA, are returned
+    by the :meth:`~colour_demosaicing.bayer.DemosaicingStream.close` method.
+
+    Parameters
+    ----------
+    width
+        Width of the *Bayer* CFA.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    band_size
+        Maximum number of rows demosaiced at once, must be even.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute. Given the
+        *uint8* or *uint16* data type, the fixed-point path of the method is
+        used with integer *Bayer* CFA rows.
+    layout
+        Layout of the *RGB* colourspace rows: *interleaved*, i.e., of shape
+        :math:`(H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(3, H, W)`.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+
+    Attributes
+    ----------
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.width`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.pattern`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.method`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.dtype`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.layout`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.halo`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.rows_pushed`
+    -   :attr:`~colour_demosaicing.bayer.DemosaicingStream.rows_emitted`
+
+    Methods
+    -------
+    -   :meth:`~colour_demosaicing.bayer.DemosaicingStream.__init__`
+    -   :meth:`~colour_demosaicing.bayer.DemosaicingStream.push`
+    -   :meth:`~colour_demosaicing.bayer.DemosaicingStream.close`
+
+    Notes
+    -----
+    -   The bands start on even rows so that they have the *Bayer* CFA
+        pattern, the rows are thus emitted by pairs until the stream is
+        closed.
+    -   A stream must not be shared by concurrent calls.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Malvar2004
+    >>> CFA = np.random.random([12, 8])
+    >>> stream = DemosaicingStream(8, method="Malvar 2004")
+    >>> [len(stream.push(CFA[i : i + 4])) for i in range(0, 12, 4)]
+    [2, 4, 4]
+    >>> RGB = np.concatenate([stream.push(CFA[12:]), stream.close()])
+    >>> np.array_equal(RGB[-2:], demosaicing_CFA_Bayer_Malvar2004(CFA)[-2:])
+    True
+    """
+
+    def __init__(
+        self,
+        width: int,
+        pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+        method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+        | str = "Menon 2007",
+        band_size: int = 64,
+        dtype: Type[DTypeFloat] | None = None,
+        layout: Literal["interleaved", "planar"] | str = "interleaved",
+        **kwargs: Any,
+    ) -> None:
+        if band_size % 2 or band_size <= 0:
+            raise ValueError(f'"band_size" {band_size} must be positive and even!')
+
+        if kwargs.get("roi") is not None:
+            raise ValueError('"roi" argument is not supported by the streams!')
+
+        self._width: int = int(width)
+        # Validating the pattern once.
+        offsets_CFA_Bayer(pattern)
+        self._pattern: str = str(pattern).upper()
+        self._method: str = validate_method(
+            method, tuple(DEMOSAICING_CFA_BAYER_METHODS)
+        )
+        self._dtype: Type[DTypeFloat] = np.dtype(
+            optional(dtype, DTYPE_FLOAT_DEFAULT)
+        ).type
+        self._layout: str = validate_method(layout, LAYOUTS_RGB)
+        self._function: Callable = DEMOSAICING_CFA_BAYER_METHODS[self._method]
+        self._kwargs: Dict = filter_kwargs(self._function, **kwargs)
+        self._halo: int = halo_demosaicing_CFA_Bayer(self._method, **self._kwargs)
+
+        self._band_size: int = band_size
+        # The integer *Bayer* CFA rows are buffered with their own data type,
+        # the buffer is then allocated by the first push.
+        self._buffer: NDArray | None = (
+            None if is_integer_dtype(self._dtype) else self._allocate(self._dtype)
+        )
+        # Index in the *Bayer* CFA of the first row of the buffer, number of
+        # rows in the buffer and index of the next row to emit.
+        self._start: int = 0
+        self._count: int = 0
+        self._emitted: int = 0
+        self._closed: bool = False
+
+        self._workspace: Workspace = Workspace()
+
+    @property
+    def width(self) -> int:
+        """
+        Getter property for the width of the *Bayer* CFA.
+
+        Returns
+        -------
+        :class:`int`
+            Width of the *Bayer* CFA.
+        """
+
+        return self._width
+
+    @property
+    def pattern(self) -> str:
+        """
+        Getter property for the arrangement of the colour filters on the
+        pixel array.
+
+        Returns
+        -------
+        :class:`str`
+            Arrangement of the colour filters on the pixel array.
+        """
+
+        return self._pattern
+
+    @property
+    def method(self) -> str:
+        """
+        Getter property for the demosaicing method.
+
+        Returns
+        -------
+        :class:`str`
+            Demosaicing method.
+        """
+
+        return self._method
+
+    @property
+    def dtype(self) -> Type[DTypeFloat]:
+        """
+        Getter property for the floating point data type the computations
+        are performed with.
+
+        Returns
+        -------
+        :class:`type`
+            Floating point data type.
+        """
+
+        return self._dtype
+
+    @property
+    def layout(self) -> str:
+        """
+        Getter property for the layout of the *RGB* colourspace rows.
+
+        Returns
+        -------
+        :class:`str`
+            Layout of the *RGB* colourspace rows.
+        """
+
+        return self._layout
+
+    @property
+    def halo(self) -> int:
+        """
+        Getter property for the halo of the demosaicing method, i.e., the
+        number of rows that must be received after a row before it is
+        emitted.
+
+        Returns
+        -------
+        :class:`int`
+            Halo of the demosaicing method.
+        """
+
+        return self._halo
+
+    @property
+    def rows_pushed(self) -> int:
+        """
+        Getter property for the number of rows pushed.
+
+        Returns
+        -------
+        :class:`int`
+            Number of rows pushed.
+        """
+
+        return self._start + self._count
+
+    @property
+    def rows_emitted(self) -> int:
+        """
+        Getter property for the number of rows emitted.
+
+        Returns
+        -------
+        :class:`int`
+            Number of rows emitted.
+        """
+
+        return self._emitted
+
+    def _allocate(self, dtype: Type[DTypeFloat] | Any) -> NDArray:
+        """Allocate the row buffer with given *dtype*."""
+
+        return np.empty((self._band_size + 2 * self._halo, self._width), dtype)
+
+    def _demosaic(self, final: bool) -> NDArrayFloat | None:
+        """
+        Demosaic the rows whose halo has been received, or all the remaining
+        rows if given final, and discard the rows that are no longer needed.
+        """
+
+        count = self._start + self._count
+        e_0 = self._emitted
+        # The next band must start on an even row.
+        e_1 = count if final else (count - self._halo) // 2 * 2
+
+        if e_1 <= e_0:
+            return None
+
+        t_0 = max(e_0 - self._halo, 0)
+        t_1 = min(e_1 + self._halo, count)
+
+        CFA = self._buffer[t_0 - self._start : t_1 - self._start]
+        RGB = self._function(
+            CFA,
+            self._pattern,
+            dtype=self._dtype,
+            out=buffer_workspace(
+                self._workspace, "RGB", shape_RGB(CFA.shape, self._layout), self._dtype
+            ),
+            workspace=self._workspace,
+            layout=self._layout,
+            **self._kwargs,
+        )
+        RGB = np.copy(
+            RGB[
+                _index_RGB(
+                    (..., slice(e_0 - t_0, e_1 - t_0), slice(None)), self._layout
+                )
+            ]
+        )
+        self._emitted = e_1
+
+        # Discarding the rows before the halo of the next band.
+        discarded = max(e_1 - self._halo, 0) - self._start
+        if discarded > 0:
+            self._count -= discarded
+            self._buffer[: self._count] = self._buffer[
+                discarded : discarded + self._count
+            ]
+            self._start += discarded
+
+        return RGB
+
+    def push(self, rows: ArrayLike) -> NDArrayFloat:
+        """
+        Push given *Bayer* CFA rows and return the *RGB* colourspace rows
+        whose halo has been received.
+
+        Parameters
+        ----------
+        rows
+            *Bayer* CFA rows, a single row can be given.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            *RGB* colourspace rows, possibly none.
+
+        Raises
+        ------
+        ValueError
+            If the stream is closed or if the rows width does not match the
+            stream width.
+        """
+
+        if self._closed:
+            raise ValueError("The stream is closed!")
+
+        rows = np.reshape(as_array_CFA(rows, self._dtype), (-1, self._width))
+
+        if self._buffer is None:
+            self._buffer = self._allocate(rows.dtype)
+
+        bands = []
+        while len(rows):
+            count = min(len(self._buffer) - self._count, len(rows))
+            self._buffer[self._count : self._count + count] = rows[:count]
+            self._count += count
+            rows = rows[count:]
+
+            RGB = self._demosaic(False)
+            if RGB is not None:
+                bands.append(RGB)
+
+        if not bands:
+            return np.empty(shape_RGB((0, self._width), self._layout), self._dtype)
+
+        if len(bands) == 1:
+            return bands[0]
+
+        return np.concatenate(bands, 1 if self._layout == "planar" else 0)
+
+    def close(self) -> NDArrayFloat:
+        """
+        Close the stream and return the remaining *RGB* colourspace rows,
+        demosaiced with the bottom border of the *Bayer* CFA.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            *RGB* colourspace rows, possibly none.
+        """
+
+        if self._closed:
+            return np.empty(shape_RGB((0, self._width), self._layout), self._dtype)
+
+        self._closed = True
+
+        RGB = self._demosaic(True)
+
+        self._workspace.clear()
+
+        if RGB is None:
+            return np.empty(shape_RGB((0, self._width), self._layout), self._dtype)
+
+        return RGB
+
+
+def demosaicing_CFA_Bayer_stream(
+    rows: Iterable[ArrayLike],
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    band_size: int = 64,
+    dtype: Type[DTypeFloat] | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    **kwargs: Any,
+) -> Generator[NDArrayFloat, None, None]:
+    """
+    Demosaic given iterable of *Bayer* CFA rows with a
+    :class:`colour_demosaicing.bayer.DemosaicingStream` class instance and
+    generate the *RGB* colourspace rows as soon as they are available.
+
+    Parameters
+    ----------
+    rows
+        Iterable of *Bayer* CFA rows, e.g., the chunks delivered by a
+        line-scan sensor, the *Bayer* CFA width is that of the first chunk.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    band_size
+        Maximum number of rows demosaiced at once, must be even.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute. Given the
+        *uint8* or *uint16* data type, the fixed-point path of the method is
+        used with integer *Bayer* CFA rows.
+    layout
+        Layout of the *RGB* colourspace rows: *interleaved*, i.e., of shape
+        :math:`(H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(3, H, W)`.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+
+    Yields
+    ------
+    :class:`numpy.ndarray`
+        *RGB* colourspace rows.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Menon2007
+    >>> CFA = np.random.random([20, 8])
+    >>> RGB = np.concatenate(list(demosaicing_CFA_Bayer_stream(CFA)))
+    >>> np.array_equal(RGB, demosaicing_CFA_Bayer_Menon2007(CFA))
+    True
+    """
+
+    stream = None
+    for chunk in rows:
+        CFA = as_array_CFA(chunk, dtype)
+
+        if stream is None:
+            stream = DemosaicingStream(
+                CFA.shape[-1], pattern, method, band_size, dtype, layout, **kwargs
+            )
+
+        RGB = stream.push(CFA)
+        if len(RGB):
+            yield RGB
+
+    if stream is not None:
+        RGB = stream.close()
+        if len(RGB):
+            yield RGB
@@ -0,0 +1,144 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.batch` module.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    demosaicing_CFA_Bayer_batch,
+    demosaicing_CFA_Bayer_Malvar2004,
+    demosaicing_CFA_Bayer_Menon2007,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDemosaicing_CFA_Bayer_batch",
+]
+
+
+class TestDemosaicing_CFA_Bayer_batch:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.batch.\
+demosaicing_CFA_Bayer_batch` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_batch(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.batch.\
+demosaicing_CFA_Bayer_batch` definition.
+        """
+
+        generator = np.random.default_rng(14)
+        items = [generator.random((8 + i, 10)) for i in range(5)]
+        # Invalid item, the error must be isolated.
+        items.insert(2, np.zeros(3))
+
+        results = list(demosaicing_CFA_Bayer_batch(items, workers=2, chunk_size=2))
+
+        assert [result.index for result in results] == list(range(len(items)))
+
+        for result in results:
+            if result.index == 2:
+                assert result.RGB is None
+                assert isinstance(result.error, Exception)
+            else:
+                assert result.error is None
+                np.testing.assert_array_equal(
+                    result.RGB, demosaicing_CFA_Bayer_Menon2007(items[result.index])
+                )
+
+        results = list(
+            demosaicing_CFA_Bayer_batch(
+                iter(items),
+                "BGGR",
+                "Malvar 2004",
+                workers=2,
+                ordered=False,
+                dtype=np.float32,
+            )
+        )
+
+        assert sorted(result.index for result in results) == list(range(len(items)))
+
+        for result in results:
+            if result.index != 2:
+                np.testing.assert_array_equal(
+                    result.RGB,
+                    demosaicing_CFA_Bayer_Malvar2004(
+                        items[result.index], "BGGR", dtype=np.float32
+                    ),
+                )
+
+        with pytest.raises(ValueError):
+            list(demosaicing_CFA_Bayer_batch(items, refinig_step=False))
+
+        with pytest.raises(ValueError):
+            list(
+                demosaicing_CFA_Bayer_batch(
+                    items, method="Malvar 2004", refining_step=False
+                )
+            )
+
+        with pytest.raises(ValueError):
+            list(demosaicing_CFA_Bayer_batch(items, chunk_size=0))
+
+        with pytest.raises(ValueError):
+            list(demosaicing_CFA_Bayer_batch(items, roi=(0, 4, 0, 4)))
+
+    def test_layout(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.batch.\
+demosaicing_CFA_Bayer_batch` definition *layout* argument.
+        """
+
+        generator = np.random.default_rng(25)
+        items = [generator.random((8 + i, 10)) for i in range(3)]
+
+        for workers in (1, 2):
+            results = list(
+                demosaicing_CFA_Bayer_batch(items, workers=workers, layout="planar")
+            )
+
+            for result in results:
+                assert result.error is None
+                np.testing.assert_array_equal(
+                    result.RGB,
+                    demosaicing_CFA_Bayer_Menon2007(
+                        items[result.index], layout="planar"
+                    ),
+                )
+
+    def test_reader(self, tmp_path):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.batch.\
+demosaicing_CFA_Bayer_batch` definition *reader* argument.
+        """
+
+        CFA = np.random.default_rng(15).random((12, 14))
+        path = os.path.join(tmp_path, "CFA.npy")
+        np.save(path, CFA)
+
+        results = list(
+            demosaicing_CFA_Bayer_batch(
+                [path, os.path.join(tmp_path, "Missing.npy")],
+                workers=1,
+                reader=np.load,
+            )
+        )
+
+        np.testing.assert_array_equal(
+            results[0].RGB, demosaicing_CFA_Bayer_Menon2007(CFA)
+        )
+        assert isinstance(results[1].error, FileNotFoundError)
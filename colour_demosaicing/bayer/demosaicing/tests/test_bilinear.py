@@ -8,6 +8,7 @@ from __future__ import annotations
 import os
 
 import numpy as np
+import pytest
 from colour import read_image
 from colour.constants import TOLERANCE_ABSOLUTE_TESTS
 
@@ -54,3 +55,127 @@ demosaicing_CFA_Bayer_bilinear` definition.
                 read_image(str(RGB)),
                 atol=TOLERANCE_ABSOLUTE_TESTS,
             )
+
+    def test_dtype_demosaicing_CFA_Bayer_bilinear(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.bilinear.\
+demosaicing_CFA_Bayer_bilinear` definition *dtype* argument.
+        """
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            CFA = read_image(
+                os.path.join(ROOT_RESOURCES_BAYER, f"Lighthouse_CFA_{pattern}.exr")
+            )[..., 0]
+
+            RGB = demosaicing_CFA_Bayer_bilinear(CFA, pattern, dtype=np.float32)
+
+            assert RGB.dtype == np.float32
+
+            np.testing.assert_allclose(
+                RGB,
+                demosaicing_CFA_Bayer_bilinear(CFA, pattern, dtype=np.float64),
+                atol=1e-5,
+            )
+
+    def test_concurrent_demosaicing_CFA_Bayer_bilinear(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.bilinear.\
+demosaicing_CFA_Bayer_bilinear` definition *concurrent* argument.
+        """
+
+        CFA = np.random.default_rng(12).random((37, 52))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            np.testing.assert_array_equal(
+                demosaicing_CFA_Bayer_bilinear(CFA, pattern, concurrent=True),
+                demosaicing_CFA_Bayer_bilinear(CFA, pattern),
+            )
+
+    def test_batch_demosaicing_CFA_Bayer_bilinear(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.bilinear.\
+demosaicing_CFA_Bayer_bilinear` definition with batch dimensions.
+        """
+
+        CFA = np.random.default_rng(13).random((2, 3, 19, 26))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            RGB = demosaicing_CFA_Bayer_bilinear(CFA, pattern)
+
+            assert RGB.shape == (2, 3, 19, 26, 3)
+
+            for index in np.ndindex(*CFA.shape[:-2]):
+                np.testing.assert_array_equal(
+                    RGB[index], demosaicing_CFA_Bayer_bilinear(CFA[index], pattern)
+                )
+
+    def test_fixed_point_demosaicing_CFA_Bayer_bilinear(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.bilinear.\
+demosaicing_CFA_Bayer_bilinear` definition fixed-point path.
+        """
+
+        generator = np.random.default_rng(20)
+
+        for bits, dtype_CFA, dtype in (
+            (16, np.uint16, np.uint16),
+            (12, np.uint16, np.uint16),
+            (8, np.uint8, np.uint8),
+            (16, np.uint16, np.uint8),
+        ):
+            CFA = generator.integers(0, 2**bits, (2, 19, 26)).astype(dtype_CFA)
+
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                RGB = demosaicing_CFA_Bayer_bilinear(CFA, pattern, dtype=dtype)
+
+                assert RGB.dtype == dtype
+                # The floating point result rounded half up and saturated.
+                np.testing.assert_array_equal(
+                    RGB,
+                    np.clip(
+                        np.floor(demosaicing_CFA_Bayer_bilinear(CFA, pattern) + 0.5),
+                        0,
+                        np.iinfo(dtype).max,
+                    ),
+                )
+
+        with pytest.raises(ValueError):
+            demosaicing_CFA_Bayer_bilinear(np.zeros([4, 4]), dtype=np.uint16)
+
+    def test_layout_demosaicing_CFA_Bayer_bilinear(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.bilinear.\
+demosaicing_CFA_Bayer_bilinear` definition *layout* argument.
+        """
+
+        CFA = np.random.default_rng(23).integers(0, 2**16, (2, 19, 26))
+        CFA = CFA.astype(np.uint16)
+
+        for kwargs in ({}, {"concurrent": True}, {"dtype": np.uint16}):
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                RGB = np.moveaxis(
+                    demosaicing_CFA_Bayer_bilinear(CFA, pattern, **kwargs), -1, -3
+                )
+
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_bilinear(
+                        CFA, pattern, layout="planar", **kwargs
+                    ),
+                    RGB,
+                )
+
+                out = np.empty(RGB.shape, RGB.dtype)
+                assert (
+                    demosaicing_CFA_Bayer_bilinear(
+                        CFA, pattern, out=out, layout="planar", **kwargs
+                    )
+                    is out
+                )
+                np.testing.assert_array_equal(out, RGB)
+
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_bilinear(
+                        CFA, pattern, roi=(3, 14, 5, 20), layout="planar", **kwargs
+                    ),
+                    RGB[..., 3:14, 5:20],
+                )
@@ -0,0 +1,129 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.memmap` module.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    DEMOSAICING_CFA_BAYER_METHODS,
+    demosaicing_CFA_Bayer_memmap,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDemosaicing_CFA_Bayer_memmap",
+]
+
+
+class TestDemosaicing_CFA_Bayer_memmap:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.memmap.\
+demosaicing_CFA_Bayer_memmap` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_memmap(self, tmp_path):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.memmap.\
+demosaicing_CFA_Bayer_memmap` definition.
+        """
+
+        CFA = np.random.default_rng(15).integers(0, 4096, (30, 37), np.uint16)
+
+        path_CFA = os.path.join(tmp_path, "CFA.raw")
+        CFA_m = np.memmap(path_CFA, np.uint16, mode="w+", shape=(2, *CFA.shape))
+        CFA_m[1] = CFA
+        CFA_m.flush()
+        offset = CFA.nbytes
+
+        path_npy = os.path.join(tmp_path, "CFA.npy")
+        np.save(path_npy, CFA)
+
+        for method, kwargs in (
+            ("Bilinear", {}),
+            ("Malvar 2004", {}),
+            ("Menon 2007", {}),
+            ("Menon 2007", {"refining_step": False}),
+        ):
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                RGB = DEMOSAICING_CFA_BAYER_METHODS[method](CFA, pattern, **kwargs)
+
+                path_RGB = os.path.join(tmp_path, "RGB.raw")
+                demosaicing_CFA_Bayer_memmap(
+                    path_CFA,
+                    path_RGB,
+                    pattern,
+                    method,
+                    band_size=4,
+                    shape=CFA.shape,
+                    offset=offset,
+                    **kwargs,
+                )
+                np.testing.assert_array_equal(
+                    np.memmap(path_RGB, RGB.dtype, mode="r", shape=RGB.shape), RGB
+                )
+
+                path_RGB = os.path.join(tmp_path, "RGB.npy")
+                demosaicing_CFA_Bayer_memmap(
+                    path_npy, path_RGB, pattern, method, band_size=10, **kwargs
+                )
+                np.testing.assert_array_equal(np.load(path_RGB), RGB)
+
+        RGB = np.memmap(
+            os.path.join(tmp_path, "RGB_f.raw"),
+            np.float32,
+            mode="w+",
+            shape=(*CFA.shape, 3),
+        )
+        np.testing.assert_array_equal(
+            demosaicing_CFA_Bayer_memmap(
+                CFA_m[1], RGB, dtype=np.float32, band_size=8, workers=2
+            ),
+            DEMOSAICING_CFA_BAYER_METHODS["Menon 2007"](CFA, dtype=np.float32),
+        )
+
+    def test_layout(self, tmp_path):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.memmap.\
+demosaicing_CFA_Bayer_memmap` definition *layout* argument.
+        """
+
+        CFA = np.random.default_rng(24).random((30, 37))
+        path_CFA = os.path.join(tmp_path, "CFA.npy")
+        np.save(path_CFA, CFA)
+
+        for method in ("Bilinear", "Malvar 2004", "Menon 2007"):
+            RGB = DEMOSAICING_CFA_BAYER_METHODS[method](CFA, layout="planar")
+
+            for workers in (1, 2):
+                path_RGB = os.path.join(tmp_path, "RGB.npy")
+                demosaicing_CFA_Bayer_memmap(
+                    path_CFA,
+                    path_RGB,
+                    method=method,
+                    band_size=4,
+                    workers=workers,
+                    layout="planar",
+                )
+                np.testing.assert_array_equal(np.load(path_RGB), RGB)
+
+            np.testing.assert_array_equal(
+                demosaicing_CFA_Bayer_memmap(
+                    CFA, method=method, band_size=8, layout="planar"
+                ),
+                RGB,
+            )
+
+        with pytest.raises(ValueError):
+            demosaicing_CFA_Bayer_memmap(CFA, roi=(0, 8, 0, 8))
@@ -6,13 +6,15 @@ Define the unit tests for the
 from __future__ import annotations
 
 import os
+import tracemalloc
 
 import numpy as np
 from colour import read_image
 from colour.constants import TOLERANCE_ABSOLUTE_TESTS
 
 from colour_demosaicing import ROOT_RESOURCES_TESTS
-from colour_demosaicing.bayer import demosaicing_CFA_Bayer_Menon2007
+from colour_demosaicing.bayer import demosaicing_CFA_Bayer_Menon2007, masks_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.menon2007 import refining_step_Menon2007
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -67,3 +69,133 @@ demosaicing_CFA_Bayer_Menon2007` definition.
                 read_image(str(RGB)),
                 atol=TOLERANCE_ABSOLUTE_TESTS,
             )
+
+    def test_dtype_demosaicing_CFA_Bayer_Menon2007(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.menon2007.\
+demosaicing_CFA_Bayer_Menon2007` definition *dtype* argument.
+        """
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            CFA = read_image(
+                os.path.join(ROOT_RESOURCES_BAYER, f"Lighthouse_CFA_{pattern}.exr")
+            )[..., 0]
+
+            for refining_step in (True, False):
+                RGB = demosaicing_CFA_Bayer_Menon2007(
+                    CFA, pattern, refining_step, dtype=np.float32
+                )
+
+                assert RGB.dtype == np.float32
+
+                # The best directional reconstruction might differ where both
+                # directions are equally good.
+                delta = np.abs(
+                    RGB
+                    - demosaicing_CFA_Bayer_Menon2007(
+                        CFA, pattern, refining_step, dtype=np.float64
+                    )
+                )
+                assert np.mean(delta) < 1e-5
+                assert np.percentile(delta, 99.9) < 1e-5
+
+    def test_memory_demosaicing_CFA_Bayer_Menon2007(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.menon2007.\
+demosaicing_CFA_Bayer_Menon2007` definition peak memory usage.
+        """
+
+        CFA = np.random.default_rng(4).random((256, 256))
+
+        for refining_step in (True, False):
+            tracemalloc.start()
+            try:
+                RGB = demosaicing_CFA_Bayer_Menon2007(CFA, refining_step=refining_step)
+                _size, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            assert peak <= 2.5 * RGB.nbytes
+
+    def test_concurrent_demosaicing_CFA_Bayer_Menon2007(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.menon2007.\
+demosaicing_CFA_Bayer_Menon2007` definition *concurrent* argument.
+        """
+
+        CFA = np.random.default_rng(12).random((37, 52))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            np.testing.assert_array_equal(
+                demosaicing_CFA_Bayer_Menon2007(CFA, pattern, concurrent=True),
+                demosaicing_CFA_Bayer_Menon2007(CFA, pattern),
+            )
+
+    def test_batch_demosaicing_CFA_Bayer_Menon2007(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.menon2007.\
+demosaicing_CFA_Bayer_Menon2007` definition with batch dimensions.
+        """
+
+        CFA = np.random.default_rng(13).random((2, 3, 19, 26))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            RGB = demosaicing_CFA_Bayer_Menon2007(CFA, pattern)
+
+            assert RGB.shape == (2, 3, 19, 26, 3)
+
+            for index in np.ndindex(*CFA.shape[:-2]):
+                np.testing.assert_array_equal(
+                    RGB[index], demosaicing_CFA_Bayer_Menon2007(CFA[index], pattern)
+                )
+
+    def test_layout_demosaicing_CFA_Bayer_Menon2007(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.menon2007.\
+demosaicing_CFA_Bayer_Menon2007` definition *layout* argument.
+        """
+
+        CFA = np.random.default_rng(23).random((2, 19, 26))
+
+        for kwargs in ({}, {"refining_step": False}, {"concurrent": True}):
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                RGB = np.moveaxis(
+                    demosaicing_CFA_Bayer_Menon2007(CFA, pattern, **kwargs), -1, -3
+                )
+
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_Menon2007(
+                        CFA, pattern, layout="planar", **kwargs
+                    ),
+                    RGB,
+                )
+
+                out = np.empty(RGB.shape, RGB.dtype)
+                assert (
+                    demosaicing_CFA_Bayer_Menon2007(
+                        CFA, pattern, out=out, layout="planar", **kwargs
+                    )
+                    is out
+                )
+                np.testing.assert_array_equal(out, RGB)
+
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_Menon2007(
+                        CFA, pattern, roi=(3, 14, 5, 20), layout="planar", **kwargs
+                    ),
+                    RGB[..., 3:14, 5:20],
+                )
+
+        RGB = demosaicing_CFA_Bayer_Menon2007(CFA[0], refining_step=False)
+        RGB_m = np.stack(masks_CFA_Bayer(CFA.shape[-2:]), -1)
+        M = np.ones(CFA.shape[-2:])
+
+        np.testing.assert_array_equal(
+            refining_step_Menon2007(
+                np.moveaxis(RGB, -1, -3),
+                np.moveaxis(RGB_m, -1, -3),
+                M,
+                layout="planar",
+            ),
+            np.moveaxis(refining_step_Menon2007(RGB, RGB_m, M), -1, -3),
+        )
@@ -0,0 +1,135 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.plan` module.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    DEMOSAICING_CFA_BAYER_METHODS,
+    DemosaicingPlan,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDemosaicingPlan",
+]
+
+
+class TestDemosaicingPlan:
+    """
+    Define :class:`colour_demosaicing.bayer.demosaicing.plan.DemosaicingPlan`
+    class unit tests methods.
+    """
+
+    def test__call__(self):
+        """
+        Test :meth:`colour_demosaicing.bayer.demosaicing.plan.DemosaicingPlan.\
+__call__` method.
+        """
+
+        CFA = np.random.default_rng(16).random((32, 48))
+
+        for method in ("Bilinear", "Malvar 2004", "Menon 2007"):
+            function = DEMOSAICING_CFA_BAYER_METHODS[method]
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                plan = DemosaicingPlan(CFA.shape, pattern, method)
+
+                for _ in range(2):
+                    np.testing.assert_array_equal(plan(CFA), function(CFA, pattern))
+
+                RGB = np.empty([*CFA.shape, 3])
+                assert plan(CFA, out=RGB) is RGB
+
+        plan = DemosaicingPlan(CFA.shape, method="Menon 2007", refining_step=False)
+        np.testing.assert_array_equal(
+            plan(CFA),
+            DEMOSAICING_CFA_BAYER_METHODS["Menon 2007"](CFA, refining_step=False),
+        )
+
+        plan = DemosaicingPlan(CFA.shape, dtype=np.float32)
+        assert plan(CFA).dtype == np.float32
+
+        CFA_i = np.round(CFA * 1023).astype(np.uint16)
+        for method in ("Bilinear", "Malvar 2004"):
+            function = DEMOSAICING_CFA_BAYER_METHODS[method]
+            for dtype in (np.uint8, np.uint16):
+                plan = DemosaicingPlan(CFA.shape, method=method, dtype=dtype)
+
+                for _ in range(2):
+                    np.testing.assert_array_equal(
+                        plan(CFA_i), function(CFA_i, dtype=dtype)
+                    )
+
+        with pytest.raises(ValueError):
+            plan(CFA[:16])
+
+        plan = DemosaicingPlan((1, *CFA.shape))
+        assert plan.shape == CFA.shape
+        np.testing.assert_array_equal(
+            plan(CFA[None]), DEMOSAICING_CFA_BAYER_METHODS["Menon 2007"](CFA)
+        )
+
+        with pytest.raises(ValueError):
+            DemosaicingPlan(CFA.shape, method="Malvar 2004", refining_step=False)
+
+        with pytest.raises(ValueError):
+            DemosaicingPlan(CFA.shape, refinig_step=False)
+
+    def test_nbytes(self):
+        """
+        Test :attr:`colour_demosaicing.bayer.demosaicing.plan.DemosaicingPlan.\
+nbytes` property.
+        """
+
+        nbytes = [
+            DemosaicingPlan((32, 48), method=method, dtype=dtype).nbytes
+            for method in ("Malvar 2004", "Menon 2007")
+            for dtype in (np.float64, np.float32)
+        ]
+
+        assert nbytes[0] == 2 * nbytes[1]
+        assert nbytes[2] > nbytes[0]
+
+    def test_pickle(self):
+        """
+        Test :class:`colour_demosaicing.bayer.demosaicing.plan.DemosaicingPlan`
+        class pickling.
+        """
+
+        CFA = np.random.default_rng(16).random((32, 48))
+
+        plan = DemosaicingPlan(CFA.shape, "GRBG", refining_step=False)
+        plan_u = pickle.loads(pickle.dumps(plan))  # noqa: S301
+
+        assert plan_u.pattern == plan.pattern
+        assert plan_u.kwargs == plan.kwargs
+        assert plan_u.nbytes == plan.nbytes
+        assert len(pickle.dumps(plan)) < plan.nbytes
+        np.testing.assert_array_equal(plan_u(CFA), plan(CFA))
+
+    def test__repr__(self):
+        """
+        Test :meth:`colour_demosaicing.bayer.demosaicing.plan.DemosaicingPlan.\
+__repr__` method.
+        """
+
+        plan = DemosaicingPlan((32, 48), "grbg", "DDFAPD", refining_step=False)
+
+        assert plan.method == "DDFAPD"
+        assert repr(plan) == (
+            "DemosaicingPlan((32, 48), 'GRBG', 'DDFAPD', dtype=np.float64, "
+            "refining_step=False)"
+        )
+        assert repr(eval(repr(plan))) == repr(plan)  # noqa: S307
@@ -0,0 +1,71 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.pyramid` module.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    DEMOSAICING_CFA_BAYER_METHODS,
+    demosaicing_CFA_Bayer_pyramid,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDemosaicing_CFA_Bayer_pyramid",
+]
+
+
+class TestDemosaicing_CFA_Bayer_pyramid:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.pyramid.\
+demosaicing_CFA_Bayer_pyramid` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_pyramid(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.pyramid.\
+demosaicing_CFA_Bayer_pyramid` definition.
+        """
+
+        CFA = np.random.default_rng(19).random((2, 37, 45))
+
+        for method, tile_size, workers in (
+            ("Bilinear", 8, None),
+            ("Malvar 2004", (16, 8), 2),
+            ("Menon 2007", 64, None),
+        ):
+            pyramid = demosaicing_CFA_Bayer_pyramid(
+                CFA, "GRBG", method, 4, tile_size, workers=workers
+            )
+
+            RGB = DEMOSAICING_CFA_BAYER_METHODS[method](CFA, "GRBG")
+            np.testing.assert_array_equal(pyramid[0], RGB)
+
+            for level in pyramid[1:]:
+                *shape_b, height, width, channels = RGB.shape
+                height, width = height // 2, width // 2
+                RGB = np.mean(
+                    np.reshape(
+                        RGB[..., : 2 * height, : 2 * width, :],
+                        (*shape_b, height, 2, width, 2, channels),
+                    ),
+                    axis=(-4, -2),
+                )
+
+                np.testing.assert_allclose(level, RGB, atol=1e-12)
+
+        assert len(demosaicing_CFA_Bayer_pyramid(CFA, levels=1)) == 1
+
+        for levels, tile_size in ((0, 8), (4, 12)):
+            with pytest.raises(ValueError):
+                demosaicing_CFA_Bayer_pyramid(CFA, levels=levels, tile_size=tile_size)
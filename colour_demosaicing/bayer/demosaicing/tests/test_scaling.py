@@ -0,0 +1,71 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.scaling` module.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    demosaicing_CFA_Bayer_scaled,
+    masks_CFA_Bayer,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDemosaicing_CFA_Bayer_scaled",
+]
+
+
+class TestDemosaicing_CFA_Bayer_scaled:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.scaling.\
+demosaicing_CFA_Bayer_scaled` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_scaled(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.scaling.\
+demosaicing_CFA_Bayer_scaled` definition.
+        """
+
+        CFA = np.random.default_rng(18).random((2, 19, 27))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            masks = masks_CFA_Bayer(CFA.shape[-2:], pattern)
+            for factor in (2, 4, 6):
+                RGB = demosaicing_CFA_Bayer_scaled(CFA, pattern, factor)
+
+                height, width = 19 // factor, 27 // factor
+                assert RGB.shape == (2, height, width, 3)
+
+                for y in range(height):
+                    for x in range(width):
+                        block = (
+                            slice(y * factor, (y + 1) * factor),
+                            slice(x * factor, (x + 1) * factor),
+                        )
+                        for i, mask in enumerate(masks):
+                            np.testing.assert_allclose(
+                                RGB[:, y, x, i],
+                                np.mean(CFA[:, block[0], block[1]][:, mask[block]], -1),
+                                atol=1e-12,
+                            )
+
+        RGB = np.empty([9, 13, 3], np.float32)
+        assert demosaicing_CFA_Bayer_scaled(CFA[0], dtype=np.float32, out=RGB) is RGB
+
+        for factor in (0, 3):
+            with pytest.raises(ValueError):
+                demosaicing_CFA_Bayer_scaled(CFA, factor=factor)
+
+        with pytest.raises(ValueError):
+            demosaicing_CFA_Bayer_scaled(CFA, factor=20)
@@ -0,0 +1,189 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.stream` module.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    DEMOSAICING_CFA_BAYER_METHODS,
+    DemosaicingStream,
+    demosaicing_CFA_Bayer_stream,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestDemosaicing_CFA_Bayer_stream",
+    "TestDemosaicingStream",
+]
+
+
+class TestDemosaicingStream:
+    """
+    Define :class:`colour_demosaicing.bayer.demosaicing.stream.\
+DemosaicingStream` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """Test the presence of required attributes."""
+
+        required_attributes = (
+            "width",
+            "pattern",
+            "method",
+            "dtype",
+            "layout",
+            "halo",
+            "rows_pushed",
+            "rows_emitted",
+        )
+
+        for attribute in required_attributes:
+            assert attribute in dir(DemosaicingStream)
+
+    def test_required_methods(self):
+        """Test the presence of required methods."""
+
+        required_methods = ("__init__", "push", "close")
+
+        for method in required_methods:
+            assert method in dir(DemosaicingStream)
+
+    def test_push(self):
+        """
+        Test :meth:`colour_demosaicing.bayer.demosaicing.stream.\
+DemosaicingStream.push` method.
+        """
+
+        generator = np.random.default_rng(16)
+
+        for height in (5, 31):
+            CFA = generator.random((height, 13))
+            for method, kwargs in (
+                ("Bilinear", {}),
+                ("Malvar 2004", {}),
+                ("Menon 2007", {}),
+                ("Menon 2007", {"refining_step": False}),
+            ):
+                for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                    RGB = DEMOSAICING_CFA_BAYER_METHODS[method](CFA, pattern, **kwargs)
+                    for rows in (1, 6):
+                        stream = DemosaicingStream(13, pattern, method, 4, **kwargs)
+                        RGB_s = [
+                            stream.push(CFA[i : i + rows])
+                            for i in range(0, height, rows)
+                        ]
+
+                        # The rows are emitted once their halo is received.
+                        assert stream.rows_emitted <= max(height - stream.halo, 0)
+
+                        RGB_s.append(stream.close())
+
+                        np.testing.assert_array_equal(np.concatenate(RGB_s), RGB)
+
+        CFA = np.round(generator.random((31, 13)) * 1023).astype(np.uint16)
+        for method in ("Bilinear", "Malvar 2004"):
+            for dtype in (np.uint8, np.uint16):
+                RGB = DEMOSAICING_CFA_BAYER_METHODS[method](CFA, "GRBG", dtype=dtype)
+                stream = DemosaicingStream(13, "GRBG", method, 4, dtype)
+                RGB_s = [stream.push(CFA[i : i + 6]) for i in range(0, 31, 6)]
+                RGB_s.append(stream.close())
+
+                assert np.concatenate(RGB_s).dtype == dtype
+                np.testing.assert_array_equal(np.concatenate(RGB_s), RGB)
+
+        stream = DemosaicingStream(8)
+        stream.push(np.zeros([2, 8]))
+        assert stream.rows_pushed == 2
+        assert stream.close().shape == (2, 8, 3)
+        assert stream.close().shape == (0, 8, 3)
+
+        with pytest.raises(ValueError):
+            stream.push(np.zeros(8))
+
+        with pytest.raises(ValueError):
+            DemosaicingStream(8).push(np.zeros(6))
+
+        with pytest.raises(ValueError):
+            DemosaicingStream(8, band_size=3)
+
+        with pytest.raises(ValueError):
+            DemosaicingStream(8, roi=(0, 4, 0, 4))
+
+    def test_layout(self):
+        """
+        Test :class:`colour_demosaicing.bayer.demosaicing.stream.\
+DemosaicingStream` class *layout* argument.
+        """
+
+        CFA = np.random.default_rng(26).random((31, 13))
+
+        for method in ("Bilinear", "Malvar 2004", "Menon 2007"):
+            RGB = DEMOSAICING_CFA_BAYER_METHODS[method](CFA, "GRBG", layout="planar")
+            stream = DemosaicingStream(13, "GRBG", method, 4, layout="planar")
+            RGB_s = [stream.push(CFA[i : i + 3]) for i in range(0, 31, 3)]
+            RGB_s.append(stream.close())
+
+            assert all(RGB_b.shape[:1] == (3,) for RGB_b in RGB_s)
+            np.testing.assert_array_equal(np.concatenate(RGB_s, 1), RGB)
+
+        stream = DemosaicingStream(8, layout="planar")
+        assert stream.layout == "planar"
+        assert stream.push(np.zeros([1, 8])).shape == (3, 0, 8)
+
+
+class TestDemosaicing_CFA_Bayer_stream:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.stream.\
+demosaicing_CFA_Bayer_stream` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_stream(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.stream.\
+demosaicing_CFA_Bayer_stream` definition.
+        """
+
+        CFA = np.random.default_rng(16).random((41, 10))
+
+        RGB = list(
+            demosaicing_CFA_Bayer_stream(
+                (CFA[i : i + 5] for i in range(0, 41, 5)),
+                "GBRG",
+                "Malvar 2004",
+                dtype=np.float32,
+            )
+        )
+
+        assert all(len(RGB_s) for RGB_s in RGB)
+        np.testing.assert_array_equal(
+            np.concatenate(RGB),
+            DEMOSAICING_CFA_BAYER_METHODS["Malvar 2004"](CFA, "GBRG", dtype=np.float32),
+        )
+
+        CFA = np.round(CFA * 1023).astype(np.uint16)
+
+        np.testing.assert_array_equal(
+            np.concatenate(
+                list(
+                    demosaicing_CFA_Bayer_stream(
+                        (CFA[i : i + 5] for i in range(0, 41, 5)),
+                        "GBRG",
+                        "Malvar 2004",
+                        dtype=np.uint16,
+                    )
+                )
+            ),
+            DEMOSAICING_CFA_BAYER_METHODS["Malvar 2004"](CFA, "GBRG", dtype=np.uint16),
+        )
+
+        assert list(demosaicing_CFA_Bayer_stream([])) == []
@@ -0,0 +1,253 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.tiling` module.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    DEMOSAICING_CFA_BAYER_METHODS,
+    demosaicing_CFA_Bayer_roi,
+    demosaicing_CFA_Bayer_tiled,
+    halo_demosaicing_CFA_Bayer,
+    tiles_CFA_Bayer,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestHalo_demosaicing_CFA_Bayer",
+    "TestTiles_CFA_Bayer",
+    "TestDemosaicing_CFA_Bayer_tiled",
+    "TestDemosaicing_CFA_Bayer_roi",
+]
+
+
+class TestHalo_demosaicing_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+halo_demosaicing_CFA_Bayer` definition unit tests methods.
+    """
+
+    def test_halo_demosaicing_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+halo_demosaicing_CFA_Bayer` definition.
+        """
+
+        assert halo_demosaicing_CFA_Bayer("Bilinear") == 2
+        assert halo_demosaicing_CFA_Bayer("Malvar 2004") == 2
+        assert halo_demosaicing_CFA_Bayer("Menon 2007") == 8
+        assert halo_demosaicing_CFA_Bayer("DDFAPD", refining_step=False) == 6
+
+
+class TestTiles_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+tiles_CFA_Bayer` definition unit tests methods.
+    """
+
+    def test_tiles_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+tiles_CFA_Bayer` definition.
+        """
+
+        shape = (13, 18)
+        coverage = np.zeros(shape, int)
+        for tile, core_tile, core in tiles_CFA_Bayer(shape, (4, 6), 2):
+            coverage[core] += 1
+
+            assert tile[-2].start % 2 == 0
+            assert tile[-1].start % 2 == 0
+            assert np.arange(shape[0])[tile[-2]][core_tile[-2]].tolist() == list(
+                range(shape[0])[core[-2]]
+            )
+            assert np.arange(shape[1])[tile[-1]][core_tile[-1]].tolist() == list(
+                range(shape[1])[core[-1]]
+            )
+
+        np.testing.assert_array_equal(coverage, 1)
+
+        with pytest.raises(ValueError):
+            list(tiles_CFA_Bayer(shape, 5))
+
+        with pytest.raises(ValueError):
+            list(tiles_CFA_Bayer(shape, 4, 3))
+
+
+class TestDemosaicing_CFA_Bayer_tiled:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_tiled` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_tiled(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_tiled` definition, the seams must be bit-identical to
+        the full frame demosaicing.
+        """
+
+        CFA = np.random.default_rng(10).random((29, 38))
+
+        for method, kwargs in (
+            ("Bilinear", {}),
+            ("Malvar 2004", {}),
+            ("Menon 2007", {}),
+            ("Menon 2007", {"refining_step": False}),
+        ):
+            function = DEMOSAICING_CFA_BAYER_METHODS[method]
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                RGB = function(CFA, pattern, **kwargs)
+                for tile_size in (4, (10, 16), 64):
+                    np.testing.assert_array_equal(
+                        demosaicing_CFA_Bayer_tiled(
+                            CFA, pattern, method, tile_size, **kwargs
+                        ),
+                        RGB,
+                    )
+
+    def test_out(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_tiled` definition "out" argument.
+        """
+
+        CFA = np.random.default_rng(10).random((20, 30)).astype(np.float32)
+        RGB = np.empty([*CFA.shape, 3], np.float32)
+
+        assert (
+            demosaicing_CFA_Bayer_tiled(CFA, tile_size=8, dtype=np.float32, out=RGB)
+            is RGB
+        )
+        np.testing.assert_array_equal(
+            RGB,
+            DEMOSAICING_CFA_BAYER_METHODS["Menon 2007"](CFA, dtype=np.float32),
+        )
+
+    def test_workers(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_tiled` definition "workers" argument and the
+        demosaicing definitions "workers" argument.
+        """
+
+        CFA = np.random.default_rng(11).random((70, 90))
+
+        for method in ("Bilinear", "Malvar 2004", "Menon 2007"):
+            function = DEMOSAICING_CFA_BAYER_METHODS[method]
+            RGB = function(CFA)
+
+            np.testing.assert_array_equal(
+                demosaicing_CFA_Bayer_tiled(
+                    CFA, method=method, tile_size=16, workers=3
+                ),
+                RGB,
+            )
+            np.testing.assert_array_equal(function(CFA, workers=2), RGB)
+
+        with pytest.raises(ValueError):
+            demosaicing_CFA_Bayer_tiled(CFA, workers=0)
+
+        with pytest.raises(ValueError):
+            demosaicing_CFA_Bayer_tiled(CFA, roi=(0, 4, 0, 4))
+
+    def test_layout(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_tiled` definition *layout* argument.
+        """
+
+        CFA = np.random.default_rng(23).random((2, 29, 38))
+
+        for method in ("Bilinear", "Malvar 2004", "Menon 2007"):
+            RGB = np.moveaxis(DEMOSAICING_CFA_BAYER_METHODS[method](CFA), -1, -3)
+
+            for workers in (1, 2):
+                np.testing.assert_array_equal(
+                    demosaicing_CFA_Bayer_tiled(
+                        CFA,
+                        method=method,
+                        tile_size=8,
+                        workers=workers,
+                        layout="planar",
+                    ),
+                    RGB,
+                )
+
+            np.testing.assert_array_equal(
+                demosaicing_CFA_Bayer_roi(
+                    CFA, (3, 10, 5, 12), method=method, layout="planar"
+                ),
+                RGB[..., 3:10, 5:12],
+            )
+
+
+class TestDemosaicing_CFA_Bayer_roi:
+    """
+    Define :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_roi` definition unit tests methods.
+    """
+
+    def test_demosaicing_CFA_Bayer_roi(self):
+        """
+        Test :func:`colour_demosaicing.bayer.demosaicing.tiling.\
+demosaicing_CFA_Bayer_roi` definition.
+        """
+
+        CFA = np.random.default_rng(17).random((29, 38))
+
+        for method, kwargs in (
+            ("Bilinear", {}),
+            ("Malvar 2004", {}),
+            ("Menon 2007", {}),
+            ("Menon 2007", {"refining_step": False}),
+        ):
+            function = DEMOSAICING_CFA_BAYER_METHODS[method]
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                RGB = function(CFA, pattern, **kwargs)
+                for y_0, y_1, x_0, x_1 in (
+                    (0, 29, 0, 38),
+                    (3, 10, 5, 12),
+                    (12, 13, 17, 18),
+                    (9, 29, 1, 37),
+                ):
+                    np.testing.assert_array_equal(
+                        demosaicing_CFA_Bayer_roi(
+                            CFA, (y_0, y_1, x_0, x_1), pattern, method, **kwargs
+                        ),
+                        RGB[y_0:y_1, x_0:x_1],
+                    )
+
+                # The demosaicing definitions delegate the region of interest.
+                np.testing.assert_array_equal(
+                    function(CFA, pattern, roi=(5, 16, 7, 20), **kwargs),
+                    RGB[5:16, 7:20],
+                )
+
+        RGB = np.empty([7, 7, 3], np.float32)
+        assert (
+            demosaicing_CFA_Bayer_roi(
+                CFA, (1, 8, 1, 8), dtype=np.float32, out=RGB, workers=2
+            )
+            is RGB
+        )
+        np.testing.assert_array_equal(
+            RGB,
+            DEMOSAICING_CFA_BAYER_METHODS["Menon 2007"](CFA, dtype=np.float32)[
+                1:8, 1:8
+            ],
+        )
+
+        for roi in ((0, 0, 0, 1), (-1, 2, 0, 2), (0, 30, 0, 2)):
+            with pytest.raises(ValueError):
+                demosaicing_CFA_Bayer_roi(CFA, roi)
@@ -0,0 +1,92 @@
+"""
+Define the unit tests for the
+:mod:`colour_demosaicing.bayer.demosaicing.workspace` module.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    Workspace,
+    demosaicing_CFA_Bayer_bilinear,
+    demosaicing_CFA_Bayer_Malvar2004,
+    demosaicing_CFA_Bayer_Menon2007,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestWorkspace",
+]
+
+
+class TestWorkspace:
+    """
+    Define :class:`colour_demosaicing.bayer.demosaicing.workspace.Workspace`
+    class unit tests methods.
+    """
+
+    def test_buffer(self):
+        """
+        Test :meth:`colour_demosaicing.bayer.demosaicing.workspace.Workspace.\
+buffer` method.
+        """
+
+        workspace = Workspace()
+        buffer = workspace.buffer("a", (4, 3), np.float64)
+
+        assert buffer.shape == (4, 3)
+        assert buffer.dtype == np.float64
+        assert workspace.buffer("a", (4, 3), np.float64) is buffer
+        assert workspace.buffer("a", (4, 3), np.float32) is not buffer
+        assert workspace.buffer("b", (4, 3), np.float32) is not buffer
+        assert len(workspace) == 2
+        assert workspace.nbytes == 2 * 4 * 3 * 4
+
+        workspace.clear()
+
+        assert len(workspace) == 0
+        assert workspace.nbytes == 0
+
+    def test_demosaicing(self):
+        """
+        Test the demosaicing definitions with a workspace and an output array:
+        the steady state calls must not perform any large allocation.
+        """
+
+        CFA = np.random.default_rng(8).random((512, 512))
+
+        for demosaicing_CFA_Bayer in (
+            demosaicing_CFA_Bayer_bilinear,
+            demosaicing_CFA_Bayer_Malvar2004,
+            demosaicing_CFA_Bayer_Menon2007,
+        ):
+            workspace = Workspace()
+            RGB = np.empty([*CFA.shape, 3])
+            demosaicing_CFA_Bayer(CFA, out=RGB, workspace=workspace)
+
+            tracemalloc.start()
+            try:
+                output = demosaicing_CFA_Bayer(CFA, out=RGB, workspace=workspace)
+                _size, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            assert output is RGB
+            np.testing.assert_array_equal(RGB, demosaicing_CFA_Bayer(CFA))
+
+            # Only the fixed size buffers of the "numpy" iterator are allowed,
+            # i.e., less than the size of a *Bayer* CFA phase.
+            assert peak < CFA.nbytes / 4
+
+            with pytest.raises(ValueError):
+                demosaicing_CFA_Bayer(CFA, out=np.empty([*CFA.shape, 3], np.float32))
@@ -0,0 +1,528 @@
+"""
+Tiled Bayer CFA Demosaicing
+===========================
+
+Define the objects demosaicing *Bayer* CFA (Colour Filter Array) tile by tile:
+the tiles are aligned to the 2x2 period of the *Bayer* pattern and extended by
+a halo covering the footprint of the demosaicing method so that the result is
+identical to that of the full frame demosaicing.
+
+The tiles are independent and can be demosaiced concurrently by a thread pool,
+the *Scipy* convolutions and the *Numpy* operations releasing the *GIL*.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from colour.hints import (
+    Any,
+    ArrayLike,
+    Callable,
+    DTypeFloat,
+    Generator,
+    Iterable,
+    Literal,
+    NDArrayFloat,
+    Tuple,
+    Type,
+)
+from colour.utilities import (
+    CanonicalMapping,
+    filter_kwargs,
+    validate_method,
+)
+
+from colour_demosaicing.bayer import shift_pattern_CFA_Bayer
+from colour_demosaicing.bayer.demosaicing.common import (
+    LAYOUTS_RGB,
+    as_array_CFA,
+    is_integer_dtype,
+    output_array,
+    shape_RGB,
+    workers_count,
+)
+from colour_demosaicing.bayer.demosaicing.plan import DEMOSAICING_CFA_BAYER_METHODS
+from colour_demosaicing.bayer.demosaicing.workspace import (
+    Workspace,
+    buffer_workspace,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "HALOS_DEMOSAICING_CFA_BAYER",
+    "halo_demosaicing_CFA_Bayer",
+    "tiles_CFA_Bayer",
+    "demosaicing_tiles",
+    "demosaicing_CFA_Bayer_tiled",
+    "demosaicing_CFA_Bayer_roi",
+]
+
+HALOS_DEMOSAICING_CFA_BAYER: CanonicalMapping = CanonicalMapping(
+    {
+        "Bilinear": 2,
+        "Malvar 2004": 2,
+        "Menon 2007": 8,
+    }
+)
+HALOS_DEMOSAICING_CFA_BAYER.__doc__ = """
+Halos of the *Bayer* CFA demosaicing methods, i.e., the smallest even number
+of pixels a tile must be extended by so that its core is demosaiced as in the
+full frame. The *Menon (2007)* halo includes the refining step footprint, it is
+6 pixels without it.
+
+Aliases:
+
+-   'DDFAPD': 'Menon 2007'
+"""
+HALOS_DEMOSAICING_CFA_BAYER["DDFAPD"] = HALOS_DEMOSAICING_CFA_BAYER["Menon 2007"]
+
+
+def halo_demosaicing_CFA_Bayer(
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    **kwargs: Any,
+) -> int:
+    """
+    Return the halo of given *Bayer* CFA demosaicing method, i.e., the number
+    of pixels a tile must be extended by so that its core is demosaiced as in
+    the full frame.
+
+    Parameters
+    ----------
+    method
+        Demosaicing method.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+
+    Returns
+    -------
+    :class:`int`
+        Halo of the demosaicing method.
+
+    Examples
+    --------
+    >>> halo_demosaicing_CFA_Bayer("Malvar 2004")
+    2
+    >>> halo_demosaicing_CFA_Bayer("Menon 2007", refining_step=False)
+    6
+    """
+
+    method = validate_method(method, tuple(HALOS_DEMOSAICING_CFA_BAYER))
+
+    halo = HALOS_DEMOSAICING_CFA_BAYER[method]
+
+    if method in ("menon 2007", "ddfapd") and not kwargs.get("refining_step", True):
+        halo -= 2
+
+    return halo
+
+
+def tiles_CFA_Bayer(
+    shape: Tuple[int, ...],
+    tile_size: int | Tuple[int, int] = 256,
+    halo: int = 0,
+) -> Generator[Tuple[Tuple[Any, ...], ...], None, None]:
+    """
+    Generate the tiles of a *Bayer* CFA with given shape.
+
+    The tiles cores partition the *Bayer* CFA, they start on even rows and
+    columns so that the tiles have the *Bayer* CFA pattern, and are extended
+    by given halo within the *Bayer* CFA.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA, the tiles span its leading dimensions.
+    tile_size
+        Size of the tiles cores, must be even.
+    halo
+        Number of pixels the tiles cores are extended by, must be even.
+
+    Yields
+    ------
+    :class:`tuple`
+        Slices of the tile in the *Bayer* CFA, of the core in the tile and of
+        the core in the *Bayer* CFA.
+
+    Raises
+    ------
+    ValueError
+        If the tile size or the halo is not even.
+
+    Examples
+    --------
+    >>> for tile, core_tile, core in tiles_CFA_Bayer((4, 6), 4, 2):
+    ...     print(tile[-1], core_tile[-1], core[-1])
+    slice(0, 6, None) slice(0, 4, None) slice(0, 4, None)
+    slice(2, 6, None) slice(2, 4, None) slice(4, 6, None)
+    """
+
+    height, width = shape[-2:]
+    t_y, t_x = (tile_size, tile_size) if np.isscalar(tile_size) else tile_size
+
+    if t_y % 2 or t_x % 2 or t_y <= 0 or t_x <= 0 or halo % 2 or halo < 0:
+        raise ValueError(
+            f'"tile_size" {tile_size!r} and "halo" {halo!r} must be positive and even!'
+        )
+
+    for y_0 in range(0, height, t_y):
+        y_1 = min(y_0 + t_y, height)
+        h_0, h_1 = max(y_0 - halo, 0), min(y_1 + halo, height)
+        for x_0 in range(0, width, t_x):
+            x_1 = min(x_0 + t_x, width)
+            w_0, w_1 = max(x_0 - halo, 0), min(x_1 + halo, width)
+
+            yield (
+                (..., slice(h_0, h_1), slice(w_0, w_1)),
+                (..., slice(y_0 - h_0, y_1 - h_0), slice(x_0 - w_0, x_1 - w_0)),
+                (..., slice(y_0, y_1), slice(x_0, x_1)),
+            )
+
+
+def _index_RGB(index: Tuple[Any, ...], layout: str) -> Tuple[Any, ...]:
+    """
+    Return given *Bayer* CFA index, i.e., of the form
+    ``(Ellipsis, rows, columns)``, extended to all the channels of an *RGB*
+    colourspace array of given layout.
+    """
+
+    if layout == "planar":
+        return (index[0], slice(None), *index[1:])
+
+    return (*index, slice(None))
+
+
+def demosaicing_tiles(
+    CFA: ArrayLike,
+    RGB: NDArrayFloat,
+    function: Callable,
+    pattern: str,
+    dtype: Type[DTypeFloat],
+    tiles: Iterable[Tuple[Tuple[Any, ...], ...]],
+    workers: int | None = None,
+    callback: Callable | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    **kwargs: Any,
+) -> None:
+    """
+    Demosaic given tiles of given *Bayer* CFA with given demosaicing
+    definition and write their cores into given *RGB* colourspace array.
+
+    The tiles are converted to given data type as they are demosaiced so that
+    only the tiles being demosaiced are loaded when the *Bayer* CFA is, e.g.,
+    a memory-mapped array.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA.
+    RGB
+        *RGB* colourspace array to write the tiles cores into.
+    function
+        Demosaicing definition.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the computations are performed with.
+    tiles
+        Tiles as generated by the
+        :func:`colour_demosaicing.bayer.demosaicing.tiling.tiles_CFA_Bayer`
+        definition.
+    workers
+        Number of threads demosaicing the tiles, the negative values wrap
+        around the number of CPUs, i.e., -1 uses all the CPUs.
+    callback
+        Callable called by the threads with the slices of the core of each
+        tile in the *RGB* colourspace array once written, e.g., to process it
+        while it is still in cache.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Other Parameters
+    ----------------
+    kwargs
+        Keywords arguments for the demosaicing definition.
+    """
+
+    layout = validate_method(layout, LAYOUTS_RGB)
+
+    # The tiles of the same shape demosaiced by the same thread share a
+    # workspace.
+    local = threading.local()
+
+    def demosaicing_tile(slices: Tuple[Tuple[Any, ...], ...]) -> None:
+        """Demosaic given tile and write its core into the output array."""
+
+        tile, core_tile, core = slices
+
+        workspaces = getattr(local, "workspaces", None)
+        if workspaces is None:
+            workspaces = local.workspaces = {}
+
+        CFA_t = as_array_CFA(CFA[tile], dtype)
+        workspace = workspaces.setdefault(CFA_t.shape, Workspace())
+        RGB_t = function(
+            CFA_t,
+            pattern,
+            dtype=dtype,
+            out=buffer_workspace(
+                workspace, "RGB", shape_RGB(CFA_t.shape, layout), dtype
+            ),
+            workspace=workspace,
+            layout=layout,
+            **kwargs,
+        )
+        RGB[_index_RGB(core, layout)] = RGB_t[_index_RGB(core_tile, layout)]
+
+        if callback is not None:
+            callback(core)
+
+    workers = workers_count(workers)
+
+    if workers == 1:
+        for slices in tiles:
+            demosaicing_tile(slices)
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            # Consuming the results to propagate the exceptions.
+            for _result in executor.map(demosaicing_tile, tiles):
+                pass
+
+
+def demosaicing_CFA_Bayer_tiled(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    tile_size: int | Tuple[int, int] = 256,
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    workers: int | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    **kwargs: Any,
+) -> NDArrayFloat:
+    """
+    Return the demosaiced *RGB* colourspace array from given *Bayer* CFA using
+    given method tile by tile.
+
+    The result is identical to that of the full frame demosaicing while the
+    working set is bounded by the tile size. The tiles are demosaiced
+    concurrently when using more than one worker.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    tile_size
+        Size of the tiles cores, must be even.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array into, a new array is
+        allocated if not given.
+    workers
+        Number of threads demosaicing the tiles, the negative values wrap
+        around the number of CPUs, i.e., -1 uses all the CPUs.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Other Parameters
+    ----------------
+    refining_step
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Perform refining step.
+    backend
+        {:func:`colour_demosaicing.demosaicing_CFA_Bayer_bilinear`,
+        :func:`colour_demosaicing.demosaicing_CFA_Bayer_Malvar2004`,
+        :func:`colour_demosaicing.demosaicing_CFA_Bayer_Menon2007`},
+        Compute backend demosaicing the tiles.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array.
+
+    Raises
+    ------
+    ValueError
+        If a region of interest is given, it is demosaiced with the
+        :func:`colour_demosaicing.bayer.demosaicing_CFA_Bayer_roi` definition.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Menon2007
+    >>> CFA = np.random.random([20, 24])
+    >>> np.array_equal(
+    ...     demosaicing_CFA_Bayer_tiled(CFA, tile_size=8),
+    ...     demosaicing_CFA_Bayer_Menon2007(CFA),
+    ... )
+    True
+    """
+
+    if kwargs.get("roi") is not None:
+        raise ValueError(
+            '"roi" argument is not supported by the tiled demosaicing, use the '
+            '"demosaicing_CFA_Bayer_roi" definition!'
+        )
+
+    CFA = np.squeeze(as_array_CFA(CFA, dtype))
+    # The output of the fixed-point path has the given integer *dtype*.
+    dtype = np.dtype(dtype).type if is_integer_dtype(dtype) else CFA.dtype
+
+    method = validate_method(method, tuple(DEMOSAICING_CFA_BAYER_METHODS))
+    function = DEMOSAICING_CFA_BAYER_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+    halo = halo_demosaicing_CFA_Bayer(method, **kwargs)
+
+    RGB = output_array(out, shape_RGB(CFA.shape, layout), dtype)
+
+    demosaicing_tiles(
+        CFA,
+        RGB,
+        function,
+        pattern,
+        dtype,
+        tiles_CFA_Bayer(CFA.shape, tile_size, halo),
+        workers,
+        layout=layout,
+        **kwargs,
+    )
+
+    return RGB
+
+
+def demosaicing_CFA_Bayer_roi(
+    CFA: ArrayLike,
+    roi: Tuple[int, int, int, int],
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    method: Literal["Bilinear", "Malvar 2004", "Menon 2007", "DDFAPD"]
+    | str = "Menon 2007",
+    dtype: Type[DTypeFloat] | None = None,
+    out: NDArrayFloat | None = None,
+    layout: Literal["interleaved", "planar"] | str = "interleaved",
+    **kwargs: Any,
+) -> NDArrayFloat:
+    """
+    Return the demosaiced *RGB* colourspace array of given region of interest
+    of given *Bayer* CFA using given method.
+
+    The region of interest is extended by the halo of the demosaicing method
+    within the *Bayer* CFA and the pattern is realigned on the origin of the
+    extended region so that the result is identical to the region of the full
+    frame demosaicing, at a cost proportional to the region area.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, its leading dimensions, e.g., burst frames, are batch
+        dimensions demosaiced in a single vectorised call.
+    roi
+        Region of interest :math:`(y_0, y_1, x_0, x_1)`, the rows and columns
+        bounds being exclusive.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    method
+        Demosaicing method.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
+    out
+        Array to write the *RGB* colourspace array of the region of interest
+        into, a new array is allocated if not given.
+    layout
+        Layout of the *RGB* colourspace array: *interleaved*, i.e., of shape
+        :math:`(..., H, W, 3)`, or *planar*, i.e., channel-first of shape
+        :math:`(..., 3, H, W)`.
+
+    Other Parameters
+    ----------------
+    kwargs
+        Keywords arguments for the demosaicing method, e.g.,
+        ``refining_step``, ``workspace``, ``workers``, ``concurrent`` or
+        ``backend``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGB* colourspace array of the region of interest.
+
+    Raises
+    ------
+    ValueError
+        If the region of interest is empty or not within the *Bayer* CFA.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Menon2007
+    >>> CFA = np.random.random([20, 24])
+    >>> np.array_equal(
+    ...     demosaicing_CFA_Bayer_roi(CFA, (3, 10, 5, 12)),
+    ...     demosaicing_CFA_Bayer_Menon2007(CFA)[3:10, 5:12],
+    ... )
+    True
+    """
+
+    CFA = np.squeeze(np.asarray(CFA))
+    height, width = CFA.shape[-2:]
+
+    y_0, y_1, x_0, x_1 = (int(bound) for bound in roi)
+    if not (0 <= y_0 < y_1 <= height and 0 <= x_0 < x_1 <= width):
+        raise ValueError(
+            f'"roi" {roi!r} must be a non-empty region within the "CFA" '
+            f"{height}x{width} shape!"
+        )
+
+    method = validate_method(method, tuple(DEMOSAICING_CFA_BAYER_METHODS))
+    function = DEMOSAICING_CFA_BAYER_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+    halo = halo_demosaicing_CFA_Bayer(method, **kwargs)
+
+    h_0, h_1 = max(y_0 - halo, 0), min(y_1 + halo, height)
+    w_0, w_1 = max(x_0 - halo, 0), min(x_1 + halo, width)
+
+    # Only the extended region is converted to floating point.
+    RGB_t = function(
+        as_array_CFA(CFA[..., h_0:h_1, w_0:w_1], dtype),
+        shift_pattern_CFA_Bayer(pattern, h_0, w_0),
+        dtype=dtype,
+        layout=layout,
+        **kwargs,
+    )
+    RGB_t = RGB_t[
+        _index_RGB(
+            (..., slice(y_0 - h_0, y_1 - h_0), slice(x_0 - w_0, x_1 - w_0)), layout
+        )
+    ]
+
+    if out is None:
+        return RGB_t
+
+    RGB = output_array(out, RGB_t.shape, RGB_t.dtype)
+    RGB[...] = RGB_t
+
+    return RGB
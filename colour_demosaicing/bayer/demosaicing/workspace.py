@@ -0,0 +1,189 @@
+"""
+Demosaicing Workspace
+=====================
+
+Define a workspace owning the scratch buffers of the *Bayer* CFA (Colour
+Filter Array) demosaicing definitions so that they can be reused across calls.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from colour.hints import Any, DTypeFloat, NDArray, Tuple, Type
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "Workspace",
+    "buffer_workspace",
+]
+
+
+class Workspace:
+    """
+    Define a workspace owning the scratch buffers of the *Bayer* CFA
+    demosaicing definitions.
+
+    Passing the same workspace to successive calls of a demosaicing
+    definition on *Bayer* CFA of the same shape and with the same *dtype*
+    reuses the scratch buffers allocated during the first call: the
+    subsequent calls do not perform any large allocation when the output is
+    also given with the ``out`` argument.
+
+    Attributes
+    ----------
+    -   :attr:`~colour_demosaicing.bayer.Workspace.nbytes`
+
+    Methods
+    -------
+    -   :meth:`~colour_demosaicing.bayer.Workspace.__init__`
+    -   :meth:`~colour_demosaicing.bayer.Workspace.__len__`
+    -   :meth:`~colour_demosaicing.bayer.Workspace.buffer`
+    -   :meth:`~colour_demosaicing.bayer.Workspace.clear`
+
+    Notes
+    -----
+    -   A workspace must not be shared by concurrent calls.
+    -   The buffers are reallocated when their shape or *dtype* changes, a
+        workspace can thus be used with any *Bayer* CFA but is only
+        effective with *Bayer* CFA of constant shape and *dtype*.
+
+    Examples
+    --------
+    >>> from colour_demosaicing import demosaicing_CFA_Bayer_Malvar2004
+    >>> CFA = np.random.random([8, 8])
+    >>> RGB = np.empty([8, 8, 3])
+    >>> workspace = Workspace()
+    >>> for _ in range(2):
+    ...     RGB = demosaicing_CFA_Bayer_Malvar2004(CFA, out=RGB, workspace=workspace)
+    >>> len(workspace)
+    2
+    """
+
+    def __init__(self) -> None:
+        self._buffers: dict = {}
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Getter property for the size in bytes of the buffers.
+
+        Returns
+        -------
+        :class:`int`
+            Size in bytes of the buffers.
+        """
+
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def __len__(self) -> int:
+        """
+        Return the number of buffers.
+
+        Returns
+        -------
+        :class:`int`
+            Number of buffers.
+        """
+
+        return len(self._buffers)
+
+    def buffer(
+        self, key: Any, shape: Tuple[int, ...], dtype: Type[DTypeFloat] | Any
+    ) -> NDArray:
+        """
+        Return the buffer with given key, shape and *dtype*, allocating it if
+        it does not exist or if its shape or *dtype* changed.
+
+        The buffer content is undefined.
+
+        Parameters
+        ----------
+        key
+            Buffer key.
+        shape
+            Buffer shape.
+        dtype
+            Buffer *dtype*.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Buffer.
+
+        Examples
+        --------
+        >>> workspace = Workspace()
+        >>> buffer = workspace.buffer("a", (2, 3), np.float32)
+        >>> buffer is workspace.buffer("a", (2, 3), np.float32)
+        True
+        >>> buffer is workspace.buffer("a", (3, 3), np.float32)
+        False
+        """
+
+        shape = tuple(shape)
+        buffer = self._buffers.get(key)
+
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype)
+            self._buffers[key] = buffer
+
+        return buffer
+
+    def clear(self) -> None:
+        """
+        Release the buffers.
+
+        Examples
+        --------
+        >>> workspace = Workspace()
+        >>> _buffer = workspace.buffer("a", (2, 3), np.float32)
+        >>> workspace.clear()
+        >>> len(workspace)
+        0
+        """
+
+        self._buffers.clear()
+
+
+def buffer_workspace(
+    workspace: Workspace | None,
+    key: Any,
+    shape: Tuple[int, ...],
+    dtype: Type[DTypeFloat] | Any,
+) -> NDArray:
+    """
+    Return the buffer with given key, shape and *dtype* from given workspace,
+    or a new array if the workspace is not given.
+
+    Parameters
+    ----------
+    workspace
+        Workspace owning the buffer.
+    key
+        Buffer key.
+    shape
+        Buffer shape.
+    dtype
+        Buffer *dtype*.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Buffer.
+
+    Examples
+    --------
+    >>> buffer_workspace(None, "a", (2, 3), np.float32).shape
+    (2, 3)
+    """
+
+    if workspace is None:
+        return np.empty(shape, dtype)
+
+    return workspace.buffer(key, shape, dtype)
@@ -7,9 +7,12 @@ Bayer CFA Masks
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+
 import numpy as np
-from colour.hints import Literal, NDArray, Tuple
-from colour.utilities import validate_method
+from colour.hints import Any, Literal, NDArray, Tuple
+from colour.utilities import is_caching_enabled, validate_method
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -19,10 +22,237 @@ __email__ = "colour-developers@colour-science.org"
 __status__ = "Production"
 
 __all__ = [
+    "CacheLRU",
+    "CACHE_MASKS_CFA_BAYER",
     "masks_CFA_Bayer",
 ]
 
 
+class CacheLRU:
+    """
+    Define a thread-safe *Least Recently Used* (LRU) cache of
+    :class:`numpy.ndarray` tuples whose total size is bounded in bytes.
+
+    The cached arrays are made read-only so that they can be shared safely
+    between callers, the arrays that are not cached, i.e., larger than the
+    size limit, are left untouched.
+
+    Parameters
+    ----------
+    size_limit
+        Maximum total size of the cached arrays in bytes, the least recently
+        used entries are evicted once it is exceeded.
+
+    Attributes
+    ----------
+    -   :attr:`~colour_demosaicing.bayer.masks.CacheLRU.size_limit`
+    -   :attr:`~colour_demosaicing.bayer.masks.CacheLRU.size`
+
+    Methods
+    -------
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.__init__`
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.__contains__`
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.__len__`
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.get`
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.put`
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.clear`
+    -   :meth:`~colour_demosaicing.bayer.masks.CacheLRU.info`
+
+    Examples
+    --------
+    >>> cache = CacheLRU(64)
+    >>> cache.put("a", (np.zeros(32, dtype="bool"),))
+    >>> cache.put("b", (np.zeros(32, dtype="bool"),))
+    >>> cache.put("c", (np.zeros(32, dtype="bool"),))
+    >>> "a" in cache, "b" in cache, "c" in cache
+    (False, True, True)
+    >>> cache.info()["size"]
+    64
+    """
+
+    def __init__(self, size_limit: int) -> None:
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._size_limit: int = 0
+
+        self.size_limit = size_limit
+
+    @property
+    def size_limit(self) -> int:
+        """
+        Getter and setter property for the maximum total size of the cached
+        arrays in bytes.
+
+        Parameters
+        ----------
+        value
+            Value to set the maximum total size with, setting it evicts the
+            least recently used entries as required.
+
+        Returns
+        -------
+        :class:`int`
+            Maximum total size of the cached arrays in bytes.
+        """
+
+        return self._size_limit
+
+    @size_limit.setter
+    def size_limit(self, value: int) -> None:
+        """Setter for the **self.size_limit** property."""
+
+        if value < 0:
+            raise ValueError('"size_limit" must be a positive integer!')
+
+        with self._lock:
+            self._size_limit = int(value)
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        Getter property for the current total size of the cached arrays in
+        bytes.
+
+        Returns
+        -------
+        :class:`int`
+            Current total size of the cached arrays in bytes.
+        """
+
+        return self._size
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Return whether the cache contains given key.
+
+        Parameters
+        ----------
+        key
+            Key to check the presence of.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the cache contains given key.
+        """
+
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in the cache.
+
+        Returns
+        -------
+        :class:`int`
+            Number of entries in the cache.
+        """
+
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries exceeding the size limit."""
+
+        while self._size > self._size_limit:
+            _key, arrays = self._entries.popitem(last=False)
+            self._size -= sum(array.nbytes for array in arrays)
+
+    def get(self, key: Any) -> Tuple[NDArray, ...] | None:
+        """
+        Return the arrays cached for given key and mark them as the most
+        recently used.
+
+        Parameters
+        ----------
+        key
+            Key to return the cached arrays of.
+
+        Returns
+        -------
+        :class:`tuple` or :py:data:`None`
+            Cached arrays or *None* if the key is not cached.
+        """
+
+        with self._lock:
+            arrays = self._entries.get(key)
+
+            if arrays is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+
+            return arrays
+
+    def put(self, key: Any, arrays: Tuple[NDArray, ...]) -> None:
+        """
+        Cache given arrays for given key, the arrays are made read-only.
+
+        Arrays larger than the size limit are not cached and remain writeable.
+
+        Parameters
+        ----------
+        key
+            Key to cache the arrays for.
+        arrays
+            Arrays to cache.
+        """
+
+        size = sum(array.nbytes for array in arrays)
+
+        if size > self._size_limit:
+            return
+
+        for array in arrays:
+            array.setflags(write=False)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= sum(array.nbytes for array in previous)
+
+            self._entries[key] = arrays
+            self._size += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Clear the cache entries and statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = self._hits = self._misses = 0
+
+    def info(self) -> dict[str, Any]:
+        """
+        Return the cache statistics.
+
+        Returns
+        -------
+        :class:`dict`
+            Number of hits, misses, entries, current size and size limit.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+            "size": self._size,
+            "size_limit": self._size_limit,
+        }
+
+
+CACHE_MASKS_CFA_BAYER: CacheLRU = CacheLRU(256 * 1024**2)
+"""
+*LRU* cache of the *Bayer* CFA masks keyed by shape and pattern, its size
+limit, in bytes, can be changed with the
+:attr:`~colour_demosaicing.bayer.masks.CacheLRU.size_limit` property.
+"""
+
+
 def masks_CFA_Bayer(
     shape: int | Tuple[int, ...],
     pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
@@ -33,7 +263,8 @@ def masks_CFA_Bayer(
     Parameters
     ----------
     shape
-        Dimensions of the *Bayer* CFA.
+        Dimensions of the *Bayer* CFA, the last two dimensions are the rows
+        and columns of the pixel array.
     pattern
         Arrangement of the colour filters on the pixel array.
 
@@ -42,6 +273,17 @@ def masks_CFA_Bayer(
     :class:`tuple`
         *Bayer* CFA red, green and blue masks.
 
+    Notes
+    -----
+    -   The masks are cached in the
+        :attr:`colour_demosaicing.bayer.masks.CACHE_MASKS_CFA_BAYER` *LRU*
+        cache so that repeated calls with the same shape and pattern do not
+        rebuild them, the cache honours
+        :func:`colour.utilities.is_caching_enabled` definition.
+    -   The cached masks are shared between the callers and thus read-only,
+        they must be copied before being modified in-place. The masks built
+        while caching is disabled, or too large to be cached, are writeable.
+
     Examples
     --------
     >>> from pprint import pprint
@@ -74,8 +316,25 @@ def masks_CFA_Bayer(
         '"{0}" CFA pattern is invalid, it must be one of {1}!',
     ).upper()
 
+    shape = (
+        (int(shape),)
+        if isinstance(shape, (int, np.integer))
+        else tuple(int(dimension) for dimension in shape)
+    )
+    key = (shape, pattern)
+
+    if is_caching_enabled():
+        masks = CACHE_MASKS_CFA_BAYER.get(key)
+        if masks is not None:
+            return masks
+
     channels = {channel: np.zeros(shape, dtype="bool") for channel in "RGB"}
     for channel, (y, x) in zip(pattern, [(0, 0), (0, 1), (1, 0), (1, 1)]):
-        channels[channel][y::2, x::2] = 1
+        channels[channel][..., y::2, x::2] = 1
+
+    masks = tuple(channels.values())
+
+    if is_caching_enabled():
+        CACHE_MASKS_CFA_BAYER.put(key, masks)
 
-    return tuple(channels.values())
+    return masks
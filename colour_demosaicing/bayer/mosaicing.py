@@ -7,7 +7,7 @@ Bayer CFA Mosaicing
 
 from __future__ import annotations
 
-from colour.hints import ArrayLike, Literal, NDArray
+from colour.hints import ArrayLike, DTypeFloat, Literal, NDArray, Type
 from colour.utilities import as_float_array, tsplit
 
 from colour_demosaicing.bayer import masks_CFA_Bayer
@@ -27,6 +27,7 @@ __all__ = [
 def mosaicing_CFA_Bayer(
     RGB: ArrayLike,
     pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    dtype: Type[DTypeFloat] | None = None,
 ) -> NDArray:
     """
     Return the *Bayer* CFA mosaic for a given *RGB* colourspace array.
@@ -34,9 +35,14 @@ def mosaicing_CFA_Bayer(
     Parameters
     ----------
     RGB
-        *RGB* colourspace array.
+        *RGB* colourspace array, its leading dimensions, e.g., burst frames,
+        are batch dimensions.
     pattern
         Arrangement of the colour filters on the pixel array.
+    dtype
+        Floating point data type the computations are performed with, default
+        to the :class:`numpy.dtype` defined by the
+        :attr:`colour.constant.DTYPE_FLOAT_DEFAULT` attribute.
 
     Returns
     -------
@@ -55,10 +61,10 @@ def mosaicing_CFA_Bayer(
            [ 1.,  0.]])
     """
 
-    RGB = as_float_array(RGB)
+    RGB = as_float_array(RGB, dtype)
 
-    R, G, B = tsplit(RGB)
-    R_m, G_m, B_m = masks_CFA_Bayer(RGB.shape[0:2], pattern)
+    R, G, B = tsplit(RGB, RGB.dtype)
+    R_m, G_m, B_m = masks_CFA_Bayer(RGB.shape[-3:-1], pattern)
 
     CFA = R * R_m + G * G_m + B * B_m
 
@@ -0,0 +1,239 @@
+"""
+Bayer CFA Phases
+================
+
+*Bayer* CFA (Colour Filter Array) phase planes, i.e., the quarter resolution
+sub-sampled planes of the four colour sites of the *Bayer* pattern.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from colour.hints import ArrayLike, Literal, NDArray, Tuple
+from colour.utilities import validate_method
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "offsets_CFA_Bayer",
+    "shift_pattern_CFA_Bayer",
+    "phases_CFA_Bayer",
+    "interleave_phases_CFA_Bayer",
+]
+
+
+def offsets_CFA_Bayer(
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Return the offsets of the red, green on red rows, green on blue rows and
+    blue sites within the 2x2 period of given *Bayer* CFA pattern.
+
+    Parameters
+    ----------
+    pattern
+        Arrangement of the colour filters on the pixel array.
+
+    Returns
+    -------
+    :class:`tuple`
+        *Bayer* CFA red, green on red rows, green on blue rows and blue sites
+        offsets.
+
+    Examples
+    --------
+    >>> offsets_CFA_Bayer()
+    ((0, 0), (0, 1), (1, 0), (1, 1))
+    >>> offsets_CFA_Bayer("GBRG")
+    ((1, 0), (1, 1), (0, 0), (0, 1))
+    """
+
+    pattern = validate_method(
+        pattern,
+        ("RGGB", "BGGR", "GRBG", "GBRG"),
+        '"{0}" CFA pattern is invalid, it must be one of {1}!',
+    ).upper()
+
+    R_y, R_x = divmod(pattern.index("R"), 2)
+    B_y, B_x = divmod(pattern.index("B"), 2)
+
+    return (R_y, R_x), (R_y, B_x), (B_y, R_x), (B_y, B_x)
+
+
+def shift_pattern_CFA_Bayer(
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    y: int = 0,
+    x: int = 0,
+) -> str:
+    """
+    Return the pattern of a *Bayer* CFA with given pattern cropped at given
+    row and column, i.e., the pattern realigned on the crop origin.
+
+    Parameters
+    ----------
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    y
+        Row of the crop origin.
+    x
+        Column of the crop origin.
+
+    Returns
+    -------
+    :class:`str`
+        Arrangement of the colour filters on the cropped pixel array.
+
+    Examples
+    --------
+    >>> shift_pattern_CFA_Bayer("RGGB", 1, 0)
+    'GBRG'
+    >>> shift_pattern_CFA_Bayer("RGGB", 3, 5)
+    'BGGR'
+    """
+
+    pattern = validate_method(
+        pattern,
+        ("RGGB", "BGGR", "GRBG", "GBRG"),
+        '"{0}" CFA pattern is invalid, it must be one of {1}!',
+    ).upper()
+
+    return "".join(
+        pattern[2 * ((i + y) % 2) + (j + x) % 2] for i in (0, 1) for j in (0, 1)
+    )
+
+
+def phases_CFA_Bayer(
+    CFA: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+) -> Tuple[NDArray, ...]:
+    """
+    Return the red, green on red rows, green on blue rows and blue phase
+    planes of given *Bayer* CFA.
+
+    The phase planes are strided views sharing the memory of the *Bayer* CFA,
+    no data is copied, and modifying them modifies the *Bayer* CFA.
+
+    Parameters
+    ----------
+    CFA
+        *Bayer* CFA, the last two axes are the rows and columns of the pixel
+        array.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+
+    Returns
+    -------
+    :class:`tuple`
+        *Bayer* CFA red, green on red rows, green on blue rows and blue phase
+        planes.
+
+    Notes
+    -----
+    -   The phase planes have a shape of :math:`(\\lceil H/2 \\rceil,
+        \\lceil W/2 \\rceil)` at most, :math:`H` and :math:`W` being the
+        height and width of the *Bayer* CFA: planes starting on the second row
+        or column are one row or column smaller when :math:`H` or :math:`W`
+        is odd.
+    -   A :math:`(H/2, W/2, 4)` array cannot be a view of the *Bayer* CFA
+        because the 2x2 period does not have a constant stride, use
+        :func:`numpy.stack` definition on the phase planes if such an array
+        is required.
+
+    Examples
+    --------
+    >>> CFA = np.arange(16).reshape([4, 4])
+    >>> R, G_r, G_b, B = phases_CFA_Bayer(CFA)
+    >>> R
+    array([[ 0,  2],
+           [ 8, 10]])
+    >>> G_r
+    array([[ 1,  3],
+           [ 9, 11]])
+    >>> R, G_r, G_b, B = phases_CFA_Bayer(CFA, "GBRG")
+    >>> R
+    array([[ 4,  6],
+           [12, 14]])
+    >>> np.shares_memory(CFA, R)
+    True
+    """
+
+    CFA = np.asarray(CFA)
+
+    return tuple(CFA[..., y::2, x::2] for y, x in offsets_CFA_Bayer(pattern))
+
+
+def interleave_phases_CFA_Bayer(
+    R: ArrayLike,
+    G_r: ArrayLike,
+    G_b: ArrayLike,
+    B: ArrayLike,
+    pattern: Literal["RGGB", "BGGR", "GRBG", "GBRG"] | str = "RGGB",
+    out: NDArray | None = None,
+) -> NDArray:
+    """
+    Interleave given red, green on red rows, green on blue rows and blue phase
+    planes into a *Bayer* CFA, i.e., the inverse of
+    :func:`colour_demosaicing.bayer.phases_CFA_Bayer` definition.
+
+    Parameters
+    ----------
+    R
+        *Bayer* CFA red phase plane.
+    G_r
+        *Bayer* CFA green on red rows phase plane.
+    G_b
+        *Bayer* CFA green on blue rows phase plane.
+    B
+        *Bayer* CFA blue phase plane.
+    pattern
+        Arrangement of the colour filters on the pixel array.
+    out
+        Array to write the *Bayer* CFA into, a new array is allocated if not
+        given.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *Bayer* CFA.
+
+    Examples
+    --------
+    >>> CFA = np.arange(16).reshape([4, 4])
+    >>> phases = phases_CFA_Bayer(CFA, "GRBG")
+    >>> interleave_phases_CFA_Bayer(*phases, pattern="GRBG")
+    array([[ 0,  1,  2,  3],
+           [ 4,  5,  6,  7],
+           [ 8,  9, 10, 11],
+           [12, 13, 14, 15]])
+    """
+
+    phases = [np.asarray(phase) for phase in (R, G_r, G_b, B)]
+    offsets = offsets_CFA_Bayer(pattern)
+
+    # The two phase planes starting on the first column span all the rows, the
+    # two phase planes starting on the first row span all the columns.
+    height = sum(phase.shape[-2] for phase, (_y, x) in zip(phases, offsets) if x == 0)
+    width = sum(phase.shape[-1] for phase, (y, _x) in zip(phases, offsets) if y == 0)
+    shape = (
+        *np.broadcast_shapes(*[phase.shape[:-2] for phase in phases]),
+        height,
+        width,
+    )
+
+    if out is None:
+        out = np.empty(shape, dtype=np.result_type(*phases))
+    elif out.shape != shape:
+        raise ValueError(
+            f'"out" array shape {out.shape} does not match the "{shape}" '
+            f"shape of the interleaved phase planes!"
+        )
+
+    for phase, (y, x) in zip(phases, offsets):
+        out[..., y::2, x::2] = phase
+
+    return out
@@ -5,12 +5,17 @@ from __future__ import annotations
 import os
 
 import numpy as np
+import pytest
 from colour import read_image
 from colour.constants import TOLERANCE_ABSOLUTE_TESTS
-from colour.utilities import tstack
+from colour.utilities import caching_enable, tstack
 
 from colour_demosaicing import ROOT_RESOURCES_TESTS
-from colour_demosaicing.bayer import masks_CFA_Bayer
+from colour_demosaicing.bayer import (
+    CACHE_MASKS_CFA_BAYER,
+    CacheLRU,
+    masks_CFA_Bayer,
+)
 
 __author__ = "Colour Developers"
 __copyright__ = "Copyright 2015 Colour Developers"
@@ -22,6 +27,7 @@ __status__ = "Production"
 __all__ = [
     "ROOT_RESOURCES_BAYER",
     "TestMasks_CFA_Bayer",
+    "TestCacheLRU",
 ]
 
 ROOT_RESOURCES_BAYER: str = os.path.join(
@@ -48,3 +54,69 @@ class TestMasks_CFA_Bayer:
                 read_image(str(mask)),
                 atol=TOLERANCE_ABSOLUTE_TESTS,
             )
+
+    def test_masks_CFA_Bayer_cache(self):
+        """
+        Test :func:`colour_demosaicing.bayer.masks.masks_CFA_Bayer` definition
+        caching.
+        """
+
+        CACHE_MASKS_CFA_BAYER.clear()
+
+        masks = masks_CFA_Bayer((8, 8), "GRBG")
+        for mask in masks:
+            assert not mask.flags.writeable
+
+        assert all(a is b for a, b in zip(masks, masks_CFA_Bayer((8, 8), "grbg")))
+        assert CACHE_MASKS_CFA_BAYER.info()["hits"] == 1
+        assert CACHE_MASKS_CFA_BAYER.info()["size"] == 3 * 8 * 8
+
+        with caching_enable(False):
+            masks_u = masks_CFA_Bayer((8, 8), "GRBG")
+            assert all(a is not b for a, b in zip(masks, masks_u))
+            for mask in masks_u:
+                assert mask.flags.writeable
+
+        size_limit = CACHE_MASKS_CFA_BAYER.size_limit
+        try:
+            CACHE_MASKS_CFA_BAYER.size_limit = 3 * 8 * 8 - 1
+            CACHE_MASKS_CFA_BAYER.clear()
+            for mask in masks_CFA_Bayer((8, 8), "GRBG"):
+                assert mask.flags.writeable
+
+            assert len(CACHE_MASKS_CFA_BAYER) == 0
+        finally:
+            CACHE_MASKS_CFA_BAYER.size_limit = size_limit
+
+        CACHE_MASKS_CFA_BAYER.clear()
+        assert len(CACHE_MASKS_CFA_BAYER) == 0
+
+
+class TestCacheLRU:
+    """
+    Define :class:`colour_demosaicing.bayer.masks.CacheLRU` class unit tests
+    methods.
+    """
+
+    def test_eviction(self):
+        """Test :class:`colour_demosaicing.bayer.masks.CacheLRU` eviction."""
+
+        cache = CacheLRU(96)
+        for key in "abc":
+            cache.put(key, (np.zeros(32, dtype="bool"),))
+
+        assert cache.get("a") is not None
+        cache.put("d", (np.zeros(32, dtype="bool"),))
+        assert "b" not in cache
+        assert all(key in cache for key in "acd")
+        assert cache.size == 96
+
+        cache.put("e", (np.zeros(128, dtype="bool"),))
+        assert "e" not in cache
+
+        cache.size_limit = 32
+        assert len(cache) == 1
+        assert "d" in cache
+
+        with pytest.raises(ValueError):
+            cache.size_limit = -1
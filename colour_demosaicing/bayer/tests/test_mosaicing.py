@@ -52,3 +52,38 @@ class TestMosaicing_CFA_Bayer:
                 read_image(str(CFA))[..., 0],
                 atol=TOLERANCE_ABSOLUTE_TESTS,
             )
+
+    def test_dtype_mosaicing_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.mosaicing.mosaicing_CFA_Bayer`
+        definition *dtype* argument.
+        """
+
+        RGB = np.reshape(np.linspace(0, 1, 48), (4, 4, 3))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            CFA = mosaicing_CFA_Bayer(RGB, pattern, dtype=np.float32)
+
+            assert CFA.dtype == np.float32
+
+            np.testing.assert_array_equal(
+                CFA, mosaicing_CFA_Bayer(RGB, pattern).astype(np.float32)
+            )
+
+    def test_batch_mosaicing_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.mosaicing.mosaicing_CFA_Bayer`
+        definition with batch dimensions.
+        """
+
+        RGB = np.reshape(np.linspace(0, 1, 2 * 5 * 4 * 3), (2, 5, 4, 3))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            CFA = mosaicing_CFA_Bayer(RGB, pattern)
+
+            assert CFA.shape == (2, 5, 4)
+
+            for i in range(2):
+                np.testing.assert_array_equal(
+                    CFA[i], mosaicing_CFA_Bayer(RGB[i], pattern)
+                )
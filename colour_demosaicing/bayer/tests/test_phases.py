@@ -0,0 +1,137 @@
+"""Define the unit tests for the :mod:`colour_demosaicing.bayer.phases` module."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from colour_demosaicing.bayer import (
+    interleave_phases_CFA_Bayer,
+    masks_CFA_Bayer,
+    offsets_CFA_Bayer,
+    phases_CFA_Bayer,
+    shift_pattern_CFA_Bayer,
+)
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestOffsets_CFA_Bayer",
+    "TestShift_pattern_CFA_Bayer",
+    "TestPhases_CFA_Bayer",
+    "TestInterleave_phases_CFA_Bayer",
+]
+
+
+class TestOffsets_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.phases.offsets_CFA_Bayer`
+    definition unit tests methods.
+    """
+
+    def test_offsets_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.phases.offsets_CFA_Bayer`
+        definition.
+        """
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            R_m, G_m, B_m = masks_CFA_Bayer((2, 2), pattern)
+            (R_y, R_x), G_r, G_b, (B_y, B_x) = offsets_CFA_Bayer(pattern)
+
+            assert R_m[R_y, R_x]
+            assert B_m[B_y, B_x]
+            assert G_m[G_r] and G_r[0] == R_y
+            assert G_m[G_b] and G_b[0] == B_y
+
+
+class TestShift_pattern_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.phases.shift_pattern_CFA_Bayer`
+    definition unit tests methods.
+    """
+
+    def test_shift_pattern_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.phases.shift_pattern_CFA_Bayer`
+        definition.
+        """
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            R_m, G_m, B_m = masks_CFA_Bayer((6, 6), pattern)
+            for y in range(4):
+                for x in range(4):
+                    R_s, G_s, B_s = masks_CFA_Bayer(
+                        (2, 2), shift_pattern_CFA_Bayer(pattern, y, x)
+                    )
+
+                    np.testing.assert_array_equal(R_s, R_m[y : y + 2, x : x + 2])
+                    np.testing.assert_array_equal(G_s, G_m[y : y + 2, x : x + 2])
+                    np.testing.assert_array_equal(B_s, B_m[y : y + 2, x : x + 2])
+
+
+class TestPhases_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.phases.phases_CFA_Bayer`
+    definition unit tests methods.
+    """
+
+    def test_phases_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.phases.phases_CFA_Bayer`
+        definition.
+        """
+
+        CFA = np.random.default_rng(4).random((2, 7, 9))
+
+        for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+            R_m, G_m, B_m = masks_CFA_Bayer(CFA.shape[-2:], pattern)
+            R, G_r, G_b, B = phases_CFA_Bayer(CFA, pattern)
+
+            for phase in (R, G_r, G_b, B):
+                assert np.shares_memory(phase, CFA)
+
+            np.testing.assert_array_equal(
+                np.sort(R.ravel()), np.sort(CFA[:, R_m].ravel())
+            )
+            np.testing.assert_array_equal(
+                np.sort(B.ravel()), np.sort(CFA[:, B_m].ravel())
+            )
+            np.testing.assert_array_equal(
+                np.sort(np.hstack([G_r.ravel(), G_b.ravel()])),
+                np.sort(CFA[:, G_m].ravel()),
+            )
+
+
+class TestInterleave_phases_CFA_Bayer:
+    """
+    Define :func:`colour_demosaicing.bayer.phases.interleave_phases_CFA_Bayer`
+    definition unit tests methods.
+    """
+
+    def test_interleave_phases_CFA_Bayer(self):
+        """
+        Test :func:`colour_demosaicing.bayer.phases.interleave_phases_CFA_Bayer`
+        definition.
+        """
+
+        for shape in ((8, 8), (7, 9), (3, 6, 5)):
+            CFA = np.random.default_rng(4).random(shape)
+            for pattern in ("RGGB", "BGGR", "GRBG", "GBRG"):
+                phases = phases_CFA_Bayer(CFA, pattern)
+
+                np.testing.assert_array_equal(
+                    interleave_phases_CFA_Bayer(*phases, pattern=pattern), CFA
+                )
+
+                out = np.zeros(shape)
+                interleave_phases_CFA_Bayer(*phases, pattern=pattern, out=out)
+                np.testing.assert_array_equal(out, CFA)
+
+        with pytest.raises(ValueError):
+            interleave_phases_CFA_Bayer(*phases, out=np.zeros((4, 4)))
@@ -0,0 +1,92 @@
+"""Define the unit tests for the :mod:`colour_demosaicing` package."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import colour_demosaicing
+
+__author__ = "Colour Developers"
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "TestImport",
+]
+
+
+def _import_time(statement: str) -> dict:
+    """
+    Execute given statement in a new interpreter with ``-X importtime`` and
+    return the cumulative import time in microseconds of the imported modules.
+    """
+
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [
+            os.path.dirname(os.path.dirname(colour_demosaicing.__file__)),
+            environment.get("PYTHONPATH", ""),
+        ]
+    )
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True,
+    )
+
+    import_times = {}
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _self, cumulative, module = line.split(":", 1)[1].split("|")
+        import_times[module.strip()] = int(cumulative)
+
+    return import_times
+
+
+class TestImport:
+    """Define :mod:`colour_demosaicing` package import unit tests methods."""
+
+    def test_import(self):
+        """Test :mod:`colour_demosaicing` package import time."""
+
+        import_times = _import_time("import colour_demosaicing")
+
+        assert "colour_demosaicing" in import_times
+        for module in ("colour", "numpy", "subprocess"):
+            assert module not in import_times
+
+        # Generous bound, the package imports in a few milliseconds while
+        # importing "colour" takes hundreds of milliseconds.
+        assert import_times["colour_demosaicing"] < 100000
+
+    def test_lazy_attributes(self):
+        """Test :mod:`colour_demosaicing` package lazy attributes."""
+
+        import_times = _import_time(
+            "import colour_demosaicing.bayer.demosaicing; "
+            "import colour_demosaicing.bayer"
+        )
+
+        assert "colour" not in import_times
+
+        menon2007 = colour_demosaicing.bayer.demosaicing.menon2007
+        assert (
+            colour_demosaicing.demosaicing_CFA_Bayer_Menon2007
+            is menon2007.demosaicing_CFA_Bayer_Menon2007
+        )
+        assert set(colour_demosaicing.__all__) <= set(dir(colour_demosaicing))
+        assert set(colour_demosaicing.bayer.__all__) <= set(
+            dir(colour_demosaicing.bayer)
+        )
+        for name in colour_demosaicing.bayer.__all__:
+            assert getattr(colour_demosaicing.bayer, name) is not None
@@ -308,8 +308,8 @@ def requirements(ctx: Context):
 
     message_box('Exporting "docs/requirements.txt" file...')
     ctx.run(
-        'uv export --no-hashes --all-extras --no-dev | grep -v "-e \\." > '
-        "docs/requirements.txt"
+        'uv export --no-hashes --extra docs --extra optional --no-dev | '
+        'grep -v "-e \\." > docs/requirements.txt'
     )
 
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Demosaicing Backends Benchmark Utility
+======================================
+
+Benchmark the *Bayer* CFA demosaicing definitions with the compute backends,
+the first call of each backend, e.g., the *JIT* compilation of the *Numba*
+backend, being excluded.
+
+Usage::
+
+    python benchmark_backends.py --shape 4000 6000
+    python benchmark_backends.py --shape 4000 6000 --dtype float32
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from colour_demosaicing.bayer import DEMOSAICING_CFA_BAYER_METHODS
+
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "benchmark_backends",
+]
+
+
+def benchmark_backends(
+    shape: tuple[int, int] = (4000, 6000),
+    backends: tuple[str, ...] = ("SciPy", "Numba", "PyTorch"),
+    methods: tuple[str, ...] = ("Bilinear", "Malvar 2004", "Menon 2007"),
+    dtype: str = "float64",
+    repeats: int = 3,
+):
+    """
+    Print the best time and the speedup over the first backend of the *Bayer*
+    CFA demosaicing definitions for given compute backends.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA.
+    backends
+        Compute backends to benchmark.
+    methods
+        Demosaicing methods to benchmark.
+    dtype
+        Floating point data type the computations are performed with.
+    repeats
+        Number of repeats, the best time is retained.
+    """
+
+    CFA = np.random.default_rng(4).random(shape).astype(dtype)
+    RGB = np.empty([*shape, 3], dtype)
+
+    print(  # noqa: T201
+        f"CFA: {shape[0]}x{shape[1]}, dtype: {dtype}, CPUs: {os.cpu_count()}"
+    )
+    for method in methods:
+        function = DEMOSAICING_CFA_BAYER_METHODS[method]
+
+        reference = None
+        for backend in backends:
+            function(CFA[:8, :8], dtype=CFA.dtype, backend=backend)
+
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                function(CFA, dtype=CFA.dtype, out=RGB, backend=backend)
+                timings.append(time.perf_counter() - start)
+
+            timing = min(timings)
+            reference = timing if reference is None else reference
+
+            print(  # noqa: T201
+                f"{method:<12} backend={backend:<6} {timing:8.3f}s "
+                f"speedup={reference / timing:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", nargs=2, type=int, default=[4000, 6000])
+    parser.add_argument("--backends", nargs="+", default=["SciPy", "Numba", "PyTorch"])
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        default=["Bilinear", "Malvar 2004", "Menon 2007"],
+    )
+    parser.add_argument("--dtype", default="float64")
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    benchmark_backends(
+        tuple(arguments.shape),
+        tuple(arguments.backends),
+        tuple(arguments.methods),
+        arguments.dtype,
+        arguments.repeats,
+    )
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Demosaicing Overhead Benchmark Utility
+======================================
+
+Benchmark the per-call overhead of the *Bayer* CFA demosaicing definitions on
+small inputs, e.g., the tiles demosaiced at very high call rates.
+
+The overhead is the time per call on the small *Bayer* CFA minus the time its
+pixels take when demosaicing a large *Bayer* CFA.
+
+Usage::
+
+    python benchmark_overhead.py --shape 64 64
+    python benchmark_overhead.py --shape 64 64 --workspace
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from colour_demosaicing.bayer import DEMOSAICING_CFA_BAYER_METHODS, Workspace
+
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "benchmark_overhead",
+]
+
+
+def _time_per_call(
+    function, CFA: np.ndarray, number: int, repeats: int, workspace: bool
+) -> float:
+    """
+    Return the best time per call of given demosaicing definition on given
+    *Bayer* CFA.
+    """
+
+    kwargs = (
+        {"out": np.empty([*CFA.shape, 3]), "workspace": Workspace()}
+        if workspace
+        else {}
+    )
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            function(CFA, **kwargs)
+        timings.append((time.perf_counter() - start) / number)
+
+    return min(timings)
+
+
+def benchmark_overhead(
+    shape: tuple[int, int] = (64, 64),
+    shape_reference: tuple[int, int] = (1024, 1024),
+    methods: tuple[str, ...] = ("Bilinear", "Malvar 2004", "Menon 2007"),
+    number: int = 200,
+    repeats: int = 5,
+    workspace: bool = False,
+):
+    """
+    Print the time per call and the per-call overhead of the *Bayer* CFA
+    demosaicing definitions on given small *Bayer* CFA shape.
+
+    Parameters
+    ----------
+    shape
+        Shape of the small *Bayer* CFA.
+    shape_reference
+        Shape of the large *Bayer* CFA the time per pixel is measured on.
+    methods
+        Demosaicing methods to benchmark.
+    number
+        Number of calls per repeat on the small *Bayer* CFA.
+    repeats
+        Number of repeats, the best time is retained.
+    workspace
+        Whether to pass a workspace and an output array, i.e., to benchmark
+        the calls without large allocations.
+    """
+
+    generator = np.random.default_rng(4)
+    CFA = generator.random(shape)
+    CFA_reference = generator.random(shape_reference)
+
+    print(  # noqa: T201
+        f"CFA: {shape[0]}x{shape[1]}, "
+        f"reference: {shape_reference[0]}x{shape_reference[1]}, "
+        f"workspace={workspace}"
+    )
+    for method in methods:
+        function = DEMOSAICING_CFA_BAYER_METHODS[method]
+
+        timing = _time_per_call(function, CFA, number, repeats, workspace)
+        timing_pixel = _time_per_call(
+            function, CFA_reference, 1, repeats, workspace
+        ) / np.prod(shape_reference)
+        overhead = timing - timing_pixel * np.prod(shape)
+
+        print(  # noqa: T201
+            f"{method:<12} {timing * 1e6:9.1f}us/call "
+            f"overhead={overhead * 1e6:9.1f}us ({overhead / timing:6.1%})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", nargs=2, type=int, default=[64, 64])
+    parser.add_argument("--shape-reference", nargs=2, type=int, default=[1024, 1024])
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        default=["Bilinear", "Malvar 2004", "Menon 2007"],
+    )
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--workspace", action="store_true")
+    arguments = parser.parse_args()
+
+    benchmark_overhead(
+        tuple(arguments.shape),
+        tuple(arguments.shape_reference),
+        tuple(arguments.methods),
+        arguments.number,
+        arguments.repeats,
+        arguments.workspace,
+    )
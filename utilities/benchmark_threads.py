@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Demosaicing Threads Benchmark Utility
+=====================================
+
+Benchmark the *PyTorch* backend of the *Bayer* CFA demosaicing definitions
+with given numbers of *PyTorch* intra-op threads against the *SciPy* backend
+with the same numbers of workers, optionally on batches of frames as fed by
+the data loaders.
+
+Usage::
+
+    python benchmark_threads.py --shape 2000 3000 --threads 1 2 4 8 16
+    python benchmark_threads.py --shape 512 512 --frames 32 --dtype float32
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+import torch
+
+from colour_demosaicing.bayer import DEMOSAICING_CFA_BAYER_METHODS
+
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "benchmark_threads",
+]
+
+
+def benchmark_threads(
+    shape: tuple[int, int] = (4000, 6000),
+    threads: tuple[int, ...] = (1, 2, 4, 8),
+    methods: tuple[str, ...] = ("Bilinear", "Malvar 2004", "Menon 2007"),
+    frames: int = 0,
+    dtype: str = "float64",
+    repeats: int = 3,
+):
+    """
+    Print the best time of the *SciPy* and *PyTorch* backends of the *Bayer*
+    CFA demosaicing definitions for given numbers of threads, the speedup of
+    the *PyTorch* backend over the *SciPy* backend and over its single thread
+    time.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA.
+    threads
+        Numbers of *PyTorch* intra-op threads and of *SciPy* workers to
+        benchmark.
+    methods
+        Demosaicing methods to benchmark.
+    frames
+        Number of frames of the batch of *Bayer* CFAs, a single *Bayer* CFA
+        is demosaiced if 0.
+    dtype
+        Floating point data type the computations are performed with.
+    repeats
+        Number of repeats, the best time is retained.
+    """
+
+    shape_b = (frames, *shape) if frames else shape
+    CFA = np.random.default_rng(4).random(shape_b).astype(dtype)
+    CFA_t = torch.from_numpy(CFA)
+    RGB = np.empty([*shape_b, 3], dtype)
+    RGB_t = torch.from_numpy(RGB)
+
+    print(  # noqa: T201
+        f"CFA: {'x'.join(map(str, shape_b))}, dtype: {dtype}, CPUs: {os.cpu_count()}"
+    )
+    for method in methods:
+        function = DEMOSAICING_CFA_BAYER_METHODS[method]
+        function(CFA_t[..., :8, :8], dtype=CFA.dtype, backend="PyTorch")
+
+        reference = None
+        for count in threads:
+            torch.set_num_threads(count)
+
+            timings = {}
+            for backend, arguments in (
+                ("SciPy", {"CFA": CFA, "out": RGB, "workers": count}),
+                ("PyTorch", {"CFA": CFA_t, "out": RGB_t}),
+            ):
+                timings[backend] = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    function(dtype=CFA.dtype, backend=backend, **arguments)
+                    timings[backend].append(time.perf_counter() - start)
+
+            timing_s, timing_t = min(timings["SciPy"]), min(timings["PyTorch"])
+            reference = timing_t if reference is None else reference
+
+            print(  # noqa: T201
+                f"{method:<12} threads={count:<3} SciPy={timing_s:8.3f}s "
+                f"PyTorch={timing_t:8.3f}s speedup={timing_s / timing_t:5.2f}x "
+                f"scaling={reference / timing_t:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", nargs=2, type=int, default=[4000, 6000])
+    parser.add_argument("--threads", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        default=["Bilinear", "Malvar 2004", "Menon 2007"],
+    )
+    parser.add_argument("--frames", type=int, default=0)
+    parser.add_argument("--dtype", default="float64")
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    benchmark_threads(
+        tuple(arguments.shape),
+        tuple(arguments.threads),
+        tuple(arguments.methods),
+        arguments.frames,
+        arguments.dtype,
+        arguments.repeats,
+    )
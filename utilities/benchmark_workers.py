@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Demosaicing Workers Benchmark Utility
+=====================================
+
+Benchmark the scaling of the *Bayer* CFA demosaicing definitions with the
+number of threads demosaicing the tiles, or the latency gain of evaluating
+the independent filter branches concurrently.
+
+Usage::
+
+    python benchmark_workers.py --shape 8000 12000 --workers 1 2 4 8 16 32
+    python benchmark_workers.py --shape 1000 1500 --workers 1 --concurrent
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from colour_demosaicing.bayer import DEMOSAICING_CFA_BAYER_METHODS
+
+__copyright__ = "Copyright 2015 Colour Developers"
+__license__ = "BSD-3-Clause - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "Colour Developers"
+__email__ = "colour-developers@colour-science.org"
+__status__ = "Production"
+
+__all__ = [
+    "benchmark_workers",
+]
+
+
+def benchmark_workers(
+    shape: tuple[int, int] = (4000, 6000),
+    workers: tuple[int, ...] = (1, 2, 4, 8),
+    methods: tuple[str, ...] = ("Bilinear", "Malvar 2004", "Menon 2007"),
+    repeats: int = 3,
+    concurrent: bool = False,
+):
+    """
+    Print the best time and the speedup of the *Bayer* CFA demosaicing
+    definitions for given numbers of workers.
+
+    Parameters
+    ----------
+    shape
+        Shape of the *Bayer* CFA.
+    workers
+        Numbers of workers to benchmark.
+    methods
+        Demosaicing methods to benchmark.
+    repeats
+        Number of repeats, the best time is retained.
+    concurrent
+        Whether to also benchmark the concurrent evaluation of the independent
+        filter branches.
+    """
+
+    CFA = np.random.default_rng(4).random(shape)
+    RGB = np.empty([*shape, 3])
+
+    print(f"CFA: {shape[0]}x{shape[1]}, CPUs: {os.cpu_count()}")  # noqa: T201
+    for method in methods:
+        function = DEMOSAICING_CFA_BAYER_METHODS[method]
+
+        reference = None
+        for count in workers:
+            for concurrent_branches in (False, True) if concurrent else (False,):
+                timings = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    function(
+                        CFA, out=RGB, workers=count, concurrent=concurrent_branches
+                    )
+                    timings.append(time.perf_counter() - start)
+
+                timing = min(timings)
+                reference = timing if reference is None else reference
+
+                print(  # noqa: T201
+                    f"{method:<12} workers={count:<3} "
+                    f"concurrent={concurrent_branches!s:<5} {timing:8.3f}s "
+                    f"speedup={reference / timing:5.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", nargs=2, type=int, default=[4000, 6000])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        default=["Bilinear", "Malvar 2004", "Menon 2007"],
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--concurrent", action="store_true")
+    arguments = parser.parse_args()
+
+    benchmark_workers(
+        tuple(arguments.shape),
+        tuple(arguments.workers),
+        tuple(arguments.methods),
+        arguments.repeats,
+        arguments.concurrent,
+    )